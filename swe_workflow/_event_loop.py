@@ -0,0 +1,34 @@
+"""Run the CLI's coroutines, on uvloop when it is installed.
+
+Only the standard library is imported at module level; uvloop is imported when
+a coroutine is actually run, so commands that never start an event loop do not
+pay for it.
+"""
+
+import asyncio
+import sys
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop constructor, or None for the default asyncio loop.
+
+    uvloop is an optional extra (``pip install swe-workflow[uvloop]``); it is
+    never used on Windows.
+    """
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def run_coroutine(main: Coroutine[Any, Any, _T]) -> _T:
+    """Run ``main`` like `asyncio.run`, on a uvloop loop when uvloop is installed."""
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        return runner.run(main)
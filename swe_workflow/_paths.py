@@ -0,0 +1,17 @@
+"""Per-user filesystem locations shared by the CLI entry point and runtime modules.
+
+Only the standard library is imported here, so `swe_workflow.main` can use it
+before anything heavy is loaded.
+"""
+
+import os
+from pathlib import Path
+
+
+def user_cache_dir() -> Path:
+    """Return the swe-workflow cache directory, ``$XDG_CACHE_HOME/swe-workflow``.
+
+    Falls back to ``~/.cache/swe-workflow`` when ``XDG_CACHE_HOME`` is unset or
+    empty. The directory is not created.
+    """
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache", "swe-workflow")
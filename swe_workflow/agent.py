@@ -1,35 +1,47 @@
 """Agent management and creation for the CLI."""
 
+from __future__ import annotations
+
+import functools
 import os
 import shutil
+from collections import ChainMap
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from deepagents import create_deep_agent
-from deepagents.backends import CompositeBackend
-from deepagents.backends.filesystem import FilesystemBackend
-from deepagents.middleware import MemoryMiddleware, SkillsMiddleware
-from langchain.agents.middleware import (
-    InterruptOnConfig,
-)
-from langchain.agents.middleware.types import AgentState
-from langchain.messages import ToolCall
-from langchain.tools import BaseTool
-from langchain_core.language_models import BaseChatModel
-from langgraph.checkpoint.base import BaseCheckpointSaver
-from langgraph.checkpoint.memory import InMemorySaver
-from langgraph.pregel import Pregel
-from langgraph.runtime import Runtime
+from rich.markup import escape
 
 from .config import COLORS, config, console, get_default_coding_instructions, settings
-from .local_context import LocalContextMiddleware
-from .shell import ShellMiddleware
+
+if TYPE_CHECKING:
+    from deepagents.backends import CompositeBackend
+    from langchain.agents.middleware import InterruptOnConfig
+    from langchain.agents.middleware.types import AgentState
+    from langchain.messages import ToolCall
+    from langchain.tools import BaseTool
+    from langchain_core.language_models import BaseChatModel
+    from langgraph.checkpoint.base import BaseCheckpointSaver
+    from langgraph.pregel import Pregel
+    from langgraph.runtime import Runtime
+
+# AGENTS.md paths already confirmed to exist during this process
+_known_agent_mds: set[str] = set()
+
+# Divider framing subagent instructions in task approval prompts
+_DIVIDER = "─" * 40
 
 
 def list_agents() -> None:
     """List all available agents."""
     agents_dir = settings.user_agent_dir
 
-    if not agents_dir.exists() or not any(agents_dir.iterdir()):
+    try:
+        with os.scandir(agents_dir) as it:
+            entries = list(it)
+    except FileNotFoundError:
+        entries = []
+
+    if not entries:
         console.print("[yellow]No agents found.[/yellow]")
         console.print(
             "[dim]Agents will be created in ~/.swe-workflow/ when you first use them.[/dim]",
@@ -37,23 +49,24 @@ def list_agents() -> None:
         )
         return
 
-    console.print("\n[bold]Available Agents:[/bold]\n", style=COLORS["primary"])
+    c_primary, c_dim, c_tool = COLORS["primary"], COLORS["dim"], COLORS["tool"]
+    # Render the whole listing as one markup string so Rich parses and prints once
+    lines = [f"\n[{c_primary}][bold]Available Agents:[/bold][/]\n"]
 
-    for agent_path in sorted(agents_dir.iterdir()):
-        if agent_path.is_dir():
-            agent_name = agent_path.name
-            agent_md = agent_path / "AGENTS.md"
+    # DirEntry.is_dir() reuses the d_type from the directory listing
+    agent_entries = sorted((entry for entry in entries if entry.is_dir()), key=lambda entry: entry.name)
+    for entry in agent_entries:
+        agent_name = escape(entry.name)
+        agent_path = entry.path
 
-            if agent_md.exists():
-                console.print(f"  • [bold]{agent_name}[/bold]", style=COLORS["primary"])
-                console.print(f"    {agent_path}", style=COLORS["dim"])
-            else:
-                console.print(
-                    f"  • [bold]{agent_name}[/bold] [dim](incomplete)[/dim]", style=COLORS["tool"]
-                )
-                console.print(f"    {agent_path}", style=COLORS["dim"])
+        if os.path.exists(os.path.join(agent_path, "AGENTS.md")):
+            lines.append(f"[{c_primary}]  • [bold]{agent_name}[/bold][/]")
+        else:
+            lines.append(f"[{c_tool}]  • [bold]{agent_name}[/bold] [dim](incomplete)[/dim][/]")
+        lines.append(f"[{c_dim}]    {escape(agent_path)}[/]")
 
-    console.print()
+    lines.append("")
+    console.print("\n".join(lines))
 
 
 def reset_agent(agent_name: str, source_agent: str | None = None) -> None:
@@ -90,18 +103,25 @@ def reset_agent(agent_name: str, source_agent: str | None = None) -> None:
     console.print(f"Location: {agent_dir}\n", style=COLORS["dim"])
 
 
-def get_system_prompt(assistant_id: str) -> str:
+def get_system_prompt(assistant_id: str, cwd: str | None = None) -> str:
     """Get the base system prompt for the agent.
 
     Args:
         assistant_id: The agent identifier for path references
+        cwd: Working directory to reference in the prompt. Defaults to the
+            process working directory.
 
     Returns:
         The system prompt string (without AGENTS.md content)
     """
+    return _build_system_prompt(assistant_id, cwd if cwd is not None else os.getcwd())
+
+
+@functools.lru_cache(maxsize=32)
+def _build_system_prompt(assistant_id: str, cwd: str) -> str:
+    """Render the system prompt for an (assistant_id, cwd) pair."""
     agent_dir_path = f"~/.swe-workflow/{assistant_id}"
-    cwd = Path.cwd()
-    
+
     working_dir_section = f"""### Current Working Directory
 
 The filesystem backend is currently operating in: `{cwd}`
@@ -159,8 +179,9 @@ def _format_write_file_description(
     file_path = args.get("file_path", "unknown")
     content = args.get("content", "")
 
-    action = "Overwrite" if Path(file_path).exists() else "Create"
-    line_count = len(content.splitlines())
+    action = "Overwrite" if os.path.lexists(file_path) else "Create"
+    # Count newlines in C rather than materializing every line as a string
+    line_count = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
 
     return f"File: {file_path}\nAction: {action} file\nLines: {line_count}"
 
@@ -203,25 +224,25 @@ def _format_task_description(tool_call: ToolCall, _state: AgentState, _runtime:
     subagent_type = args.get("subagent_type", "unknown")
 
     # Truncate description if too long for display
-    description_preview = description
-    if len(description) > 500:
-        description_preview = description[:500] + "..."
+    description_preview = description if len(description) <= 500 else f"{description[:500]}..."
 
     return (
-        f"Subagent Type: {subagent_type}\n\n"
-        f"Task Instructions:\n"
-        f"{'─' * 40}\n"
-        f"{description_preview}\n"
-        f"{'─' * 40}\n\n"
-        f"⚠️  Subagent will have access to file operations and shell commands"
+        f"Subagent Type: {subagent_type}\n\nTask Instructions:\n{_DIVIDER}\n{description_preview}\n{_DIVIDER}\n\n"
+        "⚠️  Subagent will have access to file operations and shell commands"
     )
 
 
-def _format_shell_description(tool_call: ToolCall, _state: AgentState, _runtime: Runtime) -> str:
-    """Format shell tool call for approval prompt."""
+def _format_shell_description(
+    tool_call: ToolCall, _state: AgentState, _runtime: Runtime, *, cwd: str | None = None
+) -> str:
+    """Format shell tool call for approval prompt.
+
+    ``create_cli_agent`` binds ``cwd`` once per agent so approval prompts do not
+    query the working directory on every call.
+    """
     args = tool_call["args"]
     command = args.get("command", "N/A")
-    return f"Shell Command: {command}\nWorking Directory: {Path.cwd()}"
+    return f"Shell Command: {command}\nWorking Directory: {cwd if cwd is not None else os.getcwd()}"
 
 
 def _format_execute_description(tool_call: ToolCall, _state: AgentState, _runtime: Runtime) -> str:
@@ -231,46 +252,16 @@ def _format_execute_description(tool_call: ToolCall, _state: AgentState, _runtim
     return f"Execute Command: {command}\nLocation: Local System"
 
 
-def _add_interrupt_on() -> dict[str, InterruptOnConfig]:
-    """Configure human-in-the-loop interrupt_on settings for destructive tools."""
-    shell_interrupt_config: InterruptOnConfig = {
-        "allowed_decisions": ["approve", "reject"],
-        "description": _format_shell_description,
-    }
-
-    execute_interrupt_config: InterruptOnConfig = {
-        "allowed_decisions": ["approve", "reject"],
-        "description": _format_execute_description,
-    }
-
-    write_file_interrupt_config: InterruptOnConfig = {
-        "allowed_decisions": ["approve", "reject"],
-        "description": _format_write_file_description,
-    }
-
-    edit_file_interrupt_config: InterruptOnConfig = {
-        "allowed_decisions": ["approve", "reject"],
-        "description": _format_edit_file_description,
-    }
-
-
-    fetch_url_interrupt_config: InterruptOnConfig = {
-        "allowed_decisions": ["approve", "reject"],
-        "description": _format_fetch_url_description,
-    }
-
-    task_interrupt_config: InterruptOnConfig = {
-        "allowed_decisions": ["approve", "reject"],
-        "description": _format_task_description,
-    }
-    return {
-        "shell": shell_interrupt_config,
-        "execute": execute_interrupt_config,
-        "write_file": write_file_interrupt_config,
-        "edit_file": edit_file_interrupt_config,
-        "fetch_url": fetch_url_interrupt_config,
-        "task": task_interrupt_config,
-    }
+# Human-in-the-loop interrupt_on settings for destructive tools. The shell
+# entry is rebound per agent in create_cli_agent so it can report the cwd.
+_INTERRUPT_ON_DEFAULTS: dict[str, InterruptOnConfig] = {
+    "shell": {"allowed_decisions": ["approve", "reject"], "description": _format_shell_description},
+    "execute": {"allowed_decisions": ["approve", "reject"], "description": _format_execute_description},
+    "write_file": {"allowed_decisions": ["approve", "reject"], "description": _format_write_file_description},
+    "edit_file": {"allowed_decisions": ["approve", "reject"], "description": _format_edit_file_description},
+    "fetch_url": {"allowed_decisions": ["approve", "reject"], "description": _format_fetch_url_description},
+    "task": {"allowed_decisions": ["approve", "reject"], "description": _format_task_description},
+}
 
 
 def create_cli_agent(
@@ -309,15 +300,30 @@ def create_cli_agent(
         - agent_graph: Configured LangGraph Pregel instance ready for execution
         - composite_backend: CompositeBackend for file operations
     """
+    # Heavy dependencies are imported here so that lightweight commands
+    # (list, reset, help) do not pay for the LangChain/LangGraph stack.
+    from deepagents import create_deep_agent
+    from deepagents.backends import CompositeBackend
+    from deepagents.backends.filesystem import FilesystemBackend
+    from deepagents.middleware import MemoryMiddleware, SkillsMiddleware
+    from langgraph.checkpoint.memory import InMemorySaver
+
+    from .local_context import LocalContextMiddleware
+    from .shell import ShellMiddleware
+
     tools = tools or []
+    cwd = os.getcwd()
 
     # Setup agent directory for persistent memory (if enabled)
     if enable_memory or enable_skills:
         agent_dir = settings.ensure_agent_dir(assistant_id)
-        agent_md = agent_dir / "AGENTS.md"
-        if not agent_md.exists():
-            source_content = get_default_coding_instructions()
-            agent_md.write_text(source_content)
+        agent_md = os.fspath(agent_dir / "AGENTS.md")
+        if agent_md not in _known_agent_mds:
+            try:
+                os.stat(agent_md)
+            except FileNotFoundError:
+                Path(agent_md).write_text(get_default_coding_instructions())
+            _known_agent_mds.add(agent_md)
 
     # Skills directories (if enabled)
     skills_dir = None
@@ -326,6 +332,9 @@ def create_cli_agent(
         skills_dir = settings.ensure_user_skills_dir(assistant_id)
         project_skills_dir = settings.get_project_skills_dir()
 
+    # One filesystem backend shared by memory, skills and the composite backend
+    backend = FilesystemBackend()  # Current working directory
+
     # Build middleware stack based on enabled features
     agent_middleware = []
 
@@ -338,7 +347,7 @@ def create_cli_agent(
 
         agent_middleware.append(
             MemoryMiddleware(
-                backend=FilesystemBackend(),
+                backend=backend,
                 sources=memory_sources,
             )
         )
@@ -351,14 +360,12 @@ def create_cli_agent(
 
         agent_middleware.append(
             SkillsMiddleware(
-                backend=FilesystemBackend(),
+                backend=backend,
                 sources=sources,
             )
         )
 
     # ========== LOCAL MODE ==========
-    backend = FilesystemBackend()  # Current working directory
-
     # Local context middleware (git info, directory tree, etc.)
     agent_middleware.append(LocalContextMiddleware())
 
@@ -366,20 +373,21 @@ def create_cli_agent(
     if enable_shell:
         # Create environment for shell commands
         # Restore user's original LANGSMITH_PROJECT so their code traces separately
-        shell_env = os.environ.copy()
+        # Overlay instead of copying os.environ; None lets the subprocess inherit it
+        shell_env = None
         if settings.user_langchain_project:
-            shell_env["LANGSMITH_PROJECT"] = settings.user_langchain_project
+            shell_env = ChainMap({"LANGSMITH_PROJECT": settings.user_langchain_project}, os.environ)
 
         agent_middleware.append(
             ShellMiddleware(
-                workspace_root=str(Path.cwd()),
+                workspace_root=cwd,
                 env=shell_env,
             )
         )
 
     # Get or use custom system prompt
     if system_prompt is None:
-        system_prompt = get_system_prompt(assistant_id=assistant_id)
+        system_prompt = get_system_prompt(assistant_id=assistant_id, cwd=cwd)
 
     # Configure interrupt_on based on auto_approve setting
     if auto_approve:
@@ -387,7 +395,13 @@ def create_cli_agent(
         interrupt_on = {}
     else:
         # Full HITL for destructive operations
-        interrupt_on = _add_interrupt_on()
+        interrupt_on = {
+            **_INTERRUPT_ON_DEFAULTS,
+            "shell": {
+                "allowed_decisions": ["approve", "reject"],
+                "description": functools.partial(_format_shell_description, cwd=cwd),
+            },
+        }
 
     composite_backend = CompositeBackend(
         default=backend,
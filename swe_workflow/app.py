@@ -92,6 +92,8 @@ class TextualTokenTracker:
 class TextualSessionState:
     """Session state for the Textual app."""
 
+    __slots__ = ("auto_approve", "thread_id")
+
     def __init__(
         self,
         *,
@@ -281,17 +283,26 @@ class TUI(App):
                 # Prepare message processing
                 all_messages = list(messages)
 
-                # Create a mapping of tool call IDs to their results
+                # Map tool call IDs to their results; tool messages themselves are
+                # rendered through the AI message that issued the call, so they are
+                # not dispatched on their own
                 tool_results = {}
+                renderable = []
                 for msg in all_messages:
                     if msg.type == "tool" or "tool" in type(msg).__name__.lower():
                         tool_call_id = getattr(msg, "tool_call_id", None)
                         if tool_call_id:
                             tool_results[tool_call_id] = msg
+                    else:
+                        renderable.append(msg)
 
                 # Process all messages and create widgets
-                for msg in all_messages:
-                    await self._process_history_message(msg, tool_results)
+                from .message_handlers import MessageRenderContext, dispatch_message
+                from .widgets import messages as message_widgets
+
+                context = MessageRenderContext(self, message_widgets, tool_results)
+                for msg in renderable:
+                    await dispatch_message(msg, context)
 
                 # Force a refresh of the chat area to ensure all messages are displayed
                 chat_container = self.query_one("#chat", VerticalScroll)
@@ -301,24 +312,11 @@ class TUI(App):
             # If there's an error loading history, just continue without it
             pass
 
-    async def _process_history_message(self, msg, tool_results):
-        """Process a single message and create the appropriate widget."""
-        # Set the tool results for the message handlers to access
-        self._tool_results = tool_results
-
-        # Create and use the message handler chain
-        from .message_handlers import create_message_handler_chain
-
-        handler_chain = create_message_handler_chain()
-
-        # Handle the message using the chain
-        await handler_chain.handle(msg, self)
-
     def _extract_message_content(self, msg: BaseMessage) -> str:
         """Extract content from a message object, handling various formats."""
-        from .message_handlers import ContentExtractor
+        from .message_handlers import extract_content
 
-        return ContentExtractor.extract_content(msg)
+        return extract_content(msg)
 
     def _update_status(self, message: str) -> None:
         """Update the status bar with a message."""
@@ -630,6 +628,22 @@ class TUI(App):
         except NoMatches:
             pass
 
+    async def _mount_messages(self, widgets: list[Widget]) -> None:
+        """Mount several message widgets in one batch, preserving their order.
+
+        Args:
+            widgets: The message widgets to mount
+        """
+        if not widgets:
+            return
+        try:
+            messages = self.query_one("#messages", Container)
+            await messages.mount(*widgets)
+            chat = self.query_one("#chat", VerticalScroll)
+            chat.scroll_end(animate=False)
+        except NoMatches:
+            pass
+
     async def _clear_messages(self) -> None:
         """Clear the messages area."""
         try:
@@ -801,6 +815,6 @@ async def run_textual_app(
 
 
 if __name__ == "__main__":
-    import asyncio
+    from ._event_loop import run_coroutine
 
-    asyncio.run(run_textual_app())
+    run_coroutine(run_textual_app())
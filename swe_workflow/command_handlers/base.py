@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from argparse import Namespace
+    from collections.abc import Callable
 
 
 class CommandHandler(ABC):
@@ -27,22 +28,41 @@ class CommandHandlerRegistry:
 
     def __init__(self):
         self._handlers: dict[str, CommandHandler] = {}
+        # Factories for handlers that have not been instantiated yet
+        self._factories: dict[str, Callable[[], CommandHandler]] = {}
+        # Bound ``execute`` methods keyed by command name, resolved at registration
+        self._dispatch: dict[str, Callable[[Namespace], None]] = {}
 
     def register(self, handler: CommandHandler) -> None:
         """Register a command handler."""
-        self._handlers[handler.command_name] = handler
+        name = handler.command_name
+        self._handlers[name] = handler
+        self._dispatch[name] = handler.execute
+
+    def register_factory(self, command_name: str, factory: Callable[[], CommandHandler]) -> None:
+        """Register a factory that builds the handler on first lookup."""
+        self._factories[command_name] = factory
 
     def get_handler(self, command_name: str) -> CommandHandler | None:
-        """Get a handler for the specified command name."""
-        return self._handlers.get(command_name)
+        """Get a handler for the specified command name, instantiating it if needed."""
+        handler = self._handlers.get(command_name)
+        if handler is None:
+            factory = self._factories.pop(command_name, None)
+            if factory is None:
+                return None
+            handler = factory()
+            self.register(handler)
+        return handler
 
     def execute_command(self, command_name: str, args: Namespace) -> bool:
         """Execute a command by name, returning True if found and executed."""
-        handler = self.get_handler(command_name)
-        if handler:
-            handler.execute(args)
-            return True
-        return False
+        execute = self._dispatch.get(command_name)
+        if execute is None:
+            if self.get_handler(command_name) is None:
+                return False
+            execute = self._dispatch[command_name]
+        execute(args)
+        return True
 
 
 # Global registry instance
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 from argparse import Namespace
+from typing import ClassVar
 
-from swe_workflow.command_handlers.base import CommandHandler
+from swe_workflow.agent import list_agents, reset_agent
+from swe_workflow.command_handlers.base import CommandHandler, registry
+from swe_workflow.config import console
+from swe_workflow.ui import show_help
 
 
 class HelpCommandHandler(CommandHandler):
@@ -16,8 +20,6 @@ class HelpCommandHandler(CommandHandler):
 
     def execute(self, args: Namespace) -> None:
         """Execute the help command."""
-        from swe_workflow.ui import show_help
-
         show_help()
 
 
@@ -30,8 +32,6 @@ class ListCommandHandler(CommandHandler):
 
     def execute(self, args: Namespace) -> None:
         """Execute the list command."""
-        from swe_workflow.agent import list_agents
-
         list_agents()
 
 
@@ -44,9 +44,7 @@ class ResetCommandHandler(CommandHandler):
 
     def execute(self, args: Namespace) -> None:
         """Execute the reset command."""
-        from swe_workflow.agent import reset_agent
-
-        reset_agent(args.agent, getattr(args, "source_agent", None))
+        reset_agent(args.agent, args.source_agent)
 
 
 class SkillsCommandHandler(CommandHandler):
@@ -58,6 +56,7 @@ class SkillsCommandHandler(CommandHandler):
 
     def execute(self, args: Namespace) -> None:
         """Execute the skills command."""
+        # Imported on use: skills pulls in deepagents and LangChain
         from swe_workflow.skills.commands import execute_skills_command
 
         execute_skills_command(args)
@@ -66,12 +65,8 @@ class SkillsCommandHandler(CommandHandler):
 class ThreadsCommandHandler(CommandHandler):
     """Handler for the 'threads' command that delegates to subcommand handlers."""
 
-    def __init__(self):
-        """Initialize with subcommand handlers."""
-        from .registry import registry
-
-        self._list_handler = registry.get_handler("threads_list")
-        self._delete_handler = registry.get_handler("threads_delete")
+    # Maps ``threads`` subcommands to the registry names of their handlers
+    _SUBCOMMANDS: ClassVar[dict[str, str]] = {"list": "threads_list", "delete": "threads_delete"}
 
     @property
     def command_name(self) -> str:
@@ -79,19 +74,10 @@ class ThreadsCommandHandler(CommandHandler):
 
     def execute(self, args: Namespace) -> None:
         """Execute the threads command by delegating to appropriate subcommand handler."""
-        from ..config import console
-
-        threads_command = getattr(args, "threads_command", None)
-
-        if threads_command == "list":
-            if self._list_handler:
-                self._list_handler.execute(args)
-            else:
-                console.print("[yellow]Error: threads list command handler not found[/yellow]")
-        elif threads_command == "delete":
-            if self._delete_handler:
-                self._delete_handler.execute(args)
-            else:
-                console.print("[yellow]Error: threads delete command handler not found[/yellow]")
-        else:
+        threads_command = args.threads_command
+        handler_name = self._SUBCOMMANDS.get(threads_command)
+
+        if handler_name is None:
             console.print("[yellow]Usage: swe-workflow threads <list|delete>[/yellow]")
+        elif not registry.execute_command(handler_name, args):
+            console.print(f"[yellow]Error: threads {threads_command} command handler not found[/yellow]")
@@ -20,22 +20,29 @@ from .threads_commands import (
 
 
 def initialize_registry():
-    """Initialize the registry with all available command handlers."""
-    handlers = [
-        SkillsListCommandHandler(),
-        SkillsCreateCommandHandler(),
-        SkillsInfoCommandHandler(),
-        HelpCommandHandler(),
-        ListCommandHandler(),
-        ResetCommandHandler(),
-        SkillsCommandHandler(),
-        ThreadsCommandHandler(),
-        ThreadsListCommandHandler(),
-        ThreadsDeleteCommandHandler(),
-    ]
-
-    for handler in handlers:
-        registry.register(handler)
+    """Register factories for all available command handlers.
+
+    Handlers are only instantiated when first looked up. Safe to call more
+    than once; factories are only registered on the first call.
+    """
+    if registry._handlers or registry._factories:
+        return
+
+    factories = {
+        "skills_list": SkillsListCommandHandler,
+        "skills_create": SkillsCreateCommandHandler,
+        "skills_info": SkillsInfoCommandHandler,
+        "help": HelpCommandHandler,
+        "list": ListCommandHandler,
+        "reset": ResetCommandHandler,
+        "skills": SkillsCommandHandler,
+        "threads": ThreadsCommandHandler,
+        "threads_list": ThreadsListCommandHandler,
+        "threads_delete": ThreadsDeleteCommandHandler,
+    }
+
+    for command_name, factory in factories.items():
+        registry.register_factory(command_name, factory)
 
 
 # Initialize the registry when this module is imported
@@ -6,19 +6,22 @@ from argparse import Namespace
 
 from swe_workflow.command_handlers.base import CommandHandler
 
+# swe_workflow.skills.commands is imported inside execute(): it pulls in
+# deepagents and LangChain, which registry setup must not pay for
+
 
 class SkillsListCommandHandler(CommandHandler):
     """Handler for the 'list' skills command."""
 
     @property
     def command_name(self) -> str:
-        return "list"
+        return "skills_list"
 
     def execute(self, args: Namespace) -> None:
         """Execute the skills list command."""
         from swe_workflow.skills.commands import _list
 
-        _list(agent=args.agent, project=getattr(args, "project", False))
+        _list(agent=args.agent, project=args.project)
 
 
 class SkillsCreateCommandHandler(CommandHandler):
@@ -26,13 +29,13 @@ class SkillsCreateCommandHandler(CommandHandler):
 
     @property
     def command_name(self) -> str:
-        return "create"
+        return "skills_create"
 
     def execute(self, args: Namespace) -> None:
         """Execute the skills create command."""
         from swe_workflow.skills.commands import _create
 
-        _create(args.name, agent=args.agent, project=getattr(args, "project", False))
+        _create(args.name, agent=args.agent, project=args.project)
 
 
 class SkillsInfoCommandHandler(CommandHandler):
@@ -40,10 +43,10 @@ class SkillsInfoCommandHandler(CommandHandler):
 
     @property
     def command_name(self) -> str:
-        return "info"
+        return "skills_info"
 
     def execute(self, args: Namespace) -> None:
         """Execute the skills info command."""
         from swe_workflow.skills.commands import _info
 
-        _info(args.name, agent=args.agent, project=getattr(args, "project", False))
+        _info(args.name, agent=args.agent, project=args.project)
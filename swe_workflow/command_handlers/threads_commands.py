@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import asyncio
 from argparse import Namespace
 
+from swe_workflow._event_loop import run_coroutine
 from swe_workflow.command_handlers.base import CommandHandler
-from swe_workflow.sessions import delete_thread_command, list_threads_command
+
+# swe_workflow.sessions is imported inside execute(): it pulls in LangGraph
 
 
 class ThreadsListCommandHandler(CommandHandler):
@@ -18,10 +19,12 @@ class ThreadsListCommandHandler(CommandHandler):
 
     def execute(self, args: Namespace) -> None:
         """Execute the threads list command."""
-        asyncio.run(
+        from swe_workflow.sessions import list_threads_command
+
+        run_coroutine(
             list_threads_command(
-                agent_name=getattr(args, "agent", None),
-                limit=getattr(args, "limit", 20),
+                agent_name=args.agent,
+                limit=args.limit,
             )
         )
 
@@ -35,4 +38,6 @@ class ThreadsDeleteCommandHandler(CommandHandler):
 
     def execute(self, args: Namespace) -> None:
         """Execute the threads delete command."""
-        asyncio.run(delete_thread_command(args.thread_id))
+        from swe_workflow.sessions import delete_thread_command
+
+        run_coroutine(delete_thread_command(args.thread_id))
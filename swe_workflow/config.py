@@ -1,30 +1,39 @@
 """Configuration, constants, and model creation for the CLI."""
 
+from __future__ import annotations
+
+import functools
 import os
 import re
+import string
 import sys
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-
-import dotenv
-from rich.console import Console
+from typing import TYPE_CHECKING, Any
 
 from ._version import __version__
 
-dotenv.load_dotenv()
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+    from rich.console import Console
 
-# CRITICAL: Override LANGSMITH_PROJECT to route agent traces to separate project
-# LangSmith reads LANGSMITH_PROJECT at invocation time, so we override it here
-# and preserve the user's original value for shell commands
-_langsmith_project = os.environ.get("LANGSMITH_PROJECT")
-_original_langsmith_project = os.environ.get("LANGSMITH_PROJECT")
-if _langsmith_project:
-    # Override LANGSMITH_PROJECT for agent traces
-    os.environ["LANGSMITH_PROJECT"] = _langsmith_project
 
-# Now safe to import LangChain modules
-from langchain_core.language_models import BaseChatModel
+@functools.cache
+def ensure_env_loaded() -> None:
+    """Load variables from a .env file into the environment (once per process)."""
+    import dotenv
+
+    dotenv.load_dotenv()
+
+
+# Settings below are detected from the environment at import time, so .env
+# must be applied first
+ensure_env_loaded()
+
+# Preserve the user's original LANGSMITH_PROJECT so shell commands can trace
+# to it (see create_cli_agent); agent traces read the variable at invocation time
+_original_langsmith_project = os.environ.get("LANGSMITH_PROJECT")
 
 COLORS = {
     "primary": "#ca8a04",  # Mustard gold (WCAG compliant on dark)
@@ -35,9 +44,10 @@ COLORS = {
     "tool": "#b91c1c",  # Darker red for better contrast
 }
 
-# ASCII art banner
-
-DEEP_AGENTS_ASCII = f"""
+@functools.cache
+def get_banner() -> str:
+    """Return the ASCII art banner, built on first use."""
+    return f"""
 ███████╗ ██╗    ██╗ ███████╗
 ██╔════╝ ██║    ██║ ██╔════╝
 ███████╗ ██║ █╗ ██║ █████╗
@@ -54,6 +64,7 @@ DEEP_AGENTS_ASCII = f"""
                                                                 v{__version__}
 """
 
+
 # Interactive commands
 COMMANDS = {
     "clear": "Clear screen and reset conversation",
@@ -70,15 +81,36 @@ MAX_ARG_LENGTH = 150
 # Agent configuration
 config = {"recursion_limit": 1000}
 
-# Rich console instance
-console = Console(highlight=False)
+# Valid agent names: only alphanumeric, hyphens, underscores, and whitespace
+_AGENT_NAME_RE = re.compile(r"^[a-zA-Z0-9_\-\s]+\Z")
+_AGENT_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_- ")
+
+
+@functools.cache
+def get_console() -> Console:
+    """Return the shared Rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console(highlight=False)
+
+
+def __getattr__(name: str) -> Any:
+    """Construct ``console`` and ``DEEP_AGENTS_ASCII`` lazily on first access."""
+    if name == "console":
+        return get_console()
+    if name == "DEEP_AGENTS_ASCII":
+        return get_banner()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
 def _find_project_root(start_path: Path | None = None) -> Path | None:
     """Find the project root by looking for .git directory.
 
     Walks up the directory tree from start_path (or cwd) looking for a .git
-    directory, which indicates the project root.
+    directory, which indicates the project root. Results are cached per
+    resolved start path for the lifetime of the process; call
+    `clear_project_root_cache` to force a fresh walk.
 
     Args:
         start_path: Directory to start searching from. Defaults to current working directory.
@@ -86,15 +118,32 @@ def _find_project_root(start_path: Path | None = None) -> Path | None:
     Returns:
         Path to the project root if found, None otherwise.
     """
-    current = Path(start_path or Path.cwd()).resolve()
+    return _find_project_root_cached(Path(start_path or Path.cwd()).resolve())
 
-    # Walk up the directory tree
-    for parent in [current, *list(current.parents)]:
-        git_dir = parent / ".git"
-        if git_dir.exists():
-            return parent
 
-    return None
+@functools.lru_cache(maxsize=32)
+def _find_project_root_cached(current: Path) -> Path | None:
+    """Walk up from an already-resolved path looking for a .git entry.
+
+    A single lstat per ancestor on plain strings; ``.git`` may be a directory
+    or, for worktrees and submodules, a file.
+    """
+    path = os.fspath(current)
+    while True:
+        try:
+            os.stat(os.path.join(path, ".git"), follow_symlinks=False)
+        except OSError:
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None
+            path = parent
+        else:
+            return Path(path)
+
+
+def clear_project_root_cache() -> None:
+    """Forget cached project root lookups (e.g. after creating a repository)."""
+    _find_project_root_cached.cache_clear()
 
 
 def _find_project_agent_md(project_root: Path) -> list[Path]:
@@ -127,7 +176,7 @@ def _find_project_agent_md(project_root: Path) -> list[Path]:
     return paths
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """Global settings and environment detection.
 
@@ -144,6 +193,8 @@ class Settings:
         anthropic_api_key: Anthropic API key if available
         langchain_project: LangSmith project name for swe-workflow agent tracing
         user_langchain_project: Original LANGSMITH_PROJECT from environment (for user code)
+        user_agent_root: User-level ~/.swe-workflow directory
+        project_swe_workflow_root: Project-level .swe-workflow directory (if in a git project)
     """
 
     # API keys
@@ -163,9 +214,21 @@ class Settings:
     # Local LLM configuration
     openai_compatible_url: str | None = None  # URL for OpenAI-compatible API
 
+    # Response caching for non-interactive runs (opt-in via SWE_WORKFLOW_LLM_CACHE)
+    llm_cache_enabled: bool = False
+
     # Project information
     project_root: Path | None = None
 
+    # Derived filesystem roots, computed once instead of on every path lookup
+    user_agent_root: Path = field(default_factory=lambda: Path.home() / ".swe-workflow")
+    project_swe_workflow_root: Path | None = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        """Derive the project-level .swe-workflow root from project_root."""
+        if self.project_root is not None:
+            self.project_swe_workflow_root = self.project_root / ".swe-workflow"
+
     @classmethod
     def from_environment(cls, *, start_path: Path | None = None) -> "Settings":
         """Create settings by detecting the current environment.
@@ -194,6 +257,9 @@ class Settings:
         langchain_project = os.environ.get("LANGSMITH_PROJECT")
         user_langchain_project = _original_langsmith_project  # Use saved original!
 
+        # Opt-in model response cache for non-interactive runs
+        llm_cache_enabled = os.environ.get("SWE_WORKFLOW_LLM_CACHE", "").lower() in {"1", "true", "yes"}
+
         # Detect project
         project_root = _find_project_root(start_path)
 
@@ -203,9 +269,11 @@ class Settings:
             google_api_key=google_key,
             openai_compatible_api_key=openai_compatible_key,
             openai_compatible_url=openai_compatible_url,
+            llm_cache_enabled=llm_cache_enabled,
             langchain_project=langchain_project,
             user_langchain_project=user_langchain_project,
             project_root=project_root,
+            user_agent_root=Path.home() / ".swe-workflow",
         )
 
     @property
@@ -245,7 +313,7 @@ class Settings:
         Returns:
             Path to ~/.swe-workflow
         """
-        return Path.home() / ".swe-workflow"
+        return self.user_agent_root
 
     def get_user_agent_md_path(self, agent_name: str) -> Path:
         """Get user-level AGENTS.md path for a specific agent.
@@ -258,7 +326,7 @@ class Settings:
         Returns:
             Path to ~/.swe-workflow/{agent_name}/AGENTS.md
         """
-        return Path.home() / ".swe-workflow" / agent_name / "AGENTS.md"
+        return self.user_agent_root / agent_name / "AGENTS.md"
 
     def get_project_agent_md_path(self) -> Path | None:
         """Get project-level AGENTS.md path.
@@ -268,17 +336,19 @@ class Settings:
         Returns:
             Path to {project_root}/.swe-workflow/AGENTS.md, or None if not in a project
         """
-        if not self.project_root:
+        if not self.project_swe_workflow_root:
             return None
-        return self.project_root / ".swe-workflow" / "AGENTS.md"
+        return self.project_swe_workflow_root / "AGENTS.md"
 
     @staticmethod
     def _is_valid_agent_name(agent_name: str) -> bool:
         """Validate prevent invalid filesystem paths and security issues."""
-        if not agent_name or not agent_name.strip():
+        if not agent_name or agent_name.isspace():
             return False
-        # Allow only alphanumeric, hyphens, underscores, and whitespace
-        return bool(re.match(r"^[a-zA-Z0-9_\-\s]+$", agent_name))
+        # Common case: plain ASCII names are checked with a C-level set scan
+        if _AGENT_NAME_CHARS.issuperset(agent_name):
+            return True
+        return bool(_AGENT_NAME_RE.match(agent_name))
 
     def get_agent_dir(self, agent_name: str) -> Path:
         """Get the global agent directory path.
@@ -292,7 +362,7 @@ class Settings:
         if not self._is_valid_agent_name(agent_name):
             msg = f"Invalid agent name: {agent_name!r}. Agent names can only contain letters, numbers, hyphens, underscores, and spaces."
             raise ValueError(msg)
-        return Path.home() / ".swe-workflow" / agent_name
+        return self.user_agent_root / agent_name
 
     def ensure_agent_dir(self, agent_name: str) -> Path:
         """Ensure the global agent directory exists and return its path.
@@ -316,10 +386,10 @@ class Settings:
         Returns:
             Path to project .swe-workflow directory, or None if not in a project
         """
-        if not self.project_root:
+        if not self.project_swe_workflow_root:
             return None
 
-        project_swe_workflow_dir = self.project_root / ".swe-workflow"
+        project_swe_workflow_dir = self.project_swe_workflow_root
         project_swe_workflow_dir.mkdir(parents=True, exist_ok=True)
         return project_swe_workflow_dir
 
@@ -353,9 +423,9 @@ class Settings:
         Returns:
             Path to {project_root}/.swe-workflow/skills/, or None if not in a project
         """
-        if not self.project_root:
+        if not self.project_swe_workflow_root:
             return None
-        return self.project_root / ".swe-workflow" / "skills"
+        return self.project_swe_workflow_root / "skills"
 
     def ensure_project_skills_dir(self) -> Path | None:
         """Ensure project-level skills directory exists and return its path.
@@ -377,6 +447,8 @@ settings = Settings.from_environment()
 class SessionState:
     """Holds mutable session state (auto-approve mode, etc)."""
 
+    __slots__ = ("auto_approve", "exit_hint_handle", "exit_hint_until", "no_splash", "thread_id")
+
     def __init__(self, auto_approve: bool = False, no_splash: bool = False) -> None:
         self.auto_approve = auto_approve
         self.no_splash = no_splash
@@ -390,16 +462,57 @@ class SessionState:
         return self.auto_approve
 
 
+_DEFAULT_PROMPT_PATH = Path(__file__).parent / "default_agent_prompt.md"
+
+
+@functools.cache
 def get_default_coding_instructions() -> str:
     """Get the default coding agent instructions.
 
     These are the immutable base instructions that cannot be modified by the agent.
     Long-term memory (AGENTS.md) is handled separately by the middleware.
+    The file ships with the package, so it is read at most once per process.
     """
-    default_prompt_path = Path(__file__).parent / "default_agent_prompt.md"
-    return default_prompt_path.read_text()
-
-
+    return _DEFAULT_PROMPT_PATH.read_text()
+
+
+# Model-name keywords per provider, compiled once and checked in priority order
+_PROVIDER_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ("openai", re.compile(r"gpt|o1|o3")),
+    ("anthropic", re.compile(r"claude")),
+    ("google", re.compile(r"gemini")),
+    # OpenAI-compatible API patterns; includes legacy patterns too for backward compatibility
+    (
+        "openai-compatible",
+        re.compile(
+            "|".join(
+                map(
+                    re.escape,
+                    [
+                        "ollama",
+                        "local:",
+                        "llama",
+                        "mistral",
+                        "phi",
+                        "yi",
+                        "deepseek",
+                        "mixtral",
+                        "codellama",
+                        "wizardlm",
+                        "vicuna",
+                        "zephyr",
+                        "qwen",
+                        "devstral",
+                        "minimax",
+                    ],
+                )
+            )
+        ),
+    ),
+)
+
+
+@functools.lru_cache(maxsize=64)
 def _detect_provider(model_name: str) -> str | None:
     """Auto-detect provider from model name.
 
@@ -410,34 +523,9 @@ def _detect_provider(model_name: str) -> str | None:
         Provider name (openai, anthropic, google, openai-compatible) or None if can't detect
     """
     model_lower = model_name.lower()
-    if any(x in model_lower for x in ["gpt", "o1", "o3"]):
-        return "openai"
-    if "claude" in model_lower:
-        return "anthropic"
-    if "gemini" in model_lower:
-        return "google"
-    # Check for OpenAI-compatible API patterns - includes legacy patterns too for backward compatibility
-    if any(
-        x in model_lower
-        for x in [
-            "ollama",
-            "local:",
-            "llama",
-            "mistral",
-            "phi",
-            "yi",
-            "deepseek",
-            "mixtral",
-            "codellama",
-            "wizardlm",
-            "vicuna",
-            "zephyr",
-            "qwen",
-            "devstral",
-            "minimax",
-        ]
-    ):
-        return "openai-compatible"
+    for provider, pattern in _PROVIDER_PATTERNS:
+        if pattern.search(model_lower):
+            return provider
     return None
 
 
@@ -455,15 +543,13 @@ def create_model(model_name_override: str | None = None) -> BaseChatModel:
     Raises:
         SystemExit if no API key is configured or model provider can't be determined
     """
-    from .model_selection import ModelFactory, create_model_selection_chain
-
-    # Create the chain of model selection strategies
-    chain = create_model_selection_chain(settings, console)
+    from .model_selection import ModelFactory, select_model
 
-    # Execute the chain to get provider and model name
-    result = chain.execute(model_name_override)
+    # Resolve provider and model name
+    console = get_console()
+    result = select_model(settings, console, model_name_override)
     if result is None:
-        # This should not happen if the chain is properly implemented, but added for safety
+        # This should not happen if selection is properly implemented, but added for safety
         console.print("[bold red]Error:[/bold red] Could not determine model provider.")
         sys.exit(1)
 
@@ -1,10 +1,158 @@
-"""Content block handling strategies using the Strategy pattern to replace if/elif chains."""
+"""Content block handling for streamed agent output.
+
+Hot paths use `dispatch_content_block` and `parse_tool_args`, which resolve the
+handler with a single dict lookup. The Chain-of-Responsibility classes are thin
+wrappers around the same functions, kept for API compatibility.
+"""
 
 import json
+import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any
 
 
+def _handle_text_block(block: dict[str, Any], tool_call_buffers: dict, print_func: Any) -> None:
+    """Stream a text block to the output, leaving flushing to the printer."""
+    text = block.get("text", "")
+    if text:
+        print_func(text, end="")
+
+
+# JSON tokens that affect nesting: escape pairs (or a trailing backslash), quotes and brackets
+_JSON_STRUCTURE_RE = re.compile(r'\\.|\\\Z|["{}\[\]]', re.DOTALL)
+
+
+@dataclass(slots=True)
+class ToolCallBuffer:
+    """Accumulates a streamed tool call until its arguments can be decoded.
+
+    String argument chunks are collected in ``args_parts`` and only joined when
+    ``resolved_args`` is read, so streaming N chunks copies O(N) bytes rather
+    than re-joining the whole prefix on every chunk. Bracket nesting is tracked
+    as chunks arrive so callers can skip decoding while the JSON is still open.
+    """
+
+    name: str | None = None
+    id: str | None = None
+    args: Any = None
+    args_parts: list[str] = field(default_factory=list)
+    _depth: int = field(default=0, init=False, repr=False)
+    _opened: bool = field(default=False, init=False, repr=False)
+    _in_string: bool = field(default=False, init=False, repr=False)
+    _escaped: bool = field(default=False, init=False, repr=False)
+
+    def append_args(self, chunk: str) -> None:
+        """Add a string argument chunk, updating the nesting state."""
+        self.args_parts.append(chunk)
+        if self._escaped:
+            # The previous chunk ended in a backslash that escapes this first character
+            self._escaped = False
+            chunk = chunk[1:]
+        for match in _JSON_STRUCTURE_RE.finditer(chunk):
+            token = match.group()
+            if token[0] == "\\":
+                self._escaped = len(token) == 1
+            elif token == '"':
+                self._in_string = not self._in_string
+            elif self._in_string:
+                continue
+            elif token in "{[":
+                self._depth += 1
+                self._opened = True
+            else:
+                self._depth -= 1
+
+    def set_args(self, args: Any) -> None:
+        """Replace the arguments with an already-decoded value."""
+        self.args = args
+        self.args_parts.clear()
+        self._depth = 0
+        self._opened = self._in_string = self._escaped = False
+
+    @property
+    def maybe_complete(self) -> bool:
+        """Whether the buffered arguments could be a complete JSON document."""
+        if not self.args_parts or not self._opened:
+            return True
+        return self._depth <= 0 and not self._in_string
+
+    @property
+    def resolved_args(self) -> Any:
+        """Return the complete arguments seen so far."""
+        if self.args_parts:
+            return "".join(self.args_parts)
+        return self.args
+
+
+def _handle_tool_call_block(block: dict[str, Any], tool_call_buffers: dict, print_func: Any) -> None:
+    """Accumulate a (possibly partial) tool call block into its buffer."""
+    chunk_name = block.get("name")
+    chunk_args = block.get("args")
+    chunk_id = block.get("id")
+    chunk_index = block.get("index")
+
+    buffer_key: str | int
+    if chunk_index is not None:
+        buffer_key = chunk_index
+    elif chunk_id is not None:
+        buffer_key = chunk_id
+    else:
+        buffer_key = f"unknown-{len(tool_call_buffers)}"
+
+    buffer = tool_call_buffers.get(buffer_key)
+    if buffer is None:
+        buffer = tool_call_buffers[buffer_key] = ToolCallBuffer()
+
+    if chunk_name:
+        buffer.name = chunk_name
+    if chunk_id:
+        buffer.id = chunk_id
+
+    if isinstance(chunk_args, str):
+        if chunk_args:
+            parts = buffer.args_parts
+            # LangChain can re-send the previous chunk; skip the duplicate
+            if not parts or chunk_args != parts[-1]:
+                buffer.append_args(chunk_args)
+    elif chunk_args is not None:
+        buffer.set_args(chunk_args)
+
+
+# Content block handlers keyed by block type
+_CONTENT_BLOCK_HANDLERS: dict[str, Callable[[dict[str, Any], dict, Any], None]] = {
+    "text": _handle_text_block,
+    "tool_call": _handle_tool_call_block,
+    "tool_call_chunk": _handle_tool_call_block,
+}
+
+
+def dispatch_content_block(block: dict[str, Any], tool_call_buffers: dict, print_func: Any = print) -> bool:
+    """Handle a content block with a single table lookup, returning True if handled."""
+    handler = _CONTENT_BLOCK_HANDLERS.get(block.get("type"))
+    if handler is None:
+        return False
+    handler(block, tool_call_buffers, print_func)
+    return True
+
+
+def parse_tool_args(parsed_args: Any) -> Any:
+    """Decode buffered tool call arguments.
+
+    JSON strings are decoded (empty or malformed strings yield None); any other
+    value, including None, is returned unchanged.
+    """
+    if not isinstance(parsed_args, str):
+        return parsed_args
+    if not parsed_args:
+        return None
+    try:
+        return json.loads(parsed_args)
+    except Exception:
+        return None  # Return None to indicate parsing failure
+
+
 class ContentBlockHandler(ABC):
     """Abstract base class for content block handling strategies."""
 
@@ -43,9 +191,7 @@ class TextBlockHandler(ContentBlockHandler):
         return block.get("type") == "text"
 
     def _handle_specific(self, block: dict[str, Any], tool_call_buffers: dict, print_func: Any) -> None:
-        text = block.get("text", "")
-        if text:
-            print_func(text, end="", flush=True)
+        _handle_text_block(block, tool_call_buffers, print_func)
 
 
 class ToolCallBlockHandler(ContentBlockHandler):
@@ -55,40 +201,7 @@ class ToolCallBlockHandler(ContentBlockHandler):
         return block.get("type") in ("tool_call_chunk", "tool_call")
 
     def _handle_specific(self, block: dict[str, Any], tool_call_buffers: dict, print_func: Any) -> None:
-        chunk_name = block.get("name")
-        chunk_args = block.get("args")
-        chunk_id = block.get("id")
-        chunk_index = block.get("index")
-
-        buffer_key: str | int
-        if chunk_index is not None:
-            buffer_key = chunk_index
-        elif chunk_id is not None:
-            buffer_key = chunk_id
-        else:
-            buffer_key = f"unknown-{len(tool_call_buffers)}"
-
-        buffer = tool_call_buffers.setdefault(
-            buffer_key,
-            {"name": None, "id": None, "args": None, "args_parts": []},
-        )
-
-        if chunk_name:
-            buffer["name"] = chunk_name
-        if chunk_id:
-            buffer["id"] = chunk_id
-
-        if isinstance(chunk_args, dict):
-            buffer["args"] = chunk_args
-            buffer["args_parts"] = []
-        elif isinstance(chunk_args, str):
-            if chunk_args:
-                parts: list[str] = buffer.setdefault("args_parts", [])
-                if not parts or chunk_args != parts[-1]:
-                    parts.append(chunk_args)
-                buffer["args"] = "".join(parts)
-        elif chunk_args is not None:
-            buffer["args"] = chunk_args
+        _handle_tool_call_block(block, tool_call_buffers, print_func)
 
 
 def create_content_block_handler_chain() -> ContentBlockHandler:
@@ -137,12 +250,7 @@ class StringArgParsingHandler(ArgParsingHandler):
         return isinstance(parsed_args, str)
 
     def _parse_specific(self, parsed_args: Any) -> Any:
-        if not parsed_args:
-            return None
-        try:
-            return json.loads(parsed_args)
-        except Exception:
-            return None  # Return None to indicate parsing failure
+        return parse_tool_args(parsed_args)
 
 
 class NoneArgParsingHandler(ArgParsingHandler):
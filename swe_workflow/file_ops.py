@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import difflib
+import itertools
+import re
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
@@ -10,6 +13,8 @@ from typing import TYPE_CHECKING, Any, Literal
 from .config import settings
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from deepagents.backends.protocol import BACKEND_TYPES
 
 FileOpStatus = Literal["pending", "success", "error"]
@@ -34,6 +39,49 @@ def _safe_read(path: Path) -> str | None:
         return None
 
 
+# Recent approval-preview reads keyed by (path, mtime_ns, size) -> (read time, content),
+# oldest first. Entries older than the TTL are dropped on the next insert, and the
+# cached file sizes are capped in total.
+_READ_CACHE: dict[tuple[str, int, int], tuple[float, str | None]] = {}
+_READ_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+
+def _safe_read_cached(path: Path, ttl: float = 0.5) -> str | None:
+    """Like `_safe_read`, but reuse a read of the same unchanged file within ``ttl`` seconds.
+
+    Only for approval previews, which re-render the same file: a rewrite that
+    keeps the size within one mtime tick can be served stale until ``ttl`` runs
+    out, so recorded before/after content must use `_safe_read`.
+
+    Returns None when the file is missing or unreadable.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    now = time.monotonic()
+    entry = _READ_CACHE.get(key)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    content = _safe_read(path)
+    # A re-read goes to the end so the dict stays ordered by read time
+    _READ_CACHE.pop(key, None)
+
+    if st.st_size > _READ_CACHE_MAX_BYTES:
+        return content
+    # Evict expired entries, then the oldest ones until the new file fits
+    cached_bytes = sum(cached_key[2] for cached_key in _READ_CACHE)
+    while _READ_CACHE:
+        oldest_key, (read_at, _) = next(iter(_READ_CACHE.items()))
+        if now - read_at < ttl and cached_bytes + st.st_size <= _READ_CACHE_MAX_BYTES:
+            break
+        del _READ_CACHE[oldest_key]
+        cached_bytes -= oldest_key[2]
+    _READ_CACHE[key] = (now, content)
+    return content
+
+
 def _count_lines(text: str) -> int:
     """Count lines in text, treating empty strings as zero lines."""
     if not text:
@@ -41,6 +89,71 @@ def _count_lines(text: str) -> int:
     return len(text.splitlines())
 
 
+# Added/removed lines in a unified diff, excluding the ---/+++ file headers
+_DIFF_CHANGE_RE = re.compile(r"^(?:\+(?!\+\+)|-(?!--))", re.MULTILINE)
+
+
+def count_diff_changes(diff: str) -> tuple[int, int]:
+    """Count added and removed lines in a unified diff with a single scan.
+
+    Returns:
+        Tuple of (additions, deletions)
+    """
+    changes = _DIFF_CHANGE_RE.findall(diff)
+    additions = changes.count("+")
+    return additions, len(changes) - additions
+
+
+def count_diff_line_changes(lines: Iterable[str]) -> tuple[int, int]:
+    """Count added and removed lines in a unified diff that is already split into lines.
+
+    Returns:
+        Tuple of (additions, deletions)
+    """
+    # Rejoining keeps a single implementation of the counting rules
+    return count_diff_changes("\n".join(lines))
+
+
+try:  # Optional C implementation of SequenceMatcher (pip install swe-workflow[diff])
+    from cdifflib import CSequenceMatcher as _SequenceMatcher
+except ImportError:
+    _SequenceMatcher = difflib.SequenceMatcher
+
+
+def _format_range_unified(start: int, stop: int) -> str:
+    """Format a hunk range the way `difflib.unified_diff` does."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def _unified_diff_lines(a: list[str], b: list[str], fromfile: str, tofile: str, n: int) -> Iterator[str]:
+    """Yield `difflib.unified_diff` lines (``lineterm=""``) using the fastest available matcher."""
+    started = False
+    for group in _SequenceMatcher(None, a, b).get_grouped_opcodes(n):
+        if not started:
+            started = True
+            yield f"--- {fromfile}"
+            yield f"+++ {tofile}"
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range_unified(first[1], last[2])} +{_format_range_unified(first[3], last[4])} @@"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in a[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in {"replace", "delete"}:
+                for line in a[i1:i2]:
+                    yield "-" + line
+            if tag in {"replace", "insert"}:
+                for line in b[j1:j2]:
+                    yield "+" + line
+
+
 def compute_unified_diff(
     before: str,
     after: str,
@@ -63,16 +176,9 @@ def compute_unified_diff(
     """
     before_lines = before.splitlines()
     after_lines = after.splitlines()
-    diff_lines = list(
-        difflib.unified_diff(
-            before_lines,
-            after_lines,
-            fromfile=f"{display_path} (before)",
-            tofile=f"{display_path} (after)",
-            lineterm="",
-            n=context_lines,
-        )
-    )
+    lines = _unified_diff_lines(before_lines, after_lines, f"{display_path} (before)", f"{display_path} (after)", context_lines)
+    # Stop generating once we know the diff will be truncated
+    diff_lines = list(lines if max_lines is None else itertools.islice(lines, max_lines + 1))
     if not diff_lines:
         return None
     if max_lines is not None and len(diff_lines) > max_lines:
@@ -285,10 +391,7 @@ class FileOpTracker:
             )
             record.diff = diff
             if diff:
-                additions = sum(1 for line in diff.splitlines() if line.startswith("+") and not line.startswith("+++"))
-                deletions = sum(1 for line in diff.splitlines() if line.startswith("-") and not line.startswith("---"))
-                record.metrics.lines_added = additions
-                record.metrics.lines_removed = deletions
+                record.metrics.lines_added, record.metrics.lines_removed = count_diff_changes(diff)
             elif record.tool_name == "write_file" and (record.before_content or "") == "":
                 record.metrics.lines_added = record.metrics.lines_written
             record.metrics.bytes_written = len(record.after_content.encode("utf-8"))
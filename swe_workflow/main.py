@@ -1,70 +1,48 @@
 """Main entry point and CLI loop for swe-workflow."""
-# ruff: noqa: T201, E402, BLE001, PLR0912, PLR0915
-
-# Suppress deprecation warnings from langchain_core (e.g., Pydantic V1 on Python 3.14+)
-# ruff: noqa: E402
-import warnings
-
-warnings.filterwarnings("ignore", module="langchain_core._api.deprecation")
+# ruff: noqa: T201, BLE001
 
 import argparse
-import asyncio
 import contextlib
+import functools
+import hashlib
+import importlib.util
 import os
 import sys
 import warnings
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, NoReturn
 
-# Suppress Pydantic v1 compatibility warnings from langchain on Python 3.14+
-warnings.filterwarnings("ignore", message=".*Pydantic V1.*", category=UserWarning)
-
-from rich.text import Text
-
+from ._event_loop import run_coroutine
+from ._paths import user_cache_dir
 from ._version import __version__
 
-# Now safe to import agent (which imports LangChain modules)
-from .agent import create_cli_agent, list_agents, reset_agent
-from .non_interactive import run_non_interactive_with_resume
-
-# CRITICAL: Import config FIRST to set LANGSMITH_PROJECT before LangChain loads
-from .config import (
-    console,
-    create_model,
-    settings,
-)
-from .sessions import (
-    delete_thread_command,
-    generate_thread_id,
-    get_checkpointer,
-    get_most_recent,
-    get_thread_agent,
-    list_threads_command,
-    thread_exists,
-)
-from .skills import execute_skills_command, setup_skills_parser
-from .tools import fetch_url, http_request
-from .ui import show_help
+# Everything else (LangChain, sessions, Rich, ...) is imported inside the code
+# paths that need it so `--version`, `help` and `list` start quickly.
 
 
-def check_cli_dependencies() -> None:
-    """Check if CLI optional dependencies are installed."""
-    missing = []
+def _dependency_marker() -> Path:
+    """Return the marker recording that this interpreter passed the dependency check.
 
-    try:
-        import requests  # noqa: F401
-    except ImportError:
-        missing.append("requests")
+    The name is keyed on the swe-workflow version and the interpreter, so an upgrade
+    or a different virtualenv re-runs the check.
+    """
+    key = hashlib.sha1(f"{__version__}\0{sys.executable}".encode(), usedforsecurity=False).hexdigest()[:16]
+    return user_cache_dir() / f"deps-ok-{key}"
 
-    try:
-        import dotenv  # noqa: F401
-    except ImportError:
-        missing.append("python-dotenv")
 
+def check_cli_dependencies() -> None:
+    """Check if CLI optional dependencies are installed."""
+    marker = _dependency_marker()
+    if marker.exists():
+        return
 
-    try:
-        import textual  # noqa: F401
-    except ImportError:
-        missing.append("textual")
+    # find_spec locates the packages without importing (and initializing) them
+    missing = [
+        package
+        for module, package in (("requests", "requests"), ("dotenv", "python-dotenv"), ("textual", "textual"))
+        if importlib.util.find_spec(module) is None
+    ]
 
     if missing:
         print("\n❌ Missing required CLI dependencies!")
@@ -77,41 +55,52 @@ def check_cli_dependencies() -> None:
         print("  pip install 'swe-workflow'")
         sys.exit(1)
 
+    # Best effort: a read-only cache directory just means checking again next time
+    with contextlib.suppress(OSError):
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        description="SWE-Workflow - AI Coding Assistant",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        add_help=False,
-    )
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"swe-workflow {__version__}",
-    )
 
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+@functools.cache
+def _silence_langchain_warnings() -> None:
+    """Install the warning filters for LangChain; call before anything imports it.
+
+    Kept out of module scope so ``--version`` and ``help`` skip compiling the filters.
+    """
+    # Suppress deprecation warnings from langchain_core (e.g., Pydantic V1 on Python 3.14+)
+    warnings.filterwarnings("ignore", module="langchain_core._api.deprecation")
+    # Suppress Pydantic v1 compatibility warnings from langchain on Python 3.14+
+    warnings.filterwarnings("ignore", message=".*Pydantic V1.*", category=UserWarning)
+
 
-    # List command
+def _add_list_parser(subparsers: Any) -> None:
     subparsers.add_parser("list", help="List all available agents")
 
-    # Help command
+
+def _add_help_parser(subparsers: Any) -> None:
     subparsers.add_parser("help", help="Show help information")
 
-    # Reset command
+
+def _add_reset_parser(subparsers: Any) -> None:
     reset_parser = subparsers.add_parser("reset", help="Reset an agent")
     reset_parser.add_argument("--agent", required=True, help="Name of agent to reset")
     reset_parser.add_argument(
-        "--target", dest="source_agent", help="Copy prompt from another agent"
+        "--target", dest="source_agent", default=None, help="Copy prompt from another agent"
     )
 
-    # Skills command - setup delegated to skills module
+
+def _add_skills_parser(subparsers: Any) -> None:
+    # Setup delegated to skills module, which pulls in deepagents/LangChain
+    _silence_langchain_warnings()
+    from .skills import setup_skills_parser
+
     setup_skills_parser(subparsers)
 
-    # Threads command
+
+def _add_threads_parser(subparsers: Any) -> None:
     threads_parser = subparsers.add_parser("threads", help="Manage conversation threads")
     threads_sub = threads_parser.add_subparsers(dest="threads_command")
+    threads_parser.set_defaults(threads_command=None)
 
     # threads list
     threads_list = threads_sub.add_parser("list", help="List threads")
@@ -124,6 +113,43 @@ def parse_args() -> argparse.Namespace:
     threads_delete = threads_sub.add_parser("delete", help="Delete a thread")
     threads_delete.add_argument("thread_id", help="Thread ID to delete")
 
+
+# Subcommand parser builders, in the order they appear in --help output
+_SUBPARSER_BUILDERS: dict[str, Callable[[Any], None]] = {
+    "list": _add_list_parser,
+    "help": _add_help_parser,
+    "reset": _add_reset_parser,
+    "skills": _add_skills_parser,
+    "threads": _add_threads_parser,
+}
+
+
+def _sniff_subcommands(argv: list[str]) -> tuple[str, ...]:
+    """Return the names of the subcommand parsers needed to parse argv.
+
+    Subcommands are always the first argument, so when argv starts with one
+    only that parser is built. When no argument could name a subcommand the
+    interactive-mode parser needs none. Anything else gets the full tree.
+    """
+    if argv and argv[0] in _SUBPARSER_BUILDERS:
+        return (argv[0],)
+    if any(arg in _SUBPARSER_BUILDERS for arg in argv):
+        return tuple(_SUBPARSER_BUILDERS)
+    return ()
+
+
+class _PartialParserError(Exception):
+    """Raised instead of exiting when a parser built from part of the tree rejects argv."""
+
+
+class _PartialArgumentParser(argparse.ArgumentParser):
+    """Parser (and subparsers) that raise on errors so the full tree can report them."""
+
+    def error(self, message: str) -> NoReturn:
+        raise _PartialParserError(message)
+
+
+def _add_interactive_arguments(parser: argparse.ArgumentParser) -> None:
     # Default interactive mode
     parser.add_argument(
         "--agent",
@@ -175,7 +201,51 @@ def parse_args() -> argparse.Namespace:
         "--task",
         help="Task to execute in non-interactive mode",
     )
-    return parser.parse_args()
+
+
+def _build_parser(subcommands: tuple[str, ...], parser_class: type[argparse.ArgumentParser] = argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Build the CLI parser with the given subcommand parsers."""
+    parser = parser_class(
+        description="SWE-Workflow - AI Coding Assistant",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        add_help=False,
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"swe-workflow {__version__}",
+    )
+
+    if subcommands:
+        subparsers = parser.add_subparsers(dest="command", help="Command to run")
+        for name in subcommands:
+            _SUBPARSER_BUILDERS[name](subparsers)
+    else:
+        parser.set_defaults(command=None)
+
+    # Subcommand handlers read these too (e.g. `skills` falls back to args.agent)
+    _add_interactive_arguments(parser)
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Only the parts of the parser that the given arguments can reach are
+    built (see `_sniff_subcommands`). If that parser rejects the arguments,
+    they are parsed again with the full tree so usage and error messages
+    list every subcommand.
+    """
+    argv = sys.argv[1:]
+    subcommands = _sniff_subcommands(argv)
+    full_tree = tuple(_SUBPARSER_BUILDERS)
+
+    if subcommands != full_tree:
+        try:
+            return _build_parser(subcommands, _PartialArgumentParser).parse_args(argv)
+        except _PartialParserError:
+            pass
+    return _build_parser(full_tree).parse_args(argv)
 
 
 async def run_textual_cli_async(
@@ -197,7 +267,13 @@ async def run_textual_cli_async(
         is_resumed: Whether this is a resumed session
         initial_prompt: Optional prompt to auto-submit when session starts
     """
+    from rich.markup import escape
+
+    from .agent import create_cli_agent
     from .app import run_textual_app
+    from .config import console, create_model
+    from .sessions import get_checkpointer
+    from .tools import fetch_url, http_request
 
     model = create_model(model_name)
 
@@ -232,14 +308,105 @@ async def run_textual_cli_async(
                 initial_prompt=initial_prompt,
             )
         except Exception as e:
-            error_text = Text("❌ Failed to create agent: ", style="red")
-            error_text.append(str(e))
-            console.print(error_text)
+            console.print(f"[red]❌ Failed to create agent:[/red] {escape(str(e))}")
             sys.exit(1)
         finally:
             pass
 
 
+async def _resolve_resume(args: argparse.Namespace) -> str | None:
+    """Resolve ``--resume`` to an existing thread ID within a single event loop.
+
+    When a thread is found and the agent was not given explicitly (or ``-r`` was
+    used without an ID), ``args.agent`` is switched to the thread's agent.
+
+    Returns:
+        The thread ID to resume, or None if there is nothing to resume.
+    """
+    from .sessions import get_most_recent, get_thread_agent, thread_exists
+
+    if args.resume_thread == "__MOST_RECENT__":
+        # -r (no ID): if --agent specified, filter by that agent; otherwise get most recent overall
+        agent_filter = args.agent if args.agent != "agent" else None
+        thread_id = await get_most_recent(agent_filter)
+        if thread_id is None:
+            return None
+    elif args.resume_thread:
+        # -r <ID>: Resume specific thread
+        if not await thread_exists(args.resume_thread):
+            return None
+        thread_id = args.resume_thread
+        if args.agent != "agent":
+            return thread_id
+    else:
+        return None
+
+    agent_name = await get_thread_agent(thread_id)
+    if agent_name:
+        args.agent = agent_name
+    return thread_id
+
+
+def _resume_or_new_thread(args: argparse.Namespace) -> tuple[str, bool]:
+    """Pick the thread for this run, reporting resume misses in the current mode's style.
+
+    Exits with status 1 if a specific thread was requested but does not exist.
+
+    Returns:
+        Tuple of (thread_id, is_resumed).
+    """
+    from .sessions import generate_thread_id
+
+    thread_id = run_coroutine(_resolve_resume(args)) if args.resume_thread else None
+    if thread_id is not None:
+        return thread_id, True
+
+    if args.resume_thread == "__MOST_RECENT__":
+        agent_filter = args.agent if args.agent != "agent" else None
+        if args.non_interactive:
+            print(f"No previous thread for '{args.agent}', starting new." if agent_filter else "No previous threads, starting new.")
+        else:
+            from rich.markup import escape
+
+            from .config import console
+
+            if agent_filter:
+                console.print(f"[yellow]No previous thread for '[/yellow]{escape(args.agent)}[yellow]', starting new.[/yellow]")
+            else:
+                console.print("[yellow]No previous threads, starting new.[/yellow]")
+    elif args.resume_thread:
+        if args.non_interactive:
+            print(f"Thread '{args.resume_thread}' not found.")
+            print("Use 'swe-workflow threads list' to see available threads.")
+        else:
+            from rich.markup import escape
+
+            from .config import console
+
+            console.print(f"[red]Thread '[/red]{escape(args.resume_thread)}[red]' not found.[/red]")
+            console.print("[dim]Use 'swe-workflow threads list' to see available threads.[/dim]")
+        sys.exit(1)
+
+    # Generate new thread ID if not resuming
+    return generate_thread_id(), False
+
+
+def _apply_openai_compatible_url(args: argparse.Namespace) -> None:
+    """Route model calls to the ``--openai-compatible-url`` endpoint, if one was given."""
+    if args.openai_compatible_url:
+        _use_openai_compatible_url(args.openai_compatible_url)
+
+
+@functools.cache
+def _use_openai_compatible_url(url: str) -> None:
+    """Point the environment and settings at an OpenAI-compatible endpoint (once per URL)."""
+    from .config import settings
+
+    # USE_OPENAI_COMPATIBLE flags OpenAI-compatible API usage
+    os.environ.update(OPENAI_COMPATIBLE_URL=url, USE_OPENAI_COMPATIBLE="1")
+    settings.openai_compatible_url = url
+
+
 def cli_main() -> None:
     """Entry point for console script."""
     # Fix for gRPC fork issue on macOS
@@ -251,11 +418,23 @@ def cli_main() -> None:
     # This ensures agent traces → LANGSMITH_PROJECT
     # Shell commands → user's original LANGSMITH_PROJECT (via ShellMiddleware env)
 
+    # `--version` needs neither the dependency check nor argparse
+    if sys.argv[1:] == ["--version"]:
+        print(f"swe-workflow {__version__}")
+        return
+
     # Check dependencies first
     check_cli_dependencies()
 
     try:
+        if sys.argv[1:] == ["help"]:
+            from .ui import show_help
+
+            show_help()
+            return
+
         args = parse_args()
+        _silence_langchain_warnings()
 
         # Use the command handler registry to execute the appropriate command
         from .command_handlers.registry import registry
@@ -263,152 +442,40 @@ def cli_main() -> None:
         if registry.execute_command(args.command, args):
             pass  # Command was executed successfully
         else:
+            thread_id, is_resumed = _resume_or_new_thread(args)
+            _apply_openai_compatible_url(args)
+
             # Check if running in non-interactive mode
             if args.non_interactive:
-                # Non-interactive mode - run without UI
-                thread_id = None
-                is_resumed = False
-
-                if args.resume_thread == "__MOST_RECENT__":
-                    # -r (no ID): Get most recent thread
-                    agent_filter = args.agent if args.agent != "agent" else None
-                    thread_id = asyncio.run(get_most_recent(agent_filter))
-                    if thread_id:
-                        is_resumed = True
-                        agent_name = asyncio.run(get_thread_agent(thread_id))
-                        if agent_name:
-                            args.agent = agent_name
-                    else:
-                        if agent_filter:
-                            print(f"No previous thread for '{args.agent}', starting new.")
-                        else:
-                            print("No previous threads, starting new.")
-
-                elif args.resume_thread:
-                    # -r <ID>: Resume specific thread
-                    if asyncio.run(thread_exists(args.resume_thread)):
-                        thread_id = args.resume_thread
-                        is_resumed = True
-                        if args.agent == "agent":
-                            agent_name = asyncio.run(get_thread_agent(thread_id))
-                            if agent_name:
-                                args.agent = agent_name
-                    else:
-                        print(f"Thread '{args.resume_thread}' not found.")
-                        print("Use 'swe-workflow threads list' to see available threads.")
-                        sys.exit(1)
-
-                # Generate new thread ID if not resuming
-                if thread_id is None:
-                    thread_id = generate_thread_id()
-
-                # Handle OpenAI-compatible API configuration from command line
-                # If openai-compatible URL is provided, set up the configuration and mark for use
-                if hasattr(args, "openai_compatible_url") and args.openai_compatible_url:
-                    os.environ["OPENAI_COMPATIBLE_URL"] = args.openai_compatible_url
-                    # Update both environment variable and internal setting
-                    settings.openai_compatible_url = args.openai_compatible_url
-                    os.environ["USE_OPENAI_COMPATIBLE"] = (
-                        "1"  # Flag to indicate OpenAI-compatible API usage
-                    )
-                    # If no model was specified but we have an openai-compatible URL,
-                    # we should use a default model or let the config system handle it
-                    if not hasattr(args, "model") or not args.model:
-                        # Default will be used if no --model specified
-                        pass
-
-                # Use the model from --model argument
-                model_name = getattr(args, "model", None)
+                from .non_interactive import run_non_interactive_with_resume
 
                 # Run non-interactive mode with resume capability
-                exit_code = asyncio.run(
+                exit_code = run_coroutine(
                     run_non_interactive_with_resume(
                         task=args.task or "",
                         assistant_id=args.agent,
                         auto_approve=True,  # Always auto-approve in non-interactive mode
-                        model_name=model_name,
+                        model_name=args.model,
                         resume_thread_id=thread_id if is_resumed else None,
-                        initial_prompt=getattr(args, "initial_prompt", None),
+                        initial_prompt=args.initial_prompt,
                     )
                 )
                 sys.exit(exit_code)
             else:
-                # Interactive mode - handle thread resume
-                thread_id = None
-                is_resumed = False
-
-                if args.resume_thread == "__MOST_RECENT__":
-                    # -r (no ID): Get most recent thread
-                    # If --agent specified, filter by that agent; otherwise get most recent overall
-                    agent_filter = args.agent if args.agent != "agent" else None
-                    thread_id = asyncio.run(get_most_recent(agent_filter))
-                    if thread_id:
-                        is_resumed = True
-                        agent_name = asyncio.run(get_thread_agent(thread_id))
-                        if agent_name:
-                            args.agent = agent_name
-                    else:
-                        if agent_filter:
-                            msg = Text("No previous thread for '", style="yellow")
-                            msg.append(args.agent)
-                            msg.append("', starting new.", style="yellow")
-                        else:
-                            msg = Text("No previous threads, starting new.", style="yellow")
-                        console.print(msg)
-
-                elif args.resume_thread:
-                    # -r <ID>: Resume specific thread
-                    if asyncio.run(thread_exists(args.resume_thread)):
-                        thread_id = args.resume_thread
-                        is_resumed = True
-                        if args.agent == "agent":
-                            agent_name = asyncio.run(get_thread_agent(thread_id))
-                            if agent_name:
-                                args.agent = agent_name
-                    else:
-                        error_msg = Text("Thread '", style="red")
-                        error_msg.append(args.resume_thread)
-                        error_msg.append("' not found.", style="red")
-                        console.print(error_msg)
-                        console.print(
-                            "[dim]Use 'swe-workflow threads list' to see available threads.[/dim]"
-                        )
-                        sys.exit(1)
-
-                # Generate new thread ID if not resuming
-                if thread_id is None:
-                    thread_id = generate_thread_id()
-
-                # Handle OpenAI-compatible API configuration from command line
-                # If openai-compatible URL is provided, set up the configuration and mark for use
-                if hasattr(args, "openai_compatible_url") and args.openai_compatible_url:
-                    os.environ["OPENAI_COMPATIBLE_URL"] = args.openai_compatible_url
-                    # Update both environment variable and internal setting
-                    settings.openai_compatible_url = args.openai_compatible_url
-                    os.environ["USE_OPENAI_COMPATIBLE"] = (
-                        "1"  # Flag to indicate OpenAI-compatible API usage
-                    )
-                    # If no model was specified but we have an openai-compatible URL,
-                    # we should use a default model or let the config system handle it
-                    if not hasattr(args, "model") or not args.model:
-                        # Default will be used if no --model specified
-                        pass
-
-                # Use the model from --model argument
-                model_name = getattr(args, "model", None)
-
                 # Run Textual CLI
-                asyncio.run(
+                run_coroutine(
                     run_textual_cli_async(
                         assistant_id=args.agent,
                         auto_approve=args.auto_approve,
-                        model_name=model_name,
+                        model_name=args.model,
                         thread_id=thread_id,
                         is_resumed=is_resumed,
-                        initial_prompt=getattr(args, "initial_prompt", None),
+                        initial_prompt=args.initial_prompt,
                     )
                 )
     except KeyboardInterrupt:
+        from .config import console
+
         # Clean exit on Ctrl+C - suppress ugly traceback
         console.print("\n\n[yellow]Interrupted[/yellow]")
         sys.exit(0)
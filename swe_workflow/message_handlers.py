@@ -1,207 +1,238 @@
-"""Message handling strategies using the Strategy pattern to replace if/elif chains."""
-
-import json
-from abc import ABC, abstractmethod
-from typing import Any
-
-
-class MessageHandler(ABC):
-    """Abstract base class for message handling strategies."""
-
-    def __init__(self, next_handler: "MessageHandler" = None):
-        self.next_handler = next_handler
-
-    def set_next(self, handler: "MessageHandler") -> "MessageHandler":
-        """Set the next handler in the chain."""
-        self.next_handler = handler
-        return handler
-
-    async def handle(self, msg: Any, app_instance: Any) -> bool:
-        """Handle a message, returning True if handled, False otherwise."""
-        if self.can_handle(msg):
-            await self._handle_specific(msg, app_instance)
-            return True
-        if self.next_handler:
-            return await self.next_handler.handle(msg, app_instance)
-        return False
-
-    @abstractmethod
-    def can_handle(self, msg: Any) -> bool:
-        """Check if this handler can handle the given message."""
-
-    @abstractmethod
-    async def _handle_specific(self, msg: Any, app_instance: Any) -> None:
-        """Handle the message specifically for this handler type."""
-
-
-class UserMessageHandler(MessageHandler):
-    """Handler for user/human messages."""
-
-    async def _handle_specific(self, msg: Any, app_instance: Any) -> None:
-        content = app_instance._extract_message_content(msg)
-        message_widget = app_instance.UserMessage(content)
-        await app_instance._mount_message(message_widget)
-
-    def can_handle(self, msg: Any) -> bool:
-        msg_class_name = type(msg).__name__.lower()
-        return msg.type == "human" or "human" in msg_class_name or "user" in msg_class_name
-
-
-class AssistantMessageHandler(MessageHandler):
-    """Handler for AI/assistant messages without tool calls."""
-
-    async def _handle_specific(self, msg: Any, app_instance: Any) -> None:
-        content = app_instance._extract_message_content(msg)
-        message_widget = app_instance.AssistantMessage(content)
-        await app_instance._mount_message(message_widget)
-        await message_widget.write_initial_content()
-
-    def can_handle(self, msg: Any) -> bool:
-        msg_class_name = type(msg).__name__.lower()
-        return (msg.type == "ai" or "ai" in msg_class_name or "assistant" in msg_class_name) and not (hasattr(msg, "tool_calls") and msg.tool_calls)
-
-
-class AssistantWithToolCallsMessageHandler(MessageHandler):
-    """Handler for AI/assistant messages with tool calls."""
-
-    async def _handle_specific(self, msg: Any, app_instance: Any) -> None:
-        tool_results = getattr(app_instance, "_tool_results", {})
-
-        for tc in msg.tool_calls:
+"""Rendering of conversation history messages.
+
+`dispatch_message` picks a renderer for each message from a table keyed on the
+message's type tag.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Protocol
+
+    class MessageHandler(Protocol):
+        """Signature shared by the message renderers."""
+
+        async def __call__(self, msg: Any, app_instance: Any) -> None: ...
+
+
+# Canonical message tags, keyed by LangChain's ``msg.type`` discriminator
+_TYPE_TAGS: dict[str, str] = {
+    "human": "human",
+    "HumanMessageChunk": "human",
+    "ai": "ai",
+    "AIMessageChunk": "ai",
+    "tool": "tool",
+    "ToolMessageChunk": "tool",
+    "system": "system",
+    "SystemMessageChunk": "system",
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _class_tag(cls: type) -> str:
+    """Derive a message tag from a class name, for objects with an unrecognized ``type``."""
+    name = cls.__name__.lower()
+    if "human" in name or "user" in name:
+        return "human"
+    if "ai" in name or "assistant" in name:
+        return "ai"
+    if "tool" in name:
+        return "tool"
+    if "system" in name:
+        return "system"
+    return ""
+
+
+def _message_tag(msg: Any) -> str:
+    """Return the canonical tag (``human``, ``ai``, ``tool``, ``system`` or ``""``) for a message."""
+    return _TYPE_TAGS.get(getattr(msg, "type", None)) or _class_tag(type(msg))
+
+
+class MessageRenderContext:
+    """What the renderers need from the app, resolved once per history replay.
+
+    Attribute names mirror the app-side interface the renderers use, so they
+    read plain slots instead of resolving widget classes and bound methods on the
+    app for every message.
+    """
+
+    __slots__ = (
+        "AssistantMessage",
+        "SystemMessage",
+        "ToolCallMessage",
+        "UserMessage",
+        "_extract_message_content",
+        "_mount_message",
+        "_mount_messages",
+        "_tool_results",
+        "_ui_adapter",
+    )
+
+    def __init__(self, app_instance: Any, widgets: Any, tool_results: dict[str, Any]) -> None:
+        """Snapshot the app's helpers and the message widget classes.
+
+        Args:
+            app_instance: The running app; provides ``_mount_message``,
+                ``_mount_messages``, ``_extract_message_content`` and ``_ui_adapter``.
+            widgets: Namespace holding the ``UserMessage``, ``AssistantMessage``,
+                ``ToolCallMessage`` and ``SystemMessage`` widget classes.
+            tool_results: Tool results keyed by tool call ID.
+        """
+        self.UserMessage = widgets.UserMessage
+        self.AssistantMessage = widgets.AssistantMessage
+        self.ToolCallMessage = widgets.ToolCallMessage
+        self.SystemMessage = widgets.SystemMessage
+        self._extract_message_content = app_instance._extract_message_content
+        self._mount_message = app_instance._mount_message
+        self._mount_messages = app_instance._mount_messages
+        self._ui_adapter = app_instance._ui_adapter
+        self._tool_results = tool_results
+
+
+async def render_user_message(msg: Any, app_instance: Any) -> None:
+    """Render a user/human message."""
+    content = app_instance._extract_message_content(msg)
+    message_widget = app_instance.UserMessage(content)
+    await app_instance._mount_message(message_widget)
+
+
+async def render_assistant_message(msg: Any, app_instance: Any) -> None:
+    """Render an AI/assistant message without tool calls."""
+    content = app_instance._extract_message_content(msg)
+    message_widget = app_instance.AssistantMessage(content)
+    await app_instance._mount_message(message_widget)
+    await message_widget.write_initial_content()
+
+
+async def render_tool_calls(msg: Any, app_instance: Any) -> None:
+    """Render the tool calls of an AI/assistant message, with their results if known."""
+    tool_results = getattr(app_instance, "_tool_results", {})
+    ui_adapter = app_instance._ui_adapter
+
+    # Build every tool call widget first so they are mounted in one batch
+    widgets = []
+    finished = []
+    for tc in msg.tool_calls:
+        # LangChain tool calls always carry all three keys; fall back for hand-built ones
+        try:
+            tool_name, tool_args, tool_call_id = tc["name"], tc["args"], tc["id"]
+        except KeyError:
             tool_name = tc.get("name", "unknown")
             tool_args = tc.get("args", {})
-            tool_call_id = tc.get("id", None)
-
-            # Check if there's a corresponding result for this tool call
-            if tool_call_id and tool_call_id in tool_results:
-                # There is a result, so create the tool call widget and immediately set its status
-                message_widget = app_instance.ToolCallMessage(tool_name=tool_name, args=tool_args)
-                await app_instance._mount_message(message_widget)
-
-                # Get the result message and set the status
-                result_msg = tool_results[tool_call_id]
-                result_content = app_instance._extract_message_content(result_msg)
-
-                if hasattr(result_msg, "status") and result_msg.status == "error":
-                    message_widget.set_error(result_content if result_content else "Tool execution failed")
-                else:
-                    message_widget.set_success(result_content if result_content else "Tool executed successfully")
-            else:
-                # No result yet, create pending tool call
-                message_widget = app_instance.ToolCallMessage(tool_name=tool_name, args=tool_args)
-                await app_instance._mount_message(message_widget)
-
-                # Add to current tool messages if we have a UI adapter and tool_call_id
-                if app_instance._ui_adapter and tool_call_id:
-                    app_instance._ui_adapter._current_tool_messages[tool_call_id] = message_widget
-
-    def can_handle(self, msg: Any) -> bool:
-        msg_class_name = type(msg).__name__.lower()
-        return (msg.type == "ai" or "ai" in msg_class_name or "assistant" in msg_class_name) and hasattr(msg, "tool_calls") and msg.tool_calls
-
+            tool_call_id = tc.get("id")
 
-class ToolMessageHandler(MessageHandler):
-    """Handler for tool messages (results from tool calls)."""
+        message_widget = app_instance.ToolCallMessage(tool_name=tool_name, args=tool_args)
+        widgets.append(message_widget)
 
-    async def _handle_specific(self, msg: Any, app_instance: Any) -> None:
-        # This is a ToolMessage (result from a tool call), but we've already handled it
-        # in the AI message processing above, so we skip it here to avoid duplication
-        return
-
-    def can_handle(self, msg: Any) -> bool:
-        msg_class_name = type(msg).__name__.lower()
-        return msg.type == "tool" or "tool" in msg_class_name
+        # Check if there's a corresponding result for this tool call
+        result_msg = tool_results.get(tool_call_id) if tool_call_id else None
+        if result_msg is not None:
+            finished.append((message_widget, result_msg))
+        elif ui_adapter and tool_call_id:
+            # No result yet: track the pending call on the UI adapter
+            ui_adapter._current_tool_messages[tool_call_id] = message_widget
 
+    await app_instance._mount_messages(widgets)
 
-class SystemMessageHandler(MessageHandler):
-    """Handler for system messages."""
+    # Statuses can only be applied once the widgets are mounted
+    for message_widget, result_msg in finished:
+        result_content = app_instance._extract_message_content(result_msg)
 
-    async def _handle_specific(self, msg: Any, app_instance: Any) -> None:
-        content = app_instance._extract_message_content(msg)
-        message_widget = app_instance.SystemMessage(content)
-        await app_instance._mount_message(message_widget)
+        if hasattr(result_msg, "status") and result_msg.status == "error":
+            message_widget.set_error(result_content if result_content else "Tool execution failed")
+        else:
+            message_widget.set_success(result_content if result_content else "Tool executed successfully")
 
-    def can_handle(self, msg: Any) -> bool:
-        msg_class_name = type(msg).__name__.lower()
-        return msg.type == "system" or "system" in msg_class_name
 
+async def render_system_message(msg: Any, app_instance: Any) -> None:
+    """Render a system message."""
+    content = app_instance._extract_message_content(msg)
+    message_widget = app_instance.SystemMessage(content)
+    await app_instance._mount_message(message_widget)
 
-class DefaultMessageHandler(MessageHandler):
-    """Default handler for unrecognized message types."""
 
-    async def _handle_specific(self, msg: Any, app_instance: Any) -> None:
-        content = app_instance._extract_message_content(msg)
-        message_widget = app_instance.SystemMessage(f"[{msg.type}] {content[:200]}")
-        await app_instance._mount_message(message_widget)
+async def render_unknown_message(msg: Any, app_instance: Any) -> None:
+    """Render an unrecognized message type as a truncated system message."""
+    content = app_instance._extract_message_content(msg)
+    message_widget = app_instance.SystemMessage(f"[{msg.type}] {content:.200}")
+    await app_instance._mount_message(message_widget)
 
-    def can_handle(self, msg: Any) -> bool:
-        # This handler can handle any message type as a fallback
-        return True
 
+# Renderers keyed by canonical message tag; AI messages are split on tool calls
+# and tool results are skipped
+_MESSAGE_HANDLERS: dict[str, MessageHandler] = {
+    "human": render_user_message,
+    "system": render_system_message,
+}
 
-def create_message_handler_chain() -> MessageHandler:
-    """Create a chain of message handlers."""
-    user_handler = UserMessageHandler()
-    assistant_handler = AssistantMessageHandler()
-    assistant_tool_handler = AssistantWithToolCallsMessageHandler()
-    tool_handler = ToolMessageHandler()
-    system_handler = SystemMessageHandler()
-    default_handler = DefaultMessageHandler()
 
-    user_handler.set_next(assistant_handler)
-    assistant_handler.set_next(assistant_tool_handler)
-    assistant_tool_handler.set_next(tool_handler)
-    tool_handler.set_next(system_handler)
-    system_handler.set_next(default_handler)
+async def dispatch_message(msg: Any, app_instance: Any) -> None:
+    """Render a message with a single table lookup on its tag.
 
-    return user_handler
+    AI messages are routed on whether they carry tool calls; unknown types
+    fall back to `render_unknown_message`.
+    """
+    tag = _message_tag(msg)
+    if tag == "tool":
+        # Tool results are rendered with the AI message that issued the call
+        return
+    if tag == "ai":
+        handler = render_tool_calls if getattr(msg, "tool_calls", None) else render_assistant_message
+    else:
+        handler = _MESSAGE_HANDLERS.get(tag, render_unknown_message)
+    await handler(msg, app_instance)
+
+
+def extract_content(msg: Any) -> str:
+    """Extract the text content of a message, whatever shape it is stored in."""
+    if hasattr(msg, "content"):
+        msg_content = msg.content
+        # Most messages carry plain string content
+        if type(msg_content) is str:
+            return msg_content
+
+        if isinstance(msg_content, list):
+            # Handle content as a list of message parts; join once at the end
+            # rather than growing a string per part
+            parts: list[str] = []
+            append = parts.append
+            for part in msg_content:
+                if isinstance(part, str):
+                    append(part)
+                elif isinstance(part, dict):
+                    # Handle dictionary content
+                    if "text" in part:
+                        append(str(part["text"]))
+                    elif "content" in part:
+                        append(str(part["content"]))
+                    else:
+                        append(str(part))
+                elif hasattr(part, "text"):
+                    append(str(part.text))
+                elif hasattr(part, "data"):
+                    append(str(part.data))
+                else:
+                    append(str(part))
+            return "".join(parts)
+        if hasattr(msg_content, "__iter__") and not isinstance(msg_content, str):
+            # Handle other iterable content
+            try:
+                return "".join([str(item) for item in msg_content])
+            except TypeError:
+                # If iteration fails, convert to string directly
+                return str(msg_content)
+        # Handle simple string content
+        return str(msg_content)
+    if hasattr(msg, "text"):  # For some message types that use 'text' instead of 'content'
+        return str(getattr(msg, "text", ""))
+    # If no known content attribute, convert the whole message to string
+    return str(msg)
 
 
 class ContentExtractor:
     """Strategy for extracting content from different message types."""
 
-    @staticmethod
-    def extract_content(msg: Any) -> str:
-        """Extract content from a message using appropriate strategy."""
-        content = ""
-        msg_class_name = type(msg).__name__.lower()
-
-        if hasattr(msg, "content"):
-            msg_content = msg.content
-
-            if isinstance(msg_content, list):
-                # Handle content as a list of message parts
-                for part in msg_content:
-                    if isinstance(part, str):
-                        content += part
-                    elif isinstance(part, dict):
-                        # Handle dictionary content
-                        if "text" in part:
-                            content += str(part["text"])
-                        elif "content" in part:
-                            content += str(part["content"])
-                        else:
-                            content += str(part)
-                    elif hasattr(part, "text"):
-                        content += str(part.text)
-                    elif hasattr(part, "data"):
-                        content += str(part.data)
-                    else:
-                        content += str(part)
-            elif hasattr(msg_content, "__iter__") and not isinstance(msg_content, str):
-                # Handle other iterable content
-                try:
-                    content = "".join(str(item) for item in msg_content)
-                except TypeError:
-                    # If iteration fails, convert to string directly
-                    content = str(msg_content)
-            else:
-                # Handle simple string content
-                content = str(msg_content)
-        elif hasattr(msg, "text"):  # For some message types that use 'text' instead of 'content'
-            content = str(getattr(msg, "text", ""))
-        else:
-            # If no known content attribute, convert the whole message to string
-            content = str(msg)
-
-        return content
+    extract_content = staticmethod(extract_content)
@@ -1,16 +1,63 @@
 """Model selection strategies using the Strategy and Chain of Responsibility patterns."""
 
+import functools
+import os
+import re
+import sys
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
 from langchain_core.language_models import BaseChatModel
 
+from .config import _detect_provider
+
 if TYPE_CHECKING:
     from rich.console import Console
 
     from .config import Settings
 
 
+class _DefaultModels(NamedTuple):
+    """Per-provider default model names, taken from the environment."""
+
+    openai_compatible: str
+    openai: str
+    anthropic: str
+    google: str
+
+
+@functools.cache
+def _default_models() -> _DefaultModels:
+    """Read the ``*_MODEL`` environment defaults once, on first model selection.
+
+    ``USE_OPENAI_COMPATIBLE`` is deliberately not cached: the CLI sets it from
+    ``--openai-compatible-url`` at runtime.
+    """
+    return _DefaultModels(
+        openai_compatible=os.environ.get("OPENAI_COMPATIBLE_MODEL", "llama3"),  # Default OpenAI-compatible model
+        openai=os.environ.get("OPENAI_MODEL", "gpt-5-mini"),
+        anthropic=os.environ.get("ANTHROPIC_MODEL", "claude-sonnet-4-5-20250929"),
+        google=os.environ.get("GOOGLE_MODEL", "gemini-3-pro-preview"),
+    )
+
+
+# Per provider: Settings flag that must be true, error text, and extra hint lines
+_PROVIDER_REQUIREMENTS: dict[str, tuple[str, str, tuple[str, ...]]] = {
+    "openai": ("has_openai", "requires OPENAI_API_KEY", ()),
+    "anthropic": ("has_anthropic", "requires ANTHROPIC_API_KEY", ()),
+    "google": ("has_google", "requires GOOGLE_API_KEY", ()),
+    "openai-compatible": (
+        "has_openai_compatible",
+        "requires OPENAI_COMPATIBLE_URL to be set",
+        (
+            "\nPlease set the OPENAI_COMPATIBLE_URL environment variable:",
+            "  export OPENAI_COMPATIBLE_URL=http://localhost:11434/v1  # Ollama example",
+            "  export OPENAI_COMPATIBLE_URL=http://localhost:8000/v1    # LocalAI/vLLM example",
+        ),
+    ),
+}
+
+
 class ModelSelectionStrategy(ABC):
     """Abstract base class for model selection strategies."""
 
@@ -63,68 +110,21 @@ class ModelOverrideStrategy(ModelSelectionStrategy):
 
     def _detect_provider(self, model_name: str) -> str | None:
         """Auto-detect provider from model name."""
-        model_lower = model_name.lower()
-        if any(x in model_lower for x in ["gpt", "o1", "o3"]):
-            return "openai"
-        if "claude" in model_lower:
-            return "anthropic"
-        if "gemini" in model_lower:
-            return "google"
-        # Check for OpenAI-compatible API patterns - includes legacy patterns too for backward compatibility
-        if any(
-            x in model_lower
-            for x in [
-                "ollama",
-                "local:",
-                "llama",
-                "mistral",
-                "phi",
-                "yi",
-                "deepseek",
-                "mixtral",
-                "codellama",
-                "wizardlm",
-                "vicuna",
-                "zephyr",
-                "qwen",
-                "devstral",
-                "minimax",
-            ]
-        ):
-            return "openai-compatible"
-        return None
+        return _detect_provider(model_name)
 
     def _use_openai_compatible_flag(self) -> bool:
         """Check if OpenAI-compatible flag is set."""
-        import os
-
         return bool(os.environ.get("USE_OPENAI_COMPATIBLE"))  # Fixed typo from "USE_OPENAI_COMPATIBLE" to "USE_OPENAI_COMPATIBLE"
 
     def _validate_provider_access(self, provider: str, model_name_override: str) -> None:
         """Validate that the provider has the required API keys."""
-        if provider == "openai" and not self.settings.has_openai:
-            self.console.print(f"[bold red]Error:[/bold red] Model '{model_name_override}' requires OPENAI_API_KEY")
-            import sys
-
-            sys.exit(1)
-        elif provider == "anthropic" and not self.settings.has_anthropic:
-            self.console.print(f"[bold red]Error:[/bold red] Model '{model_name_override}' requires ANTHROPIC_API_KEY")
-            import sys
-
-            sys.exit(1)
-        elif provider == "google" and not self.settings.has_google:
-            self.console.print(f"[bold red]Error:[/bold red] Model '{model_name_override}' requires GOOGLE_API_KEY")
-            import sys
-
-            sys.exit(1)
-        elif provider == "openai-compatible" and not self.settings.has_openai_compatible:
-            self.console.print(f"[bold red]Error:[/bold red] Model '{model_name_override}' requires OPENAI_COMPATIBLE_URL to be set")
-            self.console.print("\nPlease set the OPENAI_COMPATIBLE_URL environment variable:")
-            self.console.print("  export OPENAI_COMPATIBLE_URL=http://localhost:11434/v1  # Ollama example")
-            self.console.print("  export OPENAI_COMPATIBLE_URL=http://localhost:8000/v1    # LocalAI/vLLM example")
-            import sys
-
-            sys.exit(1)
+        settings_flag, requirement, hint = _PROVIDER_REQUIREMENTS[provider]
+        if getattr(self.settings, settings_flag):
+            return
+        self.console.print(f"[bold red]Error:[/bold red] Model '{model_name_override}' {requirement}")
+        for line in hint:
+            self.console.print(line)
+        sys.exit(1)
 
     def _print_error_and_exit(self, model_name_override: str) -> None:
         """Print error message and exit when provider detection fails."""
@@ -135,8 +135,6 @@ class ModelOverrideStrategy(ModelSelectionStrategy):
         self.console.print("  - Google: gemini-*")
         self.console.print("  - OpenAI-compatible: ollama:<model>, local:<model>, llama*, mistral*, etc. (when OpenAI-compatible API is configured)")
         self.console.print("\nAlternatively, configure OpenAI-compatible API with --openai-compatible-url and --model")
-        import sys
-
         sys.exit(1)
 
 
@@ -149,24 +147,22 @@ class EnvironmentBasedStrategy(ModelSelectionStrategy):
 
         # Use environment variable defaults, detect provider by API key priority
         # Check for OpenAI-compatible API first if configured
-        import os
-
         if self.settings.has_openai_compatible and os.environ.get("USE_OPENAI_COMPATIBLE"):
             provider = "openai-compatible"
             # If no specific model was provided via model_name_override, use the default
-            model_name = os.environ.get("OPENAI_COMPATIBLE_MODEL", "llama3")  # Default OpenAI-compatible model
+            model_name = _default_models().openai_compatible
         elif self.settings.has_openai:
             provider = "openai"
-            model_name = os.environ.get("OPENAI_MODEL", "gpt-5-mini")
+            model_name = _default_models().openai
         elif self.settings.has_anthropic:
             provider = "anthropic"
-            model_name = os.environ.get("ANTHROPIC_MODEL", "claude-sonnet-4-5-20250929")
+            model_name = _default_models().anthropic
         elif self.settings.has_google:
             provider = "google"
-            model_name = os.environ.get("GOOGLE_MODEL", "gemini-3-pro-preview")
+            model_name = _default_models().google
         elif self.settings.has_openai_compatible:
             provider = "openai-compatible"
-            model_name = os.environ.get("OPENAI_COMPATIBLE_MODEL", "llama3")  # Default OpenAI-compatible model
+            model_name = _default_models().openai_compatible
         else:
             self._print_no_api_key_error()
             return None  # This won't return due to sys.exit
@@ -186,8 +182,6 @@ class EnvironmentBasedStrategy(ModelSelectionStrategy):
         self.console.print("  export OPENAI_API_KEY=your_api_key_here")
         self.console.print("  export OPENAI_COMPATIBLE_URL=http://localhost:11434/v1")
         self.console.print("\nOr add them to your .env file.")
-        import sys
-
         sys.exit(1)
 
 
@@ -196,40 +190,87 @@ class ModelFactory:
 
     @staticmethod
     def create_model(provider: str, model_name: str, settings: "Settings") -> BaseChatModel:
-        """Create a model instance based on provider and model name."""
-        if provider == "openai":
-            from langchain_openai import ChatOpenAI
-
-            return ChatOpenAI(model=model_name)
-        elif provider == "anthropic":
-            from langchain_anthropic import ChatAnthropic
-
-            return ChatAnthropic(
-                model_name=model_name,
-                max_tokens=20_000,  # type: ignore[arg-type]
-            )
-        elif provider == "google":
-            from langchain_google_genai import ChatGoogleGenerativeAI
-
-            return ChatGoogleGenerativeAI(
-                model=model_name,
-                temperature=0,
-                max_tokens=None,
-            )
-        elif provider == "openai-compatible":
-            from langchain_openai import ChatOpenAI
-
-            # Use the OpenAI-compatible configuration
-            # For OpenAI-compatible providers, just use the model name directly (remove prefixes if present)
-            clean_model_name = model_name.replace("openai-compatible:", "").replace("local:", "")
-            return ChatOpenAI(
-                model=clean_model_name,
-                base_url=settings.openai_compatible_url,
-                api_key=settings.openai_compatible_api_key,
-                temperature=0.7,  # Default temperature for OpenAI-compatible models
-            )
-        else:
-            raise ValueError(f"Unsupported provider: {provider}")
+        """Create a model instance based on provider and model name.
+
+        Clients are shared per configuration, so repeated calls in one process reuse
+        the same client and its HTTP connection pool. The credentials a client reads
+        from the environment are part of the configuration, so a changed key builds
+        a new client.
+        """
+        if provider == "openai-compatible":
+            return _create_model_cached(provider, model_name, settings.openai_compatible_url, settings.openai_compatible_api_key)
+        credentials = tuple(os.environ.get(name) for name in _PROVIDER_CREDENTIAL_ENV.get(provider, ()))
+        return _create_model_cached(provider, model_name, None, None, credentials)
+
+
+# Environment variables each provider's client reads its credentials from when it is built
+_PROVIDER_CREDENTIAL_ENV: dict[str, tuple[str, ...]] = {
+    "openai": ("OPENAI_API_KEY",),
+    "anthropic": ("ANTHROPIC_API_KEY",),
+    "google": ("GOOGLE_API_KEY",),
+}
+
+
+# Provider prefixes accepted on OpenAI-compatible model names (e.g. "local:llama3")
+_COMPAT_PREFIX_RE = re.compile(r"^(?:openai-compatible:|local:)+")
+
+
+@functools.lru_cache(maxsize=16)
+def _create_model_cached(
+    provider: str,
+    model_name: str,
+    openai_compatible_url: Optional[str],
+    openai_compatible_api_key: Optional[str],
+    credentials: tuple[Optional[str], ...] = (),  # noqa: ARG001
+) -> BaseChatModel:
+    """Build a chat model client; arguments are hashable so results can be cached.
+
+    ``credentials`` only keys the cache: the client still reads them from the environment.
+    """
+    if provider == "openai":
+        from langchain_openai import ChatOpenAI
+
+        return ChatOpenAI(model=model_name)
+    elif provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(
+            model_name=model_name,
+            max_tokens=20_000,  # type: ignore[arg-type]
+        )
+    elif provider == "google":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(
+            model=model_name,
+            temperature=0,
+            max_tokens=None,
+        )
+    elif provider == "openai-compatible":
+        from langchain_openai import ChatOpenAI
+
+        # Use the OpenAI-compatible configuration
+        # For OpenAI-compatible providers, just use the model name directly (remove prefixes if present)
+        clean_model_name = _COMPAT_PREFIX_RE.sub("", model_name, count=1)
+        return ChatOpenAI(
+            model=clean_model_name,
+            base_url=openai_compatible_url,
+            api_key=openai_compatible_api_key,
+            temperature=0.7,  # Default temperature for OpenAI-compatible models
+        )
+    else:
+        raise ValueError(f"Unsupported provider: {provider}")
+
+
+def select_model(settings: "Settings", console: "Console", model_name_override: Optional[str] = None) -> Optional[tuple[str, str]]:
+    """Select (provider, model_name) without building a strategy chain.
+
+    Equivalent to ``create_model_selection_chain(settings, console).execute(model_name_override)``:
+    an override is always resolved by `ModelOverrideStrategy`, otherwise by `EnvironmentBasedStrategy`.
+    """
+    if model_name_override:
+        return ModelOverrideStrategy(settings, console)._try_select_model(model_name_override)
+    return EnvironmentBasedStrategy(settings, console)._try_select_model()
 
 
 def create_model_selection_chain(settings: "Settings", console: "Console") -> ModelSelectionStrategy:
@@ -1,24 +1,78 @@
 """Non-interactive mode execution for swe-workflow."""
 
 import asyncio
-import json
+import functools
+import io
+import os
+import sys
 from datetime import UTC, datetime
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
-from langgraph.types import Command, Interrupt
-from pydantic import TypeAdapter
+from langgraph.types import Command
 
+from ._paths import user_cache_dir
 from .agent import create_cli_agent
 from .config import create_model, settings
 from .file_ops import FileOpTracker
-from .image_utils import create_multimodal_content
 from .input import ImageTracker, parse_file_mentions
 from .sessions import get_checkpointer, generate_thread_id
 from .tools import fetch_url, http_request
 
+if TYPE_CHECKING:
+    from langgraph.types import Interrupt
 
-_HITL_REQUEST_ADAPTER = TypeAdapter(dict)  # Simplified for non-interactive mode
+
+def _file_context_section(file_path: Path, max_embed_bytes: int) -> str:
+    """Render one ``@``-mentioned file as a prompt section.
+
+    Reads at most ``max_embed_bytes + 1`` bytes; files larger than the limit are
+    referenced by path and size instead of embedded.
+    """
+    try:
+        with file_path.open("rb") as f:
+            data = f.read(max_embed_bytes + 1)
+            if len(data) > max_embed_bytes:
+                # File too large - include reference instead of content
+                size_kb = os.fstat(f.fileno()).st_size // 1024
+                return f"\n### {file_path.name}\nPath: `{file_path}`\nSize: {size_kb}KB (too large to embed, use read_file tool to view)"
+        content = data.decode("utf-8")
+        if "\r" in content:
+            # Match text-mode newline translation
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+    except Exception as e:
+        return f"\n### {file_path.name}\n[Error reading file: {e}]"
+    return f"\n### {file_path.name}\nPath: `{file_path}`\n```\n{content}\n```"
+
+
+@functools.cache
+def _install_llm_cache() -> bool:
+    """Install the process-wide LangChain response cache once.
+
+    Responses are kept in a SQLite database in the user cache directory, so
+    identical prompts are answered across runs. This needs ``langchain-community``
+    (the ``llm-cache`` extra); without it a notice is printed and nothing is
+    cached, since an in-memory cache would not outlive this one-shot process.
+
+    Returns:
+        bool: True if the cache was installed
+    """
+    try:
+        from langchain_community.cache import SQLiteCache
+    except ImportError:
+        print(
+            "SWE_WORKFLOW_LLM_CACHE is set but langchain-community is not installed; "
+            "responses will not be cached. Install it with: pip install 'swe-workflow[llm-cache]'",
+            file=sys.stderr,
+        )
+        return False
+
+    from langchain_core.globals import set_llm_cache
+
+    cache_dir = user_cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    set_llm_cache(SQLiteCache(database_path=str(cache_dir / "llm_cache.db")))
+    return True
 
 
 async def execute_task_non_interactive(
@@ -44,7 +98,10 @@ async def execute_task_non_interactive(
     Returns:
         bool: True if successful, False otherwise
     """
-    from .non_interactive_handlers import create_message_type_handler_chain
+    from .non_interactive_handlers import BufferedPrinter, dispatch_message_type
+
+    # Coalesce streamed tokens instead of flushing stdout on every chunk
+    stream_print = BufferedPrinter()
     try:
         # Parse file mentions and inject content if any
         prompt_text, mentioned_files = parse_file_mentions(user_input)
@@ -54,20 +111,16 @@ async def execute_task_non_interactive(
         max_embed_bytes = 256 * 1024
 
         if mentioned_files:
-            context_parts = [prompt_text, "\n\n## Referenced Files\n"]
-            for file_path in mentioned_files:
-                try:
-                    file_size = file_path.stat().st_size
-                    if file_size > max_embed_bytes:
-                        # File too large - include reference instead of content
-                        size_kb = file_size // 1024
-                        context_parts.append(f"\n### {file_path.name}\nPath: `{file_path}`\nSize: {size_kb}KB (too large to embed, use read_file tool to view)")
-                    else:
-                        content = file_path.read_text()
-                        context_parts.append(f"\n### {file_path.name}\nPath: `{file_path}`\n```\n{content}\n```")
-                except Exception as e:
-                    context_parts.append(f"\n### {file_path.name}\n[Error reading file: {e}]")
-            final_input = "\n".join(context_parts)
+            # Sections are separated by newlines; the message is materialized once
+            buf = io.StringIO()
+            buf.write(prompt_text)
+            buf.write("\n\n\n## Referenced Files\n")
+            # Read the files concurrently off the event loop; gather keeps input order
+            sections = await asyncio.gather(*(asyncio.to_thread(_file_context_section, file_path, max_embed_bytes) for file_path in mentioned_files))
+            for section in sections:
+                buf.write("\n")
+                buf.write(section)
+            final_input = buf.getvalue()
         else:
             final_input = prompt_text
 
@@ -76,6 +129,8 @@ async def execute_task_non_interactive(
         if image_tracker:
             images_to_send = image_tracker.get_images()
         if images_to_send:
+            from .image_utils import create_multimodal_content
+
             message_content = create_multimodal_content(final_input, images_to_send)
         else:
             message_content = final_input
@@ -94,12 +149,12 @@ async def execute_task_non_interactive(
         file_op_tracker = FileOpTracker(assistant_id=assistant_id, backend=backend)
         tool_call_buffers = {}
 
-        stream_input: dict | Command = {"messages": [{"role": "user", "content": message_content}]}
-
+        next_input: dict | Command | None = {"messages": [{"role": "user", "content": message_content}]}
 
-        while True:
-            interrupt_occurred = False
-            hitl_response: dict[str, Any] = {}
+        # Each pass streams until the graph finishes or pauses on an interrupt;
+        # an interrupt queues the auto-approve resume as the next pass's input
+        while next_input is not None:
+            stream_input, next_input = next_input, None
 
             async for chunk in agent.astream(
                 stream_input,
@@ -113,32 +168,28 @@ async def execute_task_non_interactive(
 
                 namespace, current_stream_mode, data = chunk
 
-                # Filter out subagent outputs - only show main agent (empty namespace)
-                # Subagents run via Task tool and should only report back to the main agent
-                is_main_agent = namespace == () or namespace == []
-
                 # Handle UPDATES stream - for interrupts and todos
                 if current_stream_mode == "updates":
                     if not isinstance(data, dict):
                         continue
 
                     # Check for interrupts
-                    if "__interrupt__" in data:
-                        interrupts: list[Interrupt] = data["__interrupt__"]
-                        if interrupts:
-                            for interrupt_obj in interrupts:
-                                interrupt_occurred = True
+                    interrupts: list[Interrupt] | None = data.get("__interrupt__")
+                    if interrupts:
+                        # Empty resume for auto-approve
+                        next_input = Command(resume={})
 
                     # Check for todo updates (not yet implemented in non-interactive mode)
                     chunk_data = next(iter(data.values())) if data else None
                     if chunk_data and isinstance(chunk_data, dict) and "todos" in chunk_data:
                         pass  # Future: handle todo updates
 
-                # Handle MESSAGES stream - for content and tool calls using strategy pattern
+                # Handle MESSAGES stream - for content and tool calls
                 elif current_stream_mode == "messages":
                     
-                    # Skip subagent outputs - only process main agent content
-                    if not is_main_agent:
+                    # Skip subagent outputs - only show main agent (empty namespace)
+                    # Subagents run via Task tool and should only report back to the main agent
+                    if namespace:
                         continue
 
                     if not isinstance(data, tuple) or len(data) != 2:
@@ -146,43 +197,41 @@ async def execute_task_non_interactive(
 
                     message, _metadata = data
 
-                    # Process message using the handler chain
-                    handler_chain = create_message_type_handler_chain()
-                    handler_chain.handle(message, file_op_tracker, tool_call_buffers, print)
-
-            # Handle HITL after stream completes
-            if interrupt_occurred:
-                # In non-interactive mode with auto-approve, we auto-approve everything
-                if auto_approve:
-                    # Since we're in auto-approve mode, we continue without user interaction
-                    stream_input = Command(resume={})  # Empty resume for auto-approve
-                else:
-                    # This shouldn't happen in non-interactive mode without auto-approve
-                    print("Error: Non-interactive mode requires auto-approve for HITL requests")
-                    return False
-            else:
-                break
+                    # Process message with one dispatch-table lookup
+                    dispatch_message_type(message, file_op_tracker, tool_call_buffers, stream_print)
+
+            stream_print.flush()
+
+            if next_input is not None and not auto_approve:
+                # This shouldn't happen in non-interactive mode without auto-approve
+                print("Error: Non-interactive mode requires auto-approve for HITL requests")
+                return False
 
         print("\n[COMPLETE] Task execution finished")
         return True
 
     except KeyboardInterrupt:
+        stream_print.flush()
         print("\n[INTERRUPTED] Task was interrupted by user")
         return False
     except Exception as e:
+        stream_print.flush()
         print(f"\n[ERROR] Task execution failed: {e}")
         return False
 
 
-async def run_non_interactive_mode(
+async def _run_core(
     task: str,
     assistant_id: str,
-    auto_approve: bool = True,
-    model_name: str | None = None,
-    thread_id: str | None = None,
-    initial_prompt: str | None = None,
-) -> None:
-    """Run the agent in non-interactive mode.
+    auto_approve: bool,
+    model_name: str | None,
+    thread_id: str,
+    initial_prompt: str | None,
+    *,
+    banner: str,
+    reraise: bool,
+) -> int:
+    """Build the agent and run one non-interactive task.
 
     Args:
         task: The task to execute
@@ -191,14 +240,18 @@ async def run_non_interactive_mode(
         model_name: Optional model name to use
         thread_id: Thread ID to use (new or resumed)
         initial_prompt: Optional initial prompt to execute
+        banner: Line printed once the model is ready
+        reraise: Re-raise setup/execution errors instead of returning 1
+
+    Returns:
+        int: Exit code (0 for success, 1 for failure)
     """
-    model = create_model(model_name)
+    if settings.llm_cache_enabled:
+        _install_llm_cache()
 
-    # Generate or use provided thread ID
-    if thread_id is None:
-        thread_id = generate_thread_id()
+    model = create_model(model_name)
 
-    print(f"Starting non-interactive task with thread: {thread_id}")
+    print(banner)
 
     # Use async context manager for checkpointer
     async with get_checkpointer() as checkpointer:
@@ -216,23 +269,59 @@ async def run_non_interactive_mode(
 
             # Execute the task
             task_to_run = initial_prompt or task
-            if task_to_run:
-                await execute_task_non_interactive(
-                    user_input=task_to_run,
-                    agent=agent,
-                    assistant_id=assistant_id,
-                    thread_id=thread_id,
-                    backend=composite_backend,
-                    auto_approve=auto_approve,
-                )
-            else:
+            if not task_to_run:
                 print("No task provided to execute")
+                return 1
+
+            success = await execute_task_non_interactive(
+                user_input=task_to_run,
+                agent=agent,
+                assistant_id=assistant_id,
+                thread_id=thread_id,
+                backend=composite_backend,
+                auto_approve=auto_approve,
+            )
+            return 0 if success else 1
 
         except Exception as e:
             print(f"❌ Failed to execute task: {e}")
-            raise
-        finally:
-            pass
+            if reraise:
+                raise
+            return 1
+
+
+async def run_non_interactive_mode(
+    task: str,
+    assistant_id: str,
+    auto_approve: bool = True,
+    model_name: str | None = None,
+    thread_id: str | None = None,
+    initial_prompt: str | None = None,
+) -> None:
+    """Run the agent in non-interactive mode.
+
+    Args:
+        task: The task to execute
+        assistant_id: Agent identifier for memory storage
+        auto_approve: Whether to auto-approve tool usage
+        model_name: Optional model name to use
+        thread_id: Thread ID to use (new or resumed)
+        initial_prompt: Optional initial prompt to execute
+    """
+    # Generate or use provided thread ID
+    if thread_id is None:
+        thread_id = generate_thread_id()
+
+    await _run_core(
+        task,
+        assistant_id,
+        auto_approve,
+        model_name,
+        thread_id,
+        initial_prompt,
+        banner=f"Starting non-interactive task with thread: {thread_id}",
+        reraise=True,
+    )
 
 
 async def run_non_interactive_with_resume(
@@ -256,53 +345,21 @@ async def run_non_interactive_with_resume(
     Returns:
         int: Exit code (0 for success, 1 for failure)
     """
-    model = create_model(model_name)
-
     # Use provided thread ID or generate a new one
-    thread_id = resume_thread_id if resume_thread_id is not None else generate_thread_id()
-    is_resumed = resume_thread_id is not None
-
-    if is_resumed:
-        print(f"Resuming non-interactive task with thread: {thread_id}")
+    if resume_thread_id is not None:
+        thread_id = resume_thread_id
+        banner = f"Resuming non-interactive task with thread: {thread_id}"
     else:
-        print(f"Starting new non-interactive task with thread: {thread_id}")
-
-    # Use async context manager for checkpointer
-    async with get_checkpointer() as checkpointer:
-        # Create agent with conditional tools
-        tools = [http_request, fetch_url]
-
-        try:
-            agent, composite_backend = create_cli_agent(
-                model=model,
-                assistant_id=assistant_id,
-                tools=tools,
-                auto_approve=auto_approve,  # Critical for non-interactive mode
-                checkpointer=checkpointer,
-            )
-
-            # Execute the task
-            task_to_run = initial_prompt or task
-            if task_to_run:
-                success = await execute_task_non_interactive(
-                    user_input=task_to_run,
-                    agent=agent,
-                    assistant_id=assistant_id,
-                    thread_id=thread_id,
-                    backend=composite_backend,
-                    auto_approve=auto_approve,
-                )
-
-                if not success:
-                    return 1  # Exit with error code
-            else:
-                print("No task provided to execute")
-                return 1  # Exit with error code
-
-        except Exception as e:
-            print(f"❌ Failed to execute task: {e}")
-            return 1  # Exit with error code
-        finally:
-            pass
-
-    return 0  # Exit with success code
+        thread_id = generate_thread_id()
+        banner = f"Starting new non-interactive task with thread: {thread_id}"
+
+    return await _run_core(
+        task,
+        assistant_id,
+        auto_approve,
+        model_name,
+        thread_id,
+        initial_prompt,
+        banner=banner,
+        reraise=False,
+    )
@@ -1,12 +1,85 @@
 """Non-interactive message handling strategies using the Strategy pattern to replace if/elif chains."""
 
+import asyncio
+import json
+import sys
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Callable
+from typing import Any, TextIO
+
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
+
+from .content_block_handlers import _CONTENT_BLOCK_HANDLERS, parse_tool_args
+
+
+class BufferedPrinter:
+    """A ``print``-compatible writer that coalesces streamed output.
+
+    On a terminal, text is accumulated in memory and written out at the end of
+    a line, once ``max_bytes`` have been buffered, when a caller passes
+    ``flush=True``, or on `flush`. A partial line is written at most
+    ``max_delay`` seconds after it was buffered, even if the stream stalls;
+    outside a running event loop it is written immediately. When output is
+    redirected, text goes straight into the stream's own block buffer, which
+    is only flushed on request.
+    """
+
+    def __init__(self, stream: TextIO | None = None, *, max_bytes: int = 4096, max_delay: float = 0.02) -> None:
+        self._stream = stream
+        self._max_bytes = max_bytes
+        self._max_delay = max_delay
+        self._parts: list[str] = []
+        self._size = 0
+        self._pending_flush: asyncio.TimerHandle | None = None
+        self._interactive: bool | None = None
+
+    def _is_interactive(self, stream: TextIO) -> bool:
+        if self._interactive is None:
+            try:
+                self._interactive = stream.isatty()
+            except (AttributeError, ValueError):
+                self._interactive = False
+        return self._interactive
+
+    def __call__(self, *values: Any, sep: str = " ", end: str = "\n", flush: bool = False) -> None:
+        """Buffer ``values`` the way ``print`` would format them."""
+        text = sep.join(map(str, values)) + end
+        stream = self._stream or sys.stdout
+        if not self._is_interactive(stream):
+            stream.write(text)
+            if flush:
+                stream.flush()
+            return
+        self._parts.append(text)
+        self._size += len(text)
+        if flush or "\n" in text or self._size >= self._max_bytes:
+            self.flush()
+        elif self._pending_flush is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self.flush()
+                return
+            self._pending_flush = loop.call_later(self._max_delay, self.flush)
+
+    def flush(self) -> None:
+        """Write any buffered text to the stream and flush it."""
+        if self._pending_flush is not None:
+            self._pending_flush.cancel()
+            self._pending_flush = None
+        stream = self._stream or sys.stdout
+        if self._parts:
+            stream.write("".join(self._parts))
+            self._parts.clear()
+            self._size = 0
+        stream.flush()
 
 
 class StreamModeHandler(ABC):
     """Abstract base class for stream mode handling strategies."""
 
+    __slots__ = ("next_handler",)
+
     def __init__(self, next_handler: "StreamModeHandler" = None):
         self.next_handler = next_handler
 
@@ -37,6 +110,8 @@ class StreamModeHandler(ABC):
 class MessagesStreamHandler(StreamModeHandler):
     """Handler for MESSAGES stream mode."""
 
+    __slots__ = ()
+
     def can_handle(self, current_stream_mode: str) -> bool:
         return current_stream_mode == "messages"
 
@@ -50,11 +125,8 @@ class MessagesStreamHandler(StreamModeHandler):
 
         message, _metadata = data
 
-        # Process messages using message handlers
-        from .message_type_handlers import create_message_type_handler_chain
-
-        handler_chain = create_message_type_handler_chain()
-        handler_chain.handle(message, file_op_tracker, tool_call_buffers, print_func)
+        # Process messages through the module-level dispatch table
+        dispatch_message_type(message, file_op_tracker, tool_call_buffers, print_func)
 
 
 def create_stream_mode_handler_chain() -> StreamModeHandler:
@@ -67,6 +139,8 @@ def create_stream_mode_handler_chain() -> StreamModeHandler:
 class MessageTypeHandler(ABC):
     """Abstract base class for message type handling strategies."""
 
+    __slots__ = ("next_handler",)
+
     def __init__(self, next_handler: "MessageTypeHandler" = None):
         self.next_handler = next_handler
 
@@ -96,68 +170,72 @@ class MessageTypeHandler(ABC):
 class ToolMessageHandler(MessageTypeHandler):
     """Handler for ToolMessage instances."""
 
-    def can_handle(self, message: Any) -> bool:
-        from langchain_core.messages import ToolMessage
+    __slots__ = ()
 
-        return isinstance(message, ToolMessage)
+    def can_handle(self, message: Any) -> bool:
+        # Exact-type checks settle the common cases; isinstance only sees subclasses
+        t = type(message)
+        return t is ToolMessage or (t is not AIMessageChunk and t is not AIMessage and isinstance(message, ToolMessage))
 
     def _handle_specific(self, message: Any, file_op_tracker: Any, tool_call_buffers: dict, print_func: Any) -> None:
-        tool_name = getattr(message, "name", "")
-        tool_status = getattr(message, "status", "success")
-        tool_content = getattr(message, "content", "")
-
-        # Print tool execution results
-        content_str = str(tool_content)
-        content_preview = content_str[:200] + "..." if len(content_str) > 200 else content_str
-        print_func(f"[TOOL] {tool_name}: {content_preview}")
+        # ToolMessage always defines these fields, so read them directly
+        tool_name = message.name
+        tool_status = message.status
+        tool_content = message.content
+
+        # Tool execution results; convert the content to text only once
+        content_str = tool_content if type(tool_content) is str else str(tool_content)
+        if len(content_str) > 200:
+            output = f"[TOOL] {tool_name}: {content_str:.200}...\n"
+        else:
+            output = f"[TOOL] {tool_name}: {content_str}\n"
 
         # Complete file operation tracking
-        record = file_op_tracker.complete_with_message(message)
+        file_op_tracker.complete_with_message(message)
 
         # Update tool call status
-        tool_id = getattr(message, "tool_call_id", None)
-        if tool_id:
-            # Print tool result
+        if message.tool_call_id:
+            # Tool result
             if tool_status == "success":
-                print_func(f"[SUCCESS] Tool {tool_name} completed successfully")
+                output += f"[SUCCESS] Tool {tool_name} completed successfully\n"
             else:
-                print_func(f"[ERROR] Tool {tool_name} failed: {tool_content}")
-        # Add a newline after tool output to separate from agent response
-        print_func()
+                output += f"[ERROR] Tool {tool_name} failed: {content_str}\n"
+        # Write everything at once, with a blank line to separate from the agent response
+        print_func(output, flush=True)
 
 
 class AIAndAIMessageChunkHandler(MessageTypeHandler):
     """Handler for AIMessageChunk and AIMessage instances."""
 
-    def can_handle(self, message: Any) -> bool:
-        from langchain_core.messages import AIMessage, AIMessageChunk
+    __slots__ = ()
 
-        return isinstance(message, (AIMessageChunk, AIMessage))
+    def can_handle(self, message: Any) -> bool:
+        t = type(message)
+        return t is AIMessageChunk or t is AIMessage or (t is not ToolMessage and isinstance(message, AIMessage))
 
     def _handle_specific(self, message: Any, file_op_tracker: Any, tool_call_buffers: dict, print_func: Any) -> None:
-        # Process content blocks using content block handlers
-        from .content_block_handlers import create_arg_parsing_chain, create_content_block_handler_chain
-
-        block_handler_chain = create_content_block_handler_chain()
-        arg_handler_chain = create_arg_parsing_chain()
-
-        for block in getattr(message, "content_blocks", []):
-            block_type = block.get("type")
-
-            # Handle the content block
-            block_handler_chain.handle(block, tool_call_buffers, print_func)
+        # Process content blocks with one table lookup per block
+        block_handlers = _CONTENT_BLOCK_HANDLERS
+        for block in message.content_blocks:
+            handler = block_handlers.get(block.get("type"))
+            if handler is not None:
+                handler(block, tool_call_buffers, print_func)
+
+        # Process buffered tool calls; most chunks carry none
+        if not tool_call_buffers:
+            return
 
-        # Process buffered tool calls (similar to the original logic)
-        # Make a copy of the keys to iterate over since we might modify the dict during iteration
-        for buffer_key in list(tool_call_buffers.keys()):
-            buffer = tool_call_buffers[buffer_key]
-            buffer_name = buffer.get("name")
-            buffer_id = buffer.get("id")
-            if buffer_name is None:
+        # Iterate the dict directly and remove finished buffers afterwards, so no
+        # key list is copied; incomplete buffers stay for the next chunk
+        completed: list[Any] = []
+        for buffer_key, buffer in tool_call_buffers.items():
+            buffer_name = buffer.name
+            buffer_id = buffer.id
+            # Don't try to decode arguments whose JSON is still open
+            if buffer_name is None or not buffer.maybe_complete:
                 continue
 
-            parsed_args = buffer.get("args")
-            parsed_args = arg_handler_chain.parse(parsed_args)
+            parsed_args = parse_tool_args(buffer.resolved_args)
 
             if parsed_args is None:
                 continue
@@ -169,10 +247,53 @@ class AIAndAIMessageChunkHandler(MessageTypeHandler):
                 file_op_tracker.start_operation(buffer_name, parsed_args, buffer_id)
 
                 # Print tool call
-                print_func(f"\n[CALLING] {buffer_name} with args: {parsed_args}")
-
-            # Remove the processed buffer
-            tool_call_buffers.pop(buffer_key, None)
+                # Compact JSON is cheaper than the dict repr and can be parsed back from logs
+                print_func(f"\n[CALLING] {buffer_name} with args: {json.dumps(parsed_args, separators=(',', ':'), ensure_ascii=False, default=str)}", flush=True)
+
+            completed.append(buffer_key)
+
+        # Remove the processed buffers
+        for buffer_key in completed:
+            del tool_call_buffers[buffer_key]
+
+
+_MessageTypeHandlerFunc = Callable[[Any, Any, dict, Any], None]
+
+_tool_message_handler = ToolMessageHandler()
+_ai_message_handler = AIAndAIMessageChunkHandler()
+
+# Message handlers keyed by exact message class; subclasses are resolved through
+# the MRO on first sight and then cached here
+_MESSAGE_TYPE_DISPATCH: dict[type, _MessageTypeHandlerFunc | None] = {
+    ToolMessage: _tool_message_handler._handle_specific,
+    AIMessage: _ai_message_handler._handle_specific,
+    AIMessageChunk: _ai_message_handler._handle_specific,
+}
+
+
+def _resolve_message_type_handler(message_type: type) -> _MessageTypeHandlerFunc | None:
+    """Find the handler for a message class not yet in the dispatch table."""
+    for base in message_type.__mro__[1:]:
+        handler = _MESSAGE_TYPE_DISPATCH.get(base)
+        if handler is not None:
+            break
+    else:
+        handler = None
+    _MESSAGE_TYPE_DISPATCH[message_type] = handler
+    return handler
+
+
+def dispatch_message_type(message: Any, file_op_tracker: Any, tool_call_buffers: dict, print_func: Any = print) -> bool:
+    """Handle a message with a single table lookup, returning True if handled."""
+    message_type = type(message)
+    try:
+        handler = _MESSAGE_TYPE_DISPATCH[message_type]
+    except KeyError:
+        handler = _resolve_message_type_handler(message_type)
+    if handler is None:
+        return False
+    handler(message, file_op_tracker, tool_call_buffers, print_func)
+    return True
 
 
 def create_message_type_handler_chain() -> MessageTypeHandler:
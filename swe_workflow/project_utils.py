@@ -6,8 +6,8 @@ from pathlib import Path
 def find_project_root(start_path: Path | None = None) -> Path | None:
     """Find the project root by looking for .git directory.
 
-    Walks up the directory tree from start_path (or cwd) looking for a .git
-    directory, which indicates the project root.
+    Delegates to the cached lookup in `swe_workflow.config`, which owns the
+    single implementation of the directory walk.
 
     Args:
         start_path: Directory to start searching from. Defaults to current working directory.
@@ -15,15 +15,9 @@ def find_project_root(start_path: Path | None = None) -> Path | None:
     Returns:
         Path to the project root if found, None otherwise.
     """
-    current = Path(start_path or Path.cwd()).resolve()
+    from .config import _find_project_root
 
-    # Walk up the directory tree
-    for parent in [current, *list(current.parents)]:
-        git_dir = parent / ".git"
-        if git_dir.exists():
-            return parent
-
-    return None
+    return _find_project_root(start_path)
 
 
 def find_project_agent_md(project_root: Path) -> list[Path]:
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import os
 import subprocess
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from langchain.agents.middleware.types import AgentMiddleware, AgentState
 from langchain.tools import ToolRuntime, tool
 from langchain_core.messages import ToolMessage
 from langchain_core.tools.base import ToolException
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 class ShellMiddleware(AgentMiddleware[AgentState, Any]):
     """Give basic shell access to agents via the shell.
@@ -25,7 +27,7 @@ class ShellMiddleware(AgentMiddleware[AgentState, Any]):
         workspace_root: str,
         timeout: float = 120.0,
         max_output_bytes: int = 100_000,
-        env: dict[str, str] | None = None,
+        env: Mapping[str, str] | None = None,
     ) -> None:
         """Initialize an instance of `ShellMiddleware`.
 
@@ -35,14 +37,16 @@ class ShellMiddleware(AgentMiddleware[AgentState, Any]):
                 Defaults to 120 seconds.
             max_output_bytes: Maximum number of bytes to capture from command output.
                 Defaults to 100,000 bytes.
-            env: Environment variables to pass to the subprocess. If None,
-                uses the current process's environment. Defaults to None.
+            env: Environment variables to pass to the subprocess. Any mapping is
+                accepted and only materialized when a command is spawned. If None,
+                the subprocess inherits the current process's environment.
+                Defaults to None.
         """
         super().__init__()
         self._timeout = timeout
         self._max_output_bytes = max_output_bytes
         self._tool_name = "shell"
-        self._env = env if env is not None else os.environ.copy()
+        self._env = env
         self._workspace_root = workspace_root
 
         # Build description with working directory information
@@ -96,7 +100,7 @@ class ShellMiddleware(AgentMiddleware[AgentState, Any]):
                 capture_output=True,
                 text=True,
                 timeout=self._timeout,
-                env=self._env,
+                env=dict(self._env) if self._env is not None else None,
                 cwd=self._workspace_root,
             )
 
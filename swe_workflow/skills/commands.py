@@ -147,26 +147,30 @@ def _list(agent: str, *, project: bool = False) -> None:
     user_skills = [s for s in skills if s["source"] == "user"]
     project_skills_list = [s for s in skills if s["source"] == "project"]
 
+    # Styles are looked up once rather than per printed line
+    primary = COLORS["primary"]
+    dim = COLORS["dim"]
+
     # Show user skills
     if user_skills and not project:
-        console.print("[bold cyan]User Skills:[/bold cyan]", style=COLORS["primary"])
+        console.print("[bold cyan]User Skills:[/bold cyan]", style=primary)
         for skill in user_skills:
             skill_path = Path(skill["path"])
-            console.print(f"  • [bold]{skill['name']}[/bold]", style=COLORS["primary"])
-            console.print(f"    {skill['description']}", style=COLORS["dim"])
-            console.print(f"    Location: {skill_path.parent}/", style=COLORS["dim"])
+            console.print(f"  • [bold]{skill['name']}[/bold]", style=primary)
+            console.print(f"    {skill['description']}", style=dim)
+            console.print(f"    Location: {skill_path.parent}/", style=dim)
             console.print()
 
     # Show project skills
     if project_skills_list:
         if not project and user_skills:
             console.print()
-        console.print("[bold green]Project Skills:[/bold green]", style=COLORS["primary"])
+        console.print("[bold green]Project Skills:[/bold green]", style=primary)
         for skill in project_skills_list:
             skill_path = Path(skill["path"])
-            console.print(f"  • [bold]{skill['name']}[/bold]", style=COLORS["primary"])
-            console.print(f"    {skill['description']}", style=COLORS["dim"])
-            console.print(f"    Location: {skill_path.parent}/", style=COLORS["dim"])
+            console.print(f"  • [bold]{skill['name']}[/bold]", style=primary)
+            console.print(f"    {skill['description']}", style=dim)
+            console.print(f"    Location: {skill_path.parent}/", style=dim)
             console.print()
 
 
@@ -391,6 +395,7 @@ def setup_skills_parser(
         description="Manage agent skills - create, list, and view skill information",
     )
     skills_subparsers = skills_parser.add_subparsers(dest="skills_command", help="Skills command")
+    skills_parser.set_defaults(skills_command=None, project=False)
 
     # Skills list
     list_parser = skills_subparsers.add_parser(
@@ -464,9 +469,9 @@ def execute_skills_command(args: argparse.Namespace) -> None:
 
     # Use the command handler registry to execute the appropriate command
     from ..command_handlers.registry import registry
-    
+
     # If command was executed successfully, return
-    if registry.execute_command(args.skills_command, args):
+    if args.skills_command and registry.execute_command(f"skills_{args.skills_command}", args):
         return
 
     # No subcommand provided, show help
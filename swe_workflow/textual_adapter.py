@@ -5,7 +5,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -18,6 +17,7 @@ from langchain_core.messages import HumanMessage, ToolMessage
 from langgraph.types import Command, Interrupt
 from pydantic import TypeAdapter, ValidationError
 
+from .content_block_handlers import ToolCallBuffer, parse_tool_args
 from .file_ops import FileOpTracker
 from .image_utils import create_multimodal_content
 from .input import ImageTracker, parse_file_mentions
@@ -179,7 +179,7 @@ async def execute_task_textual(
 
     file_op_tracker = FileOpTracker(assistant_id=assistant_id, backend=backend)
     displayed_tool_ids: set[str] = set()
-    tool_call_buffers: dict[str | int, dict] = {}
+    tool_call_buffers: dict[str | int, ToolCallBuffer] = {}
 
     # Track pending text and assistant messages PER NAMESPACE to avoid interleaving
     # when multiple subagents stream in parallel
@@ -375,42 +375,31 @@ async def execute_task_textual(
                             else:
                                 buffer_key = f"unknown-{len(tool_call_buffers)}"
 
-                            buffer = tool_call_buffers.setdefault(
-                                buffer_key,
-                                {"name": None, "id": None, "args": None, "args_parts": []},
-                            )
+                            buffer = tool_call_buffers.get(buffer_key)
+                            if buffer is None:
+                                buffer = tool_call_buffers[buffer_key] = ToolCallBuffer()
 
                             if chunk_name:
-                                buffer["name"] = chunk_name
+                                buffer.name = chunk_name
                             if chunk_id:
-                                buffer["id"] = chunk_id
+                                buffer.id = chunk_id
 
-                            if isinstance(chunk_args, dict):
-                                buffer["args"] = chunk_args
-                                buffer["args_parts"] = []
-                            elif isinstance(chunk_args, str):
+                            if isinstance(chunk_args, str):
                                 if chunk_args:
-                                    parts: list[str] = buffer.setdefault("args_parts", [])
+                                    parts = buffer.args_parts
                                     if not parts or chunk_args != parts[-1]:
-                                        parts.append(chunk_args)
-                                    buffer["args"] = "".join(parts)
+                                        buffer.append_args(chunk_args)
                             elif chunk_args is not None:
-                                buffer["args"] = chunk_args
+                                buffer.set_args(chunk_args)
 
-                            buffer_name = buffer.get("name")
-                            buffer_id = buffer.get("id")
-                            if buffer_name is None:
+                            buffer_name = buffer.name
+                            buffer_id = buffer.id
+                            # Only decode once the streamed JSON has closed its outer brackets
+                            if buffer_name is None or not buffer.maybe_complete:
                                 continue
 
-                            parsed_args = buffer.get("args")
-                            if isinstance(parsed_args, str):
-                                if not parsed_args:
-                                    continue
-                                try:
-                                    parsed_args = json.loads(parsed_args)
-                                except json.JSONDecodeError:
-                                    continue
-                            elif parsed_args is None:
+                            parsed_args = parse_tool_args(buffer.resolved_args)
+                            if parsed_args is None:
                                 continue
 
                             if not isinstance(parsed_args, dict):
@@ -0,0 +1,55 @@
+"""Path display helpers shared by the tool handlers."""
+
+from __future__ import annotations
+
+import functools
+import os
+import time
+
+# Seconds between working-directory refreshes for display purposes
+_CWD_TTL = 1.0
+
+_cached_cwd = ""
+_cwd_checked_at = float("-inf")
+
+
+def _current_cwd() -> str:
+    """Return the working directory, re-reading it at most once per ``_CWD_TTL``."""
+    global _cached_cwd, _cwd_checked_at  # noqa: PLW0603
+    now = time.monotonic()
+    if now - _cwd_checked_at >= _CWD_TTL:
+        try:
+            _cached_cwd = os.getcwd()
+        except OSError:
+            _cached_cwd = ""
+        _cwd_checked_at = now
+    return _cached_cwd
+
+
+def abbreviate_path(path_str: str, max_length: int = 60) -> str:
+    """Abbreviate a file path intelligently - show basename or relative path."""
+    # Bare filenames are returned as-is without touching the cache
+    if "/" not in path_str and "\\" not in path_str:
+        return path_str
+    return _abbreviate_path(path_str, max_length, _current_cwd())
+
+
+@functools.lru_cache(maxsize=4096)
+def _abbreviate_path(path_str: str, max_length: int, cwd: str) -> str:
+    """Abbreviate ``path_str`` relative to ``cwd``; results are memoized per directory."""
+    # Try to get relative path from current working directory (a prefix test
+    # avoids building a ValueError for every path outside it)
+    if cwd:
+        prefix = cwd if cwd.endswith(os.sep) else cwd + os.sep
+        if path_str.startswith(prefix) or path_str == cwd:
+            rel_str = path_str[len(prefix) :] or "."
+            # Use relative if it's shorter and not too long
+            if len(rel_str) < len(path_str) and len(rel_str) <= max_length:
+                return rel_str
+
+    # If absolute path is reasonable length, use it
+    if len(path_str) <= max_length:
+        return path_str
+
+    # Otherwise, just show basename (filename only)
+    return os.path.basename(path_str.rstrip("/\\")) or path_str
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from swe_workflow.file_ops import ApprovalPreview
@@ -12,10 +12,10 @@ if TYPE_CHECKING:
 class ToolHandler(ABC):
     """Abstract base class for tool-specific handlers."""
 
-    @property
-    @abstractmethod
-    def tool_name(self) -> str:
-        """Return the name of the tool this handler manages."""
+    __slots__ = ()
+
+    # Name of the tool this handler manages; a plain class attribute, read on every display
+    tool_name: ClassVar[str]
 
     @abstractmethod
     def build_approval_preview(self, args: dict[str, Any], assistant_id: str | None) -> ApprovalPreview | None:
@@ -26,6 +26,13 @@ class ToolHandler(ABC):
         """Format the tool call for display purposes."""
 
 
+def format_generic_display(tool_name: str, tool_args: dict[str, Any]) -> str:
+    """Fallback display for a tool call: ``name(key=value, ...)``."""
+    # A list lets str.join size its result in one pass instead of draining a generator
+    args_str = ", ".join([f"{k}={v!r}" for k, v in tool_args.items()])
+    return f"{tool_name}({args_str})"
+
+
 class ToolHandlerRegistry:
     """Registry to manage tool handlers and provide lookup functionality."""
 
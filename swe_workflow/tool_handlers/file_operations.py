@@ -2,69 +2,61 @@
 
 from __future__ import annotations
 
-import difflib
-from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from deepagents.backends.utils import perform_string_replacement
-
-from swe_workflow.file_ops import ApprovalPreview, _count_lines, _safe_read, compute_unified_diff, format_display_path, resolve_physical_path
-from swe_workflow.tool_handlers.base import ToolHandler
+from swe_workflow.tool_handlers._path_utils import abbreviate_path as _abbreviate_path
+from swe_workflow.tool_handlers.base import ToolHandler, format_generic_display
 
 if TYPE_CHECKING:
-    pass
+    from swe_workflow.file_ops import ApprovalPreview
 
+# Preview helpers (file_ops, deepagents) are imported inside build_approval_preview:
+# registering the handlers only needs format_display, and the display path stays light.
 
-def _abbreviate_path(path_str: str, max_length: int = 60) -> str:
-    """Abbreviate a file path intelligently - show basename or relative path."""
-    try:
-        path = Path(path_str)
 
-        # If it's just a filename (no directory parts), return as-is
-        if len(path.parts) == 1:
-            return path_str
+class _FilePathDisplayMixin:
+    """Display ``name(<path>)`` from the file_path/path argument, else the generic form."""
 
-        # Try to get relative path from current working directory
-        try:
-            rel_path = path.relative_to(Path.cwd())
-            rel_str = str(rel_path)
-            # Use relative if it's shorter and not too long
-            if len(rel_str) < len(path_str) and len(rel_str) <= max_length:
-                return rel_str
-        except (ValueError, Exception):
-            pass
+    __slots__ = ()
 
-        # If absolute path is reasonable length, use it
-        if len(path_str) <= max_length:
-            return path_str
+    tool_name: ClassVar[str]
 
-        # Otherwise, just show basename (filename only)
-        return path.name
-    except Exception:
-        # Fallback to original string if any error
-        return path_str
+    def format_display(self, tool_args: dict[str, Any]) -> str:
+        """Format the tool call for display purposes."""
+        # File operations: show the primary file path argument (file_path or path)
+        path_value = tool_args.get("file_path")
+        if path_value is None:
+            path_value = tool_args.get("path")
+        if path_value is not None:
+            path = _abbreviate_path(str(path_value))
+            return f"{self.tool_name}({path})"
+        # Fallback: generic formatting for unknown tools
+        return format_generic_display(self.tool_name, tool_args)
 
 
-class WriteFileHandler(ToolHandler):
+class WriteFileHandler(_FilePathDisplayMixin, ToolHandler):
     """Handler for write_file tool operations."""
 
-    @property
-    def tool_name(self) -> str:
-        return "write_file"
+    __slots__ = ()
+
+    tool_name = "write_file"
 
     def build_approval_preview(self, args: dict[str, Any], assistant_id: str | None) -> ApprovalPreview | None:
         """Build an approval preview for write_file operations."""
+        from swe_workflow.file_ops import ApprovalPreview, _count_lines, _safe_read_cached, compute_unified_diff, count_diff_changes, format_display_path, resolve_physical_path
+
         path_str = str(args.get("file_path") or args.get("path") or "")
         display_path = format_display_path(path_str)
         physical_path = resolve_physical_path(path_str, assistant_id)
 
         content = str(args.get("content", ""))
-        before = _safe_read(physical_path) if physical_path and physical_path.exists() else ""
+        # Missing files read as None, which previews as an empty "before"
+        before = _safe_read_cached(physical_path) if physical_path else ""
         after = content
         diff = compute_unified_diff(before or "", after, display_path, max_lines=100)
         additions = 0
         if diff:
-            additions = sum(1 for line in diff.splitlines() if line.startswith("+") and not line.startswith("+++"))
+            additions, _ = count_diff_changes(diff)
         total_lines = _count_lines(after)
         details = [
             f"File: {path_str}",
@@ -78,29 +70,20 @@ class WriteFileHandler(ToolHandler):
             diff_title=f"Diff {display_path}",
         )
 
-    def format_display(self, tool_args: dict[str, Any]) -> str:
-        """Format the write_file tool call for display purposes."""
-        # File operations: show the primary file path argument (file_path or path)
-        path_value = tool_args.get("file_path")
-        if path_value is None:
-            path_value = tool_args.get("path")
-        if path_value is not None:
-            path = _abbreviate_path(str(path_value))
-            return f"{self.tool_name}({path})"
-        # Fallback: generic formatting for unknown tools
-        args_str = ", ".join(f"{k}={v!r}" for k, v in tool_args.items())
-        return f"{self.tool_name}({args_str})"
 
-
-class EditFileHandler(ToolHandler):
+class EditFileHandler(_FilePathDisplayMixin, ToolHandler):
     """Handler for edit_file tool operations."""
 
-    @property
-    def tool_name(self) -> str:
-        return "edit_file"
+    __slots__ = ()
+
+    tool_name = "edit_file"
 
     def build_approval_preview(self, args: dict[str, Any], assistant_id: str | None) -> ApprovalPreview | None:
         """Build an approval preview for edit_file operations."""
+        from deepagents.backends.utils import perform_string_replacement
+
+        from swe_workflow.file_ops import ApprovalPreview, _safe_read_cached, compute_unified_diff, count_diff_changes, format_display_path, resolve_physical_path
+
         path_str = str(args.get("file_path") or args.get("path") or "")
         display_path = format_display_path(path_str)
         physical_path = resolve_physical_path(path_str, assistant_id)
@@ -111,7 +94,7 @@ class EditFileHandler(ToolHandler):
                 details=[f"File: {path_str}", "Action: Replace text"],
                 error="Unable to resolve file path.",
             )
-        before = _safe_read(physical_path)
+        before = _safe_read_cached(physical_path)
         if before is None:
             return ApprovalPreview(
                 title=f"Update {display_path}",
@@ -133,8 +116,7 @@ class EditFileHandler(ToolHandler):
         additions = 0
         deletions = 0
         if diff:
-            additions = sum(1 for line in diff.splitlines() if line.startswith("+") and not line.startswith("+++"))
-            deletions = sum(1 for line in diff.splitlines() if line.startswith("-") and not line.startswith("---"))
+            additions, deletions = count_diff_changes(diff)
         details = [
             f"File: {path_str}",
             f"Action: Replace text ({'all occurrences' if replace_all else 'single occurrence'})",
@@ -148,41 +130,15 @@ class EditFileHandler(ToolHandler):
             diff_title=f"Diff {display_path}",
         )
 
-    def format_display(self, tool_args: dict[str, Any]) -> str:
-        """Format the edit_file tool call for display purposes."""
-        # File operations: show the primary file path argument (file_path or path)
-        path_value = tool_args.get("file_path")
-        if path_value is None:
-            path_value = tool_args.get("path")
-        if path_value is not None:
-            path = _abbreviate_path(str(path_value))
-            return f"{self.tool_name}({path})"
-        # Fallback: generic formatting for unknown tools
-        args_str = ", ".join(f"{k}={v!r}" for k, v in tool_args.items())
-        return f"{self.tool_name}({args_str})"
-
 
-class ReadFileHandler(ToolHandler):
+class ReadFileHandler(_FilePathDisplayMixin, ToolHandler):
     """Handler for read_file tool operations."""
 
-    @property
-    def tool_name(self) -> str:
-        return "read_file"
+    __slots__ = ()
+
+    tool_name = "read_file"
 
     def build_approval_preview(self, args: dict[str, Any], assistant_id: str | None) -> ApprovalPreview | None:
         """Build an approval preview for read_file operations."""
         # Read operations typically don't need approval previews
         return None
-
-    def format_display(self, tool_args: dict[str, Any]) -> str:
-        """Format the read_file tool call for display purposes."""
-        # File operations: show the primary file path argument (file_path or path)
-        path_value = tool_args.get("file_path")
-        if path_value is None:
-            path_value = tool_args.get("path")
-        if path_value is not None:
-            path = _abbreviate_path(str(path_value))
-            return f"{self.tool_name}({path})"
-        # Fallback: generic formatting for unknown tools
-        args_str = ", ".join(f"{k}={v!r}" for k, v in tool_args.items())
-        return f"{self.tool_name}({args_str})"
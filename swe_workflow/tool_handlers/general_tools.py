@@ -2,104 +2,73 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from swe_workflow.tool_handlers.base import ToolHandler
+from swe_workflow.tool_handlers._path_utils import abbreviate_path as _abbreviate_path
+from swe_workflow.tool_handlers.base import ToolHandler, format_generic_display
 
 if TYPE_CHECKING:
     pass
 
 
-def truncate_value(value: str, max_length: int = 60) -> str:
-    """Truncate a string value if it exceeds max_length."""
-    if len(value) > max_length:
-        return value[:max_length] + "..."
-    return value
+def truncate_value(value: Any, max_length: int = 60) -> str:
+    """Truncate a value's text if it exceeds max_length; strings are not copied through str()."""
+    text = value if type(value) is str else str(value)
+    return text if len(text) <= max_length else text[:max_length] + "..."
 
 
-def _abbreviate_path(path_str: str, max_length: int = 60) -> str:
-    """Abbreviate a file path intelligently - show basename or relative path."""
-    try:
-        path = Path(path_str)
+class _QuotedArgDisplayMixin:
+    """Display ``name("<arg>")`` from one truncated argument, else the generic form."""
 
-        # If it's just a filename (no directory parts), return as-is
-        if len(path.parts) == 1:
-            return path_str
+    __slots__ = ()
 
-        # Try to get relative path from current working directory
-        try:
-            rel_path = path.relative_to(Path.cwd())
-            rel_str = str(rel_path)
-            # Use relative if it's shorter and not too long
-            if len(rel_str) < len(path_str) and len(rel_str) <= max_length:
-                return rel_str
-        except (ValueError, Exception):
-            pass
+    tool_name: ClassVar[str]
+    _display_arg: ClassVar[str]
+    _display_max_length: ClassVar[int]
 
-        # If absolute path is reasonable length, use it
-        if len(path_str) <= max_length:
-            return path_str
-
-        # Otherwise, just show basename (filename only)
-        return path.name
-    except Exception:
-        # Fallback to original string if any error
-        return truncate_value(path_str, max_length)
+    def format_display(self, tool_args: dict[str, Any]) -> str:
+        """Format the tool call for display purposes."""
+        if self._display_arg in tool_args:
+            value = truncate_value(tool_args[self._display_arg], self._display_max_length)
+            return f'{self.tool_name}("{value}")'
+        # Fallback: generic formatting for unknown tools
+        return format_generic_display(self.tool_name, tool_args)
 
 
-class ShellHandler(ToolHandler):
+class ShellHandler(_QuotedArgDisplayMixin, ToolHandler):
     """Handler for shell tool operations."""
 
-    @property
-    def tool_name(self) -> str:
-        return "shell"
+    __slots__ = ()
+
+    tool_name = "shell"
+    _display_arg = "command"
+    _display_max_length = 120
 
     def build_approval_preview(self, args: dict[str, Any], assistant_id: str | None):
         """Shell operations typically don't need approval previews."""
         return None
 
-    def format_display(self, tool_args: dict[str, Any]) -> str:
-        """Format the shell tool call for display purposes."""
-        # Shell: show the command being executed
-        if "command" in tool_args:
-            command = str(tool_args["command"])
-            command = truncate_value(command, 120)
-            return f'{self.tool_name}("{command}")'
-        # Fallback: generic formatting for unknown tools
-        args_str = ", ".join(f"{k}={v!r}" for k, v in tool_args.items())
-        return f"{self.tool_name}({args_str})"
-
 
-class GrepHandler(ToolHandler):
+class GrepHandler(_QuotedArgDisplayMixin, ToolHandler):
     """Handler for grep tool operations."""
 
-    @property
-    def tool_name(self) -> str:
-        return "grep"
+    __slots__ = ()
+
+    tool_name = "grep"
+    _display_arg = "pattern"
+    _display_max_length = 70
 
     def build_approval_preview(self, args: dict[str, Any], assistant_id: str | None):
         """Grep operations typically don't need approval previews."""
         return None
 
-    def format_display(self, tool_args: dict[str, Any]) -> str:
-        """Format the grep tool call for display purposes."""
-        # Grep: show the search pattern
-        if "pattern" in tool_args:
-            pattern = str(tool_args["pattern"])
-            pattern = truncate_value(pattern, 70)
-            return f'{self.tool_name}("{pattern}")'
-        # Fallback: generic formatting for unknown tools
-        args_str = ", ".join(f"{k}={v!r}" for k, v in tool_args.items())
-        return f"{self.tool_name}({args_str})"
-
 
 class LsHandler(ToolHandler):
     """Handler for ls tool operations."""
 
-    @property
-    def tool_name(self) -> str:
-        return "ls"
+    __slots__ = ()
+
+    tool_name = "ls"
 
     def build_approval_preview(self, args: dict[str, Any], assistant_id: str | None):
         """Ls operations typically don't need approval previews."""
@@ -114,35 +83,26 @@ class LsHandler(ToolHandler):
         return f"{self.tool_name}()"
 
 
-class GlobHandler(ToolHandler):
+class GlobHandler(_QuotedArgDisplayMixin, ToolHandler):
     """Handler for glob tool operations."""
 
-    @property
-    def tool_name(self) -> str:
-        return "glob"
+    __slots__ = ()
+
+    tool_name = "glob"
+    _display_arg = "pattern"
+    _display_max_length = 80
 
     def build_approval_preview(self, args: dict[str, Any], assistant_id: str | None):
         """Glob operations typically don't need approval previews."""
         return None
 
-    def format_display(self, tool_args: dict[str, Any]) -> str:
-        """Format the glob tool call for display purposes."""
-        # Glob: show the pattern
-        if "pattern" in tool_args:
-            pattern = str(tool_args["pattern"])
-            pattern = truncate_value(pattern, 80)
-            return f'{self.tool_name}("{pattern}")'
-        # Fallback: generic formatting for unknown tools
-        args_str = ", ".join(f"{k}={v!r}" for k, v in tool_args.items())
-        return f"{self.tool_name}({args_str})"
-
 
 class HttpRequestHandler(ToolHandler):
     """Handler for http_request tool operations."""
 
-    @property
-    def tool_name(self) -> str:
-        return "http_request"
+    __slots__ = ()
+
+    tool_name = "http_request"
 
     def build_approval_preview(self, args: dict[str, Any], assistant_id: str | None):
         """HTTP request operations typically don't need approval previews."""
@@ -155,68 +115,48 @@ class HttpRequestHandler(ToolHandler):
         if "method" in tool_args:
             parts.append(str(tool_args["method"]).upper())
         if "url" in tool_args:
-            url = str(tool_args["url"])
-            url = truncate_value(url, 80)
+            url = truncate_value(tool_args["url"], 80)
             parts.append(url)
         if parts:
             return f"{self.tool_name}({' '.join(parts)})"
         # Fallback: generic formatting for unknown tools
-        args_str = ", ".join(f"{k}={v!r}" for k, v in tool_args.items())
-        return f"{self.tool_name}({args_str})"
+        return format_generic_display(self.tool_name, tool_args)
 
 
-class FetchUrlHandler(ToolHandler):
+class FetchUrlHandler(_QuotedArgDisplayMixin, ToolHandler):
     """Handler for fetch_url tool operations."""
 
-    @property
-    def tool_name(self) -> str:
-        return "fetch_url"
+    __slots__ = ()
+
+    tool_name = "fetch_url"
+    _display_arg = "url"
+    _display_max_length = 80
 
     def build_approval_preview(self, args: dict[str, Any], assistant_id: str | None):
         """Fetch URL operations typically don't need approval previews."""
         return None
 
-    def format_display(self, tool_args: dict[str, Any]) -> str:
-        """Format the fetch_url tool call for display purposes."""
-        # Fetch URL: show the URL being fetched
-        if "url" in tool_args:
-            url = str(tool_args["url"])
-            url = truncate_value(url, 80)
-            return f'{self.tool_name}("{url}")'
-        # Fallback: generic formatting for unknown tools
-        args_str = ", ".join(f"{k}={v!r}" for k, v in tool_args.items())
-        return f"{self.tool_name}({args_str})"
 
-
-class TaskHandler(ToolHandler):
+class TaskHandler(_QuotedArgDisplayMixin, ToolHandler):
     """Handler for task tool operations."""
 
-    @property
-    def tool_name(self) -> str:
-        return "task"
+    __slots__ = ()
+
+    tool_name = "task"
+    _display_arg = "description"
+    _display_max_length = 100
 
     def build_approval_preview(self, args: dict[str, Any], assistant_id: str | None):
         """Task operations typically don't need approval previews."""
         return None
 
-    def format_display(self, tool_args: dict[str, Any]) -> str:
-        """Format the task tool call for display purposes."""
-        # Task: show the task description
-        if "description" in tool_args:
-            desc = str(tool_args["description"])
-            desc = truncate_value(desc, 100)
-            return f'{self.tool_name}("{desc}")'
-        # Fallback: generic formatting for unknown tools
-        args_str = ", ".join(f"{k}={v!r}" for k, v in tool_args.items())
-        return f"{self.tool_name}({args_str})"
-
 
 class WriteTodosHandler(ToolHandler):
     """Handler for write_todos tool operations."""
 
-    @property
-    def tool_name(self) -> str:
-        return "write_todos"
+    __slots__ = ()
+
+    tool_name = "write_todos"
 
     def build_approval_preview(self, args: dict[str, Any], assistant_id: str | None):
         """Write todos operations typically don't need approval previews."""
@@ -229,5 +169,4 @@ class WriteTodosHandler(ToolHandler):
             count = len(tool_args["todos"])
             return f"{self.tool_name}({count} items)"
         # Fallback: generic formatting for unknown tools
-        args_str = ", ".join(f"{k}={v!r}" for k, v in tool_args.items())
-        return f"{self.tool_name}({args_str})"
+        return format_generic_display(self.tool_name, tool_args)
@@ -15,7 +15,13 @@ from .general_tools import (
 
 
 def initialize_registry():
-    """Initialize the registry with all available tool handlers."""
+    """Initialize the registry with all available tool handlers.
+
+    Idempotent: a module reload or repeated call does not re-register handlers.
+    """
+    if registry._handlers:
+        return
+
     handlers = [
         WriteFileHandler(),
         EditFileHandler(),
@@ -1,17 +1,33 @@
 """UI rendering and display utilities for the CLI."""
 
+import functools
+import io
 import json
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from .config import COLORS, DEEP_AGENTS_ASCII, MAX_ARG_LENGTH, console
+from .config import COLORS, MAX_ARG_LENGTH, console, get_banner
+from .tool_handlers._path_utils import _current_cwd
+
+if TYPE_CHECKING:
+    from rich.text import Text
 
 
 def truncate_value(value: str, max_length: int = MAX_ARG_LENGTH) -> str:
     """Truncate a string value if it exceeds max_length."""
-    if len(value) > max_length:
-        return value[:max_length] + "..."
-    return value
+    return value if len(value) <= max_length else f"{value[:max_length]}..."
+
+
+@functools.cache
+def _tool_handler_lookup() -> Any:
+    """Return the registry's handler lookup, imported on first use to avoid circular imports.
+
+    This is the bound ``get`` of the registry's own handler dict, so a lookup is a
+    single dict probe and handlers registered later are still found.
+    """
+    from .tool_handlers.registry import registry
+
+    return registry._handlers.get
 
 
 def format_tool_display(tool_name: str, tool_args: dict) -> str:
@@ -30,113 +46,189 @@ def format_tool_display(tool_name: str, tool_args: dict) -> str:
         read_file(path="/long/path/file.py") → "read_file(file.py)"
         shell(command="pip install foo") → 'shell("pip install foo")'
     """
+    # Repeated calls (e.g. ls(".") or the same grep) reuse the rendered string; the
+    # key carries value types so 1 and True stay distinct, plus the cwd that paths
+    # are abbreviated against. Unhashable arguments are formatted uncached.
+    try:
+        key = tuple((k, type(v), v) for k, v in tool_args.items())
+        return _format_tool_display_cached(tool_name, key, _current_cwd())
+    except TypeError:
+        return _format_tool_display(tool_name, tool_args)
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_tool_display_cached(tool_name: str, key: tuple, _cwd: str) -> str:
+    """Memoized `format_tool_display` for hashable arguments."""
+    return _format_tool_display(tool_name, {k: v for k, _, v in key})
+
+
+def _format_tool_display(tool_name: str, tool_args: dict) -> str:
+    """Format a tool call through its registered handler, or generically."""
     # Use the handler registry to find the appropriate handler for the tool
-    # Import here to avoid circular import issues
-    from .tool_handlers.registry import registry
-    handler = registry.get_handler(tool_name)
+    handler = _tool_handler_lookup()(tool_name)
     if handler:
         return handler.format_display(tool_args)
-    
+
     # Fallback: generic formatting for unknown tools
+    if not tool_args:
+        return tool_name + "()"
     # Show all arguments in key=value format
-    args_str = ", ".join(f"{k}={truncate_value(str(v), 50)}" for k, v in tool_args.items())
-    return f"{tool_name}({args_str})"
+    buf = io.StringIO()
+    buf.write(tool_name)
+    buf.write("(")
+    separator = ""
+    for k, v in tool_args.items():
+        # Write pieces straight into one buffer; strings skip the str() copy
+        text = v if type(v) is str else str(v)
+        buf.write(separator)
+        buf.write(str(k))
+        buf.write("=")
+        if len(text) <= 50:
+            buf.write(text)
+        else:
+            buf.write(text[:50])
+            buf.write("...")
+        separator = ", "
+    buf.write(")")
+    return buf.getvalue()
+
+
+# One reusable encoder for tool message items: compact separators, and
+# non-ASCII text is shown as-is
+_encode_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
 
 
 def format_tool_message_content(content: Any) -> str:
     """Convert ToolMessage content into a printable string."""
+    # Plain string content is the common case and is returned as-is
+    if type(content) is str:
+        return content
     if content is None:
         return ""
     if isinstance(content, list):
+        # Tool output is most often a single text chunk
+        if len(content) == 1 and type(content[0]) is str:
+            return content[0]
+        # All-text content is joined in C; join raises TypeError on the first non-string
+        try:
+            return "\n".join(content)
+        except TypeError:
+            pass
         parts = []
         for item in content:
-            if isinstance(item, str):
+            # Exact-type check; str subclasses still end up as str(item) below
+            if type(item) is str:
                 parts.append(item)
-            else:
+            elif item is None or isinstance(item, (int, float)):
+                parts.append(_encode_json(item))
+            elif isinstance(item, (dict, list, tuple)):
+                # Containers may still hold values JSON can't encode
                 try:
-                    parts.append(json.dumps(item))
-                except Exception:
+                    parts.append(_encode_json(item))
+                except (TypeError, ValueError):
                     parts.append(str(item))
+            else:
+                parts.append(str(item))
         return "\n".join(parts)
     return str(content)
 
 
+# Help screen below the banner: (title, row style, (command, description) rows) per
+# section; styles are resolved once at import
+_PRIMARY = COLORS["primary"]
+_PRIMARY_BOLD = f"bold {_PRIMARY}"
+_DIM = COLORS["dim"]
+_HELP_SECTIONS: tuple[tuple[str, str, tuple[tuple[str, str], ...]], ...] = (
+    (
+        "Usage:",
+        "",
+        (
+            ("swe-workflow [OPTIONS]", "Start interactive session"),
+            ("swe-workflow list", "List all available agents"),
+            ("swe-workflow reset --agent AGENT", "Reset agent to default prompt"),
+            ("swe-workflow reset --agent AGENT --target SOURCE", "Reset agent to copy of another agent"),
+            ("swe-workflow help", "Show this help message"),
+            ("swe-workflow --version", "Show swe-workflow version"),
+        ),
+    ),
+    (
+        "Options:",
+        "",
+        (
+            ("--agent NAME", "Agent identifier (default: agent)"),
+            ("--model MODEL", "Model to use (e.g., claude-sonnet-4-5-20250929, gpt-4o)"),
+            ("--auto-approve", "Auto-approve tool usage without prompting"),
+            ("--non-interactive, --batch", "Run in non-interactive mode without UI"),
+            ("--task TASK", "Task to execute in non-interactive mode"),
+            ("-r, --resume [ID]", "Resume thread: -r for most recent, -r <ID> for specific"),
+        ),
+    ),
+    (
+        "Examples:",
+        _DIM,
+        (
+            ("swe-workflow", "# Start with default agent"),
+            ("swe-workflow --agent mybot", "# Start with agent named 'mybot'"),
+            ("swe-workflow --model gpt-4o", "# Use specific model (auto-detects provider)"),
+            ("swe-workflow -r", "# Resume most recent session"),
+            ("swe-workflow -r abc123", "# Resume specific thread"),
+            ("swe-workflow --auto-approve", "# Start with auto-approve enabled"),
+            ('swe-workflow --non-interactive --task "Do something"', "# Run without UI"),
+        ),
+    ),
+    (
+        "Thread Management:",
+        _DIM,
+        (
+            ("swe-workflow threads list", "# List all sessions"),
+            ("swe-workflow threads delete <ID>", "# Delete a session"),
+        ),
+    ),
+    (
+        "Interactive Features:",
+        _DIM,
+        (
+            ("Enter", "Submit your message"),
+            ("Ctrl+J", "Insert newline"),
+            ("Shift+Tab", "Toggle auto-approve mode"),
+            ("@filename", "Auto-complete files and inject content"),
+            ("/command", "Slash commands (/help, /clear, /quit)"),
+            ("!command", "Run bash commands directly"),
+        ),
+    ),
+)
+
+
+# Commands longer than this run into their description instead of widening the
+# command column for the whole section
+_HELP_COMMAND_WIDTH_LIMIT = 40
+
+
+@functools.cache
+def _help_renderable() -> "Text":
+    """Build the help screen once; later calls reprint the same renderable.
+
+    Rows are laid out as plain text, so lines end at their last character
+    rather than being padded out to a table or console width.
+    """
+    from rich.text import Text
+
+    sections = []
+    for title, style, rows in _HELP_SECTIONS:
+        width = max((len(command) for command, _ in rows if len(command) <= _HELP_COMMAND_WIDTH_LIMIT), default=0)
+        section = Text(title, style=_PRIMARY_BOLD)
+        section.append("".join([f"\n  {command:<{width}}  {description}" for command, description in rows]), style=style)
+        sections.append(section)
+
+    text = Text("\n")
+    text.append(get_banner(), style=_PRIMARY_BOLD)
+    text.append("\n\n")
+    text.append_text(Text("\n\n").join(sections))
+    text.append("\n")
+    return text
+
+
 def show_help() -> None:
     """Show help information."""
-    console.print()
-    console.print(DEEP_AGENTS_ASCII, style=f"bold {COLORS['primary']}")
-    console.print()
-
-    console.print("[bold]Usage:[/bold]", style=COLORS["primary"])
-    console.print("  swe-workflow [OPTIONS]                           Start interactive session")
-    console.print("  swe-workflow list                                List all available agents")
-    console.print(
-        "  swe-workflow reset --agent AGENT                 Reset agent to default prompt"
-    )
-    console.print(
-        "  swe-workflow reset --agent AGENT --target SOURCE Reset agent to copy of another agent"
-    )
-    console.print("  swe-workflow help                                Show this help message")
-    console.print("  swe-workflow --version                           Show swe-workflow version")
-    console.print()
-
-    console.print("[bold]Options:[/bold]", style=COLORS["primary"])
-    console.print("  --agent NAME                  Agent identifier (default: agent)")
-    console.print(
-        "  --model MODEL                 Model to use (e.g., claude-sonnet-4-5-20250929, gpt-4o)"
-    )
-    console.print("  --auto-approve                Auto-approve tool usage without prompting")
-    console.print("  --non-interactive, --batch    Run in non-interactive mode without UI")
-    console.print("  --task TASK                   Task to execute in non-interactive mode")
-    console.print("  -r, --resume [ID]             Resume thread: -r for most recent, -r <ID> for specific")
-    console.print()
-    console.print()
-
-    console.print("[bold]Examples:[/bold]", style=COLORS["primary"])
-    console.print(
-        "  swe-workflow                              # Start with default agent",
-        style=COLORS["dim"],
-    )
-    console.print(
-        "  swe-workflow --agent mybot                # Start with agent named 'mybot'",
-        style=COLORS["dim"],
-    )
-    console.print(
-        "  swe-workflow --model gpt-4o               # Use specific model (auto-detects provider)",
-        style=COLORS["dim"],
-    )
-    console.print(
-        "  swe-workflow -r                           # Resume most recent session",
-        style=COLORS["dim"],
-    )
-    console.print(
-        "  swe-workflow -r abc123                    # Resume specific thread",
-        style=COLORS["dim"],
-    )
-    console.print(
-        "  swe-workflow --auto-approve               # Start with auto-approve enabled",
-        style=COLORS["dim"],
-    )
-    console.print(
-        "  swe-workflow --non-interactive --task \"Do something\"  # Run without UI",
-        style=COLORS["dim"],
-    )
-    console.print()
-
-    console.print("[bold]Thread Management:[/bold]", style=COLORS["primary"])
-    console.print(
-        "  swe-workflow threads list                 # List all sessions", style=COLORS["dim"]
-    )
-    console.print(
-        "  swe-workflow threads delete <ID>          # Delete a session", style=COLORS["dim"]
-    )
-    console.print()
-
-    console.print("[bold]Interactive Features:[/bold]", style=COLORS["primary"])
-    console.print("  Enter           Submit your message", style=COLORS["dim"])
-    console.print("  Ctrl+J          Insert newline", style=COLORS["dim"])
-    console.print("  Shift+Tab       Toggle auto-approve mode", style=COLORS["dim"])
-    console.print("  @filename       Auto-complete files and inject content", style=COLORS["dim"])
-    console.print("  /command        Slash commands (/help, /clear, /quit)", style=COLORS["dim"])
-    console.print("  !command        Run bash commands directly", style=COLORS["dim"])
-    console.print()
+    # The whole screen goes through Rich's render pipeline once
+    console.print(_help_renderable())
@@ -6,6 +6,7 @@ for slash commands (/) and file mentions (@).
 
 from __future__ import annotations
 
+import itertools
 import subprocess
 from difflib import SequenceMatcher
 from enum import StrEnum
@@ -210,7 +211,8 @@ _MIN_FUZZY_SCORE = 15  # Minimum score to include in results
 def _find_project_root(start_path: Path) -> Path:
     """Find git root or return start_path."""
     current = start_path.resolve()
-    for parent in [current, *list(current.parents)]:
+    # Stream ancestors lazily; the root is usually found within a level or two
+    for parent in itertools.chain((current,), current.parents):
         if (parent / ".git").exists():
             return parent
     return start_path
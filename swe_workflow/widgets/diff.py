@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any
 from textual.containers import Vertical
 from textual.widgets import Static
 
+from ..file_ops import count_diff_line_changes
+
 if TYPE_CHECKING:
     from textual.app import ComposeResult
 
@@ -41,8 +43,7 @@ def format_diff_textual(diff: str, max_lines: int | None = 100) -> str:
     lines = diff.splitlines()
 
     # Compute stats first
-    additions = sum(1 for ln in lines if ln.startswith("+") and not ln.startswith("+++"))
-    deletions = sum(1 for ln in lines if ln.startswith("-") and not ln.startswith("---"))
+    additions, deletions = count_diff_line_changes(lines)
 
     # Find max line number for width calculation
     max_line = 0
@@ -168,14 +169,7 @@ class EnhancedDiff(Vertical):
         Returns:
             Tuple of (additions, deletions)
         """
-        additions = 0
-        deletions = 0
-        for line in self._diff.splitlines():
-            if line.startswith("+") and not line.startswith("+++"):
-                additions += 1
-            elif line.startswith("-") and not line.startswith("---"):
-                deletions += 1
-        return additions, deletions
+        return count_diff_line_changes(self._diff.splitlines())
 
     def compose(self) -> ComposeResult:
         """Compose the diff widget layout."""
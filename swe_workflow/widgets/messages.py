@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 from typing import TYPE_CHECKING, Any
 
 from rich.text import Text
@@ -255,7 +256,7 @@ class ToolCallMessage(Vertical):
         )
         args = self._filtered_args()
         if args:
-            args_str = ", ".join(f"{k}={v!r}" for k, v in list(args.items())[:_MAX_INLINE_ARGS])
+            args_str = ", ".join([f"{k}={v!r}" for k, v in itertools.islice(args.items(), _MAX_INLINE_ARGS)])
             if len(args) > _MAX_INLINE_ARGS:
                 args_str += ", ..."
             yield Static(f"({args_str})", classes="tool-args")
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING, Any
 from textual.containers import Vertical
 from textual.widgets import Markdown, Static
 
+from ..file_ops import count_diff_line_changes
+
 if TYPE_CHECKING:
     from textual.app import ComposeResult
 
@@ -128,12 +130,7 @@ class EditFileApprovalWidget(ToolApprovalWidget):
     ) -> tuple[int, int]:
         """Count additions and deletions from diff data."""
         if diff_lines:
-            additions = sum(
-                1 for line in diff_lines if line.startswith("+") and not line.startswith("+++")
-            )
-            deletions = sum(
-                1 for line in diff_lines if line.startswith("-") and not line.startswith("---")
-            )
+            additions, deletions = count_diff_line_changes(diff_lines)
         else:
             additions = new_string.count("\n") + 1 if new_string else 0
             deletions = old_string.count("\n") + 1 if old_string else 0
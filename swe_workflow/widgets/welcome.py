@@ -7,7 +7,7 @@ from typing import Any
 
 from textual.widgets import Static
 
-from ..config import DEEP_AGENTS_ASCII, settings
+from ..config import get_banner, settings
 
 
 class WelcomeBanner(Static):
@@ -24,7 +24,7 @@ class WelcomeBanner(Static):
     def __init__(self, **kwargs: Any) -> None:
         """Initialize the welcome banner."""
         # Use the same green color as the original UI (#ca8a04)
-        banner_text = f"[bold #ca8a04]{DEEP_AGENTS_ASCII}[/bold #ca8a04]\n"
+        banner_text = f"[bold #ca8a04]{get_banner()}[/bold #ca8a04]\n"
 
         # Show LangSmith status if tracing is enabled
         langsmith_key = os.environ.get("LANGSMITH_API_KEY") or os.environ.get("LANGCHAIN_API_KEY")
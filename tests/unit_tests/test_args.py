@@ -3,6 +3,8 @@
 import sys
 from unittest.mock import patch
 
+import pytest
+
 from swe_workflow.main import parse_args
 
 
@@ -41,3 +43,27 @@ class TestInitialPromptArg:
         with patch.object(sys, "argv", ["swe_workflow", "-m", ""]):
             args = parse_args()
         assert args.initial_prompt == ""
+
+
+class TestSubcommandArgs:
+    """Tests for subcommands parsed with only their own parser built."""
+
+    def test_skills_without_subcommand_prints_usage(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Verify bare `skills` keeps the global args and prints skills usage."""
+        from swe_workflow.command_handlers.registry import registry
+
+        with patch.object(sys, "argv", ["swe_workflow", "skills"]):
+            args = parse_args()
+        assert args.command == "skills"
+        assert args.agent == "agent"
+
+        assert registry.execute_command(args.command, args)
+        assert "Please specify a skills subcommand" in capsys.readouterr().out
+
+    def test_subcommand_error_lists_all_subcommands(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Verify usage errors are reported with the full subcommand list."""
+        with patch.object(sys, "argv", ["swe_workflow", "list", "--bogus"]), pytest.raises(SystemExit):
+            parse_args()
+        err = capsys.readouterr().err
+        assert "{list,help,reset,skills,threads}" in err
+        assert "unrecognized arguments: --bogus" in err
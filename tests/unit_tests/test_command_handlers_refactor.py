@@ -1,5 +1,7 @@
 """Test cases for the refactored command handlers to ensure proper OOP structure."""
 
+import subprocess
+import sys
 import unittest
 from argparse import Namespace
 from unittest.mock import patch, MagicMock, AsyncMock
@@ -12,14 +14,16 @@ from swe_workflow.command_handlers.threads_commands import ThreadsListCommandHan
 class TestRefactoredCommandHandlers(unittest.TestCase):
     """Test cases for the refactored command handlers."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Ensure registry is initialized
-        pass
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures once; the handlers are stateless and can be shared."""
+        cls.threads_handler = ThreadsCommandHandler()
+        cls.list_handler = ThreadsListCommandHandler()
+        cls.delete_handler = ThreadsDeleteCommandHandler()
 
     def test_threads_command_handler_structure(self):
         """Test that ThreadsCommandHandler no longer contains if/elif/else logic."""
-        handler = ThreadsCommandHandler()
+        handler = self.threads_handler
         # Check that the handler is properly structured
         self.assertTrue(hasattr(handler, 'command_name'))
         self.assertEqual(handler.command_name, 'threads')
@@ -27,14 +31,14 @@ class TestRefactoredCommandHandlers(unittest.TestCase):
 
     def test_threads_list_command_handler_exists(self):
         """Test that ThreadsListCommandHandler exists and is properly structured."""
-        handler = ThreadsListCommandHandler()
+        handler = self.list_handler
         self.assertTrue(hasattr(handler, 'command_name'))
         self.assertEqual(handler.command_name, 'threads_list')
         self.assertTrue(callable(handler.execute))
 
     def test_threads_delete_command_handler_exists(self):
         """Test that ThreadsDeleteCommandHandler exists and is properly structured."""
-        handler = ThreadsDeleteCommandHandler()
+        handler = self.delete_handler
         self.assertTrue(hasattr(handler, 'command_name'))
         self.assertEqual(handler.command_name, 'threads_delete')
         self.assertTrue(callable(handler.execute))
@@ -55,19 +59,28 @@ class TestRefactoredCommandHandlers(unittest.TestCase):
         self.assertIsNotNone(delete_handler)
         self.assertIsInstance(delete_handler, ThreadsDeleteCommandHandler)
 
+    def test_registry_import_stays_lightweight(self):
+        """Test that loading the handler registry does not import deepagents or LangChain."""
+        code = (
+            "import sys, swe_workflow.command_handlers.registry; "
+            "print(sorted(m for m in ('deepagents', 'langgraph', 'langchain_core') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "[]")
+
     @patch('swe_workflow.sessions.list_threads_command')
     def test_threads_list_command_execution(self, mock_list_command):
         """Test that threads list command executes properly."""
         # Mock async function
         mock_list_command.return_value = AsyncMock()
         
-        handler = ThreadsListCommandHandler()
+        handler = self.list_handler
         args = Namespace(agent="test_agent", limit=10)
         
         # Execute should not raise an exception
         import asyncio
         from unittest.mock import patch
-        with patch('asyncio.run') as mock_async_run:
+        with patch('swe_workflow.command_handlers.threads_commands.run_coroutine') as mock_async_run:
             handler.execute(args)
             mock_async_run.assert_called_once()
 
@@ -77,13 +90,13 @@ class TestRefactoredCommandHandlers(unittest.TestCase):
         # Mock async function
         mock_delete_command.return_value = AsyncMock()
         
-        handler = ThreadsDeleteCommandHandler()
+        handler = self.delete_handler
         args = Namespace(thread_id="test_thread_id")
         
         # Execute should not raise an exception
         import asyncio
         from unittest.mock import patch
-        with patch('asyncio.run') as mock_async_run:
+        with patch('swe_workflow.command_handlers.threads_commands.run_coroutine') as mock_async_run:
             handler.execute(args)
             mock_async_run.assert_called_once()
 
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from swe_workflow.config import _find_project_agent_md, _find_project_root
+from swe_workflow.config import _find_project_agent_md, _find_project_root, clear_project_root_cache
 
 
 class TestProjectRootDetection:
@@ -48,6 +48,22 @@ class TestProjectRootDetection:
         result = _find_project_root(inner_repo)
         assert result == inner_repo
 
+    def test_find_project_root_is_cached(self, tmp_path: Path) -> None:
+        """Test that lookups are cached until the cache is cleared."""
+        project_root = tmp_path / "cached"
+        project_root.mkdir()
+        git_dir = project_root / ".git"
+        git_dir.mkdir()
+
+        assert _find_project_root(project_root) == project_root
+
+        # Removing .git is not observed until the cache is cleared
+        git_dir.rmdir()
+        assert _find_project_root(project_root) == project_root
+
+        clear_project_root_cache()
+        assert _find_project_root(project_root) is None
+
 
 class TestProjectAgentMdFinding:
     """Test finding project-specific AGENTS.md files."""
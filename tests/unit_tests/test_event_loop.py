@@ -0,0 +1,59 @@
+"""Tests for running CLI coroutines on uvloop when it is available."""
+
+import asyncio
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+from swe_workflow._event_loop import _loop_factory, run_coroutine
+
+
+@pytest.fixture
+def linux(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "platform", "linux")
+
+
+@pytest.fixture
+def fake_uvloop(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """Install a stand-in uvloop whose loops are ordinary asyncio loops."""
+    uvloop = types.ModuleType("uvloop")
+    uvloop.new_event_loop = MagicMock(side_effect=asyncio.new_event_loop)  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "uvloop", uvloop)
+    return uvloop
+
+
+async def _answer() -> int:
+    return 42
+
+
+@pytest.mark.usefixtures("linux")
+def test_loop_factory_falls_back_without_uvloop(monkeypatch: pytest.MonkeyPatch) -> None:
+    # A None entry makes the import fail as if the package were not installed
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    assert _loop_factory() is None
+    assert run_coroutine(_answer()) == 42
+
+
+@pytest.mark.usefixtures("linux")
+def test_run_coroutine_uses_uvloop_when_installed(fake_uvloop: types.ModuleType) -> None:
+    assert _loop_factory() is fake_uvloop.new_event_loop
+    assert run_coroutine(_answer()) == 42
+    fake_uvloop.new_event_loop.assert_called_once_with()
+
+
+def test_loop_factory_skips_uvloop_on_windows(fake_uvloop: types.ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "platform", "win32")
+
+    assert _loop_factory() is None
+    assert run_coroutine(_answer()) == 42
+    fake_uvloop.new_event_loop.assert_not_called()
+
+
+@pytest.mark.usefixtures("linux", "fake_uvloop")
+def test_run_coroutine_leaves_the_event_loop_policy_alone() -> None:
+    policy = asyncio.get_event_loop_policy()
+    run_coroutine(_answer())
+    assert asyncio.get_event_loop_policy() is policy
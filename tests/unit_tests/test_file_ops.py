@@ -1,9 +1,10 @@
 import textwrap
 from pathlib import Path
 
+import pytest
 from langchain_core.messages import ToolMessage
 
-from swe_workflow.file_ops import FileOpTracker, build_approval_preview
+from swe_workflow.file_ops import FileOpTracker, build_approval_preview, count_diff_changes, count_diff_line_changes
 
 
 def test_tracker_records_read_lines(tmp_path: Path) -> None:
@@ -118,3 +119,125 @@ def test_build_approval_preview_generates_diff(tmp_path: Path) -> None:
     assert preview is not None
     assert preview.diff is not None
     assert "+gamma" in preview.diff
+
+
+def test_count_diff_changes_skips_file_headers() -> None:
+    diff = "--- a (before)\n+++ a (after)\n@@ -1,2 +1,2 @@\n-old\n+new\n+++plus\n context\n---dash"
+
+    assert count_diff_changes(diff) == (1, 1)
+
+
+def test_count_diff_line_changes_matches_count_diff_changes() -> None:
+    diff = "--- a (before)\n+++ a (after)\n@@ -1,3 +1,3 @@\n-old\n+new\n+more\n context"
+
+    assert count_diff_line_changes(diff.splitlines()) == count_diff_changes(diff) == (2, 1)
+    assert count_diff_line_changes([]) == (0, 0)
+
+
+def test_safe_read_cached_rereads_changed_files(tmp_path: Path) -> None:
+    from swe_workflow.file_ops import _safe_read_cached
+
+    path = tmp_path / "cached.txt"
+    path.write_text("one\n")
+    assert _safe_read_cached(path) == "one\n"
+
+    path.write_text("three\n")
+    assert _safe_read_cached(path) == "three\n"
+    assert _safe_read_cached(tmp_path / "missing.txt") is None
+
+
+def test_safe_read_cached_same_size_rewrite_is_stale_only_within_ttl(tmp_path: Path) -> None:
+    import os
+
+    from swe_workflow.file_ops import _safe_read_cached
+
+    path = tmp_path / "same_size.txt"
+    path.write_text("aaa\n")
+    st = path.stat()
+    assert _safe_read_cached(path) == "aaa\n"
+
+    # Same size and mtime, as on a filesystem with coarse timestamps
+    path.write_text("bbb\n")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert _safe_read_cached(path) == "aaa\n"
+    assert _safe_read_cached(path, ttl=0) == "bbb\n"
+
+
+def test_safe_read_cached_missing_and_deleted_files(tmp_path: Path) -> None:
+    from swe_workflow.file_ops import _safe_read_cached
+
+    assert _safe_read_cached(tmp_path / "missing.txt") is None
+
+    path = tmp_path / "deleted.txt"
+    path.write_text("gone soon\n")
+    assert _safe_read_cached(path) == "gone soon\n"
+    path.unlink()
+    assert _safe_read_cached(path) is None
+
+
+def test_safe_read_cached_caps_total_bytes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from swe_workflow import file_ops
+
+    monkeypatch.setattr(file_ops, "_READ_CACHE", {})
+    monkeypatch.setattr(file_ops, "_READ_CACHE_MAX_BYTES", 10)
+    for name in ("a", "b", "c"):
+        (tmp_path / name).write_text("x" * 4)
+        file_ops._safe_read_cached(tmp_path / name)
+    (tmp_path / "big").write_text("x" * 11)
+    assert file_ops._safe_read_cached(tmp_path / "big") == "x" * 11
+
+    assert [Path(key[0]).name for key in file_ops._READ_CACHE] == ["b", "c"]
+
+
+def test_tracker_before_content_bypasses_preview_cache(tmp_path: Path) -> None:
+    import os
+
+    from swe_workflow.file_ops import _safe_read_cached
+
+    file_path = tmp_path / "tracked.txt"
+    file_path.write_text("old\n")
+    st = file_path.stat()
+    assert _safe_read_cached(file_path) == "old\n"
+    file_path.write_text("new\n")
+    os.utime(file_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    tracker = FileOpTracker(assistant_id=None)
+    tracker.start_operation("write_file", {"file_path": str(file_path)}, "write-1")
+
+    assert tracker.active["write-1"].before_content == "new\n"
+
+
+@pytest.mark.parametrize(
+    ("before", "after"),
+    [
+        ("a\nb\nc\n", "a\nB\nc\n"),
+        ("", "new\nfile\n"),
+        ("gone\n", ""),
+        ("\n".join(map(str, range(40))), "\n".join(str(i) if i % 7 else f"{i}!" for i in range(42))),
+    ],
+)
+def test_unified_diff_lines_match_difflib(before: str, after: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    import difflib
+
+    from swe_workflow import file_ops
+
+    a, b = before.splitlines(), after.splitlines()
+    expected = list(difflib.unified_diff(a, b, "x (before)", "x (after)", n=3, lineterm=""))
+    # Both the configured matcher (cdifflib when installed) and the stdlib fallback
+    assert list(file_ops._unified_diff_lines(a, b, "x (before)", "x (after)", 3)) == expected
+    monkeypatch.setattr(file_ops, "_SequenceMatcher", difflib.SequenceMatcher)
+    assert list(file_ops._unified_diff_lines(a, b, "x (before)", "x (after)", 3)) == expected
+
+
+def test_compute_unified_diff_truncates_long_diffs() -> None:
+    from swe_workflow.file_ops import compute_unified_diff
+
+    before = "\n".join(f"line {i}" for i in range(100))
+    after = "\n".join(f"LINE {i}" for i in range(100))
+
+    diff = compute_unified_diff(before, after, "x", max_lines=10)
+    assert diff is not None
+    lines = diff.split("\n")
+    assert len(lines) == 10
+    assert lines[-1] == "..."
+    assert compute_unified_diff(before, before, "x") is None
@@ -0,0 +1,144 @@
+"""Tests for replaying conversation history through the message renderers."""
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessage, BaseMessage, ChatMessage, HumanMessage, SystemMessage, ToolMessage
+
+from swe_workflow.message_handlers import MessageRenderContext, dispatch_message, extract_content
+
+
+class _Widget:
+    """Stand-in message widget that records how it was built and updated."""
+
+    def __init__(self, content: str | None = None, **kwargs: Any) -> None:
+        self.content = content
+        self.kwargs = kwargs
+        self.status: tuple[str, str] | None = None
+        self.initial_content_written = False
+
+    async def write_initial_content(self) -> None:
+        self.initial_content_written = True
+
+    def set_success(self, result: str) -> None:
+        self.status = ("success", result)
+
+    def set_error(self, result: str) -> None:
+        self.status = ("error", result)
+
+
+class UserMessage(_Widget):
+    pass
+
+
+class AssistantMessage(_Widget):
+    pass
+
+
+class ToolCallMessage(_Widget):
+    pass
+
+
+class SystemMessageWidget(_Widget):
+    pass
+
+
+class _App:
+    """App stub exposing only what `MessageRenderContext` reads; it has no widget classes."""
+
+    def __init__(self) -> None:
+        self.mounted: list[list[_Widget]] = []
+        self._ui_adapter = SimpleNamespace(_current_tool_messages={})
+
+    def _extract_message_content(self, msg: BaseMessage) -> str:
+        return extract_content(msg)
+
+    async def _mount_message(self, widget: _Widget) -> None:
+        self.mounted.append([widget])
+
+    async def _mount_messages(self, widgets: list[_Widget]) -> None:
+        self.mounted.append(list(widgets))
+
+
+_WIDGETS = SimpleNamespace(
+    UserMessage=UserMessage,
+    AssistantMessage=AssistantMessage,
+    ToolCallMessage=ToolCallMessage,
+    SystemMessage=SystemMessageWidget,
+)
+
+
+@pytest.fixture
+def app() -> _App:
+    return _App()
+
+
+def _context(app: _App, tool_results: dict[str, Any] | None = None) -> MessageRenderContext:
+    return MessageRenderContext(app, _WIDGETS, tool_results or {})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("message", "widget_class"),
+    [
+        (HumanMessage(content="hello"), UserMessage),
+        (AIMessage(content="hello"), AssistantMessage),
+        (SystemMessage(content="hello"), SystemMessageWidget),
+    ],
+)
+async def test_plain_messages_mount_one_widget(app: _App, message: BaseMessage, widget_class: type) -> None:
+    await dispatch_message(message, _context(app))
+
+    assert len(app.mounted) == 1
+    (widget,) = app.mounted[0]
+    assert type(widget) is widget_class
+    assert widget.content == "hello"
+    assert widget.initial_content_written is (widget_class is AssistantMessage)
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_mount_in_one_ordered_batch(app: _App) -> None:
+    message = AIMessage(
+        content="",
+        tool_calls=[
+            {"name": "read_file", "args": {"path": "a.py"}, "id": "call-ok"},
+            {"name": "execute", "args": {"command": "false"}, "id": "call-err"},
+            {"name": "ls", "args": {}, "id": "call-pending"},
+        ],
+    )
+    tool_results = {
+        "call-ok": ToolMessage(content="contents", tool_call_id="call-ok"),
+        "call-err": ToolMessage(content="exit 1", tool_call_id="call-err", status="error"),
+    }
+
+    await dispatch_message(message, _context(app, tool_results))
+
+    assert len(app.mounted) == 1
+    widgets = app.mounted[0]
+    assert [type(w) for w in widgets] == [ToolCallMessage] * 3
+    assert [w.kwargs["tool_name"] for w in widgets] == ["read_file", "execute", "ls"]
+    assert widgets[0].kwargs["args"] == {"path": "a.py"}
+
+    assert widgets[0].status == ("success", "contents")
+    assert widgets[1].status == ("error", "exit 1")
+    assert widgets[2].status is None
+    assert app._ui_adapter._current_tool_messages == {"call-pending": widgets[2]}
+
+
+@pytest.mark.asyncio
+async def test_tool_results_are_not_rendered_on_their_own(app: _App) -> None:
+    await dispatch_message(ToolMessage(content="done", tool_call_id="call-1"), _context(app))
+
+    assert app.mounted == []
+
+
+@pytest.mark.asyncio
+async def test_unknown_message_type_renders_truncated_system_message(app: _App) -> None:
+    message = ChatMessage(role="critic", content="x" * 300)
+
+    await dispatch_message(message, _context(app))
+
+    (widget,) = app.mounted[0]
+    assert type(widget) is SystemMessageWidget
+    assert widget.content == "[chat] " + "x" * 200
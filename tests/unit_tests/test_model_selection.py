@@ -0,0 +1,37 @@
+"""Tests for model client creation and caching."""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from swe_workflow.model_selection import ModelFactory, _create_model_cached
+
+
+@pytest.fixture
+def fresh_model_cache() -> Iterator[None]:
+    _create_model_cached.cache_clear()
+    yield
+    _create_model_cached.cache_clear()
+
+
+@pytest.mark.usefixtures("fresh_model_cache")
+def test_create_model_reuses_client_for_same_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("langchain_openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-first")
+
+    first = ModelFactory.create_model("openai", "gpt-5-mini", MagicMock())
+    assert ModelFactory.create_model("openai", "gpt-5-mini", MagicMock()) is first
+
+
+@pytest.mark.usefixtures("fresh_model_cache")
+def test_create_model_rebuilds_client_when_api_key_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("langchain_openai")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-first")
+    first = ModelFactory.create_model("openai", "gpt-5-mini", MagicMock())
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-second")
+    second = ModelFactory.create_model("openai", "gpt-5-mini", MagicMock())
+
+    assert second is not first
+    assert second.openai_api_key.get_secret_value() == "sk-second"
@@ -2,11 +2,22 @@
 
 import pytest
 import asyncio
+import io
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from swe_workflow.non_interactive import run_non_interactive_with_resume, execute_task_non_interactive
 
 
+@pytest.fixture
+def mock_checkpointer():
+    """Async context manager standing in for the checkpointer, fresh for each test."""
+    checkpointer = AsyncMock()
+    checkpointer.__aenter__ = AsyncMock(return_value=checkpointer)
+    checkpointer.__aexit__ = AsyncMock(return_value=None)
+    return checkpointer
+
+
 @pytest.mark.asyncio
 async def test_execute_task_non_interactive_returns_bool():
     """Test that execute_task_non_interactive returns a boolean value."""
@@ -28,7 +39,7 @@ async def test_execute_task_non_interactive_returns_bool():
 
 
 @pytest.mark.asyncio
-async def test_run_non_interactive_with_resume_returns_int():
+async def test_run_non_interactive_with_resume_returns_int(mock_checkpointer):
     """Test that run_non_interactive_with_resume returns an integer exit code."""
     with patch('swe_workflow.non_interactive.create_model') as mock_create_model, \
          patch('swe_workflow.non_interactive.get_checkpointer') as mock_get_checkpointer, \
@@ -38,9 +49,6 @@ async def test_run_non_interactive_with_resume_returns_int():
         
         # Mock return values
         mock_create_model.return_value = "test_model"
-        mock_checkpointer = AsyncMock()
-        mock_checkpointer.__aenter__ = AsyncMock(return_value=mock_checkpointer)
-        mock_checkpointer.__aexit__ = AsyncMock(return_value=None)
         mock_get_checkpointer.return_value = mock_checkpointer
         
         mock_agent = MagicMock()
@@ -59,7 +67,7 @@ async def test_run_non_interactive_with_resume_returns_int():
 
 
 @pytest.mark.asyncio
-async def test_run_non_interactive_with_resume_error_handling():
+async def test_run_non_interactive_with_resume_error_handling(mock_checkpointer):
     """Test that run_non_interactive_with_resume handles errors properly."""
     with patch('swe_workflow.non_interactive.create_model') as mock_create_model, \
          patch('swe_workflow.non_interactive.get_checkpointer') as mock_get_checkpointer, \
@@ -68,9 +76,6 @@ async def test_run_non_interactive_with_resume_error_handling():
         
         # Mock return values
         mock_create_model.return_value = "test_model"
-        mock_checkpointer = AsyncMock()
-        mock_checkpointer.__aenter__ = AsyncMock(return_value=mock_checkpointer)
-        mock_checkpointer.__aexit__ = AsyncMock(return_value=None)
         mock_get_checkpointer.return_value = mock_checkpointer
         
         # Make create_cli_agent raise an exception
@@ -84,4 +89,163 @@ async def test_run_non_interactive_with_resume_error_handling():
         
         # Verify the return type and value
         assert isinstance(result, int)
-        assert result == 1  # Error exit code
\ No newline at end of file
+        assert result == 1  # Error exit code
+
+
+def test_tool_call_buffer_tracks_json_nesting_across_chunks():
+    from swe_workflow.content_block_handlers import ToolCallBuffer
+
+    buffer = ToolCallBuffer()
+    for chunk in ['{"path": "a}', '\\', '"b", "items": [1, ', "2]"]:
+        buffer.append_args(chunk)
+        assert not buffer.maybe_complete
+
+    buffer.append_args("}")
+    assert buffer.maybe_complete
+    assert buffer.resolved_args == '{"path": "a}\\"b", "items": [1, 2]}'
+
+
+def test_dispatch_message_type_resolves_subclasses():
+    from langchain_core.messages import HumanMessage, ToolMessage
+
+    from swe_workflow.non_interactive_handlers import dispatch_message_type
+
+    class CustomToolMessage(ToolMessage):
+        pass
+
+    lines = []
+    message = CustomToolMessage(content="done", tool_call_id="call-1", name="ls")
+    assert dispatch_message_type(message, MagicMock(), {}, lambda *a, **k: lines.append(a))
+    assert lines[0] == ("[TOOL] ls: done\n[SUCCESS] Tool ls completed successfully\n",)
+
+    assert not dispatch_message_type(HumanMessage(content="hi"), MagicMock(), {}, lambda *a, **k: None)
+
+
+@pytest.fixture
+def fresh_llm_cache():
+    """Let each test install the LLM cache from scratch, and undo it afterwards."""
+    from langchain_core.globals import get_llm_cache, set_llm_cache
+
+    from swe_workflow.non_interactive import _install_llm_cache
+
+    previous = get_llm_cache()
+    _install_llm_cache.cache_clear()
+    yield _install_llm_cache
+    _install_llm_cache.cache_clear()
+    set_llm_cache(previous)
+
+
+def test_install_llm_cache_skips_without_langchain_community(fresh_llm_cache, monkeypatch, capsys):
+    from langchain_core.globals import get_llm_cache
+
+    # A None entry makes the import fail as if the package were not installed
+    monkeypatch.setitem(sys.modules, "langchain_community.cache", None)
+
+    assert fresh_llm_cache() is False
+    assert get_llm_cache() is None
+    assert "pip install 'swe-workflow[llm-cache]'" in capsys.readouterr().err
+
+
+def test_install_llm_cache_uses_sqlite_in_user_cache_dir(fresh_llm_cache, monkeypatch, tmp_path):
+    cache_module = pytest.importorskip("langchain_community.cache")
+    from langchain_core.globals import get_llm_cache
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert fresh_llm_cache() is True
+    cache = get_llm_cache()
+    assert isinstance(cache, cache_module.SQLiteCache)
+    assert (tmp_path / "swe-workflow" / "llm_cache.db").exists()
+
+
+class _Stream(io.StringIO):
+    """In-memory stream that reports as a terminal or not, and counts flushes."""
+
+    def __init__(self, tty: bool):
+        super().__init__()
+        self.tty = tty
+        self.flushes = 0
+
+    def isatty(self):
+        return self.tty
+
+    def flush(self):
+        self.flushes += 1
+
+
+def test_buffered_printer_writes_through_when_redirected():
+    from swe_workflow.non_interactive_handlers import BufferedPrinter
+
+    stream = _Stream(tty=False)
+    printer = BufferedPrinter(stream)
+    printer("partial", end="")
+    assert stream.getvalue() == "partial"
+    assert stream.flushes == 0
+
+    printer("done", flush=True)
+    assert stream.getvalue() == "partialdone\n"
+    assert stream.flushes == 1
+
+
+@pytest.mark.asyncio
+async def test_buffered_printer_holds_partial_line_until_newline():
+    from swe_workflow.non_interactive_handlers import BufferedPrinter
+
+    stream = _Stream(tty=True)
+    printer = BufferedPrinter(stream, max_delay=60)
+    printer("Hello", end="")
+    printer(",", "world", end="")
+    assert stream.getvalue() == ""
+
+    printer("!")
+    assert stream.getvalue() == "Hello, world!\n"
+    assert stream.flushes == 1
+
+
+@pytest.mark.asyncio
+async def test_buffered_printer_flushes_at_max_bytes():
+    from swe_workflow.non_interactive_handlers import BufferedPrinter
+
+    stream = _Stream(tty=True)
+    printer = BufferedPrinter(stream, max_bytes=8, max_delay=60)
+    printer("abcd", end="")
+    assert stream.getvalue() == ""
+    printer("efgh", end="")
+    assert stream.getvalue() == "abcdefgh"
+
+
+@pytest.mark.asyncio
+async def test_buffered_printer_flushes_tail_when_stream_stalls():
+    from swe_workflow.non_interactive_handlers import BufferedPrinter
+
+    stream = _Stream(tty=True)
+    printer = BufferedPrinter(stream, max_delay=0.01)
+    printer("thinking", end="")
+    assert stream.getvalue() == ""
+
+    # No further text arrives; the pending flush still writes the tail
+    await asyncio.sleep(0.05)
+    assert stream.getvalue() == "thinking"
+    assert stream.flushes == 1
+
+
+@pytest.mark.asyncio
+async def test_buffered_printer_flush_cancels_pending_timer():
+    from swe_workflow.non_interactive_handlers import BufferedPrinter
+
+    stream = _Stream(tty=True)
+    printer = BufferedPrinter(stream, max_delay=0.01)
+    printer("tail", end="")
+    printer.flush()
+    await asyncio.sleep(0.05)
+    assert stream.getvalue() == "tail"
+    assert stream.flushes == 1
+
+
+def test_buffered_printer_writes_partial_line_outside_event_loop():
+    from swe_workflow.non_interactive_handlers import BufferedPrinter
+
+    stream = _Stream(tty=True)
+    printer = BufferedPrinter(stream)
+    printer("prompt> ", end="")
+    assert stream.getvalue() == "prompt> "
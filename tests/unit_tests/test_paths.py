@@ -0,0 +1,18 @@
+"""Tests for shared per-user filesystem locations."""
+
+from pathlib import Path
+
+import pytest
+
+from swe_workflow._paths import user_cache_dir
+
+
+def test_user_cache_dir_honors_xdg_cache_home(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert user_cache_dir() == tmp_path / "swe-workflow"
+
+
+def test_user_cache_dir_falls_back_to_home(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", "")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert user_cache_dir() == tmp_path / ".cache" / "swe-workflow"
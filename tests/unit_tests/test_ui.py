@@ -0,0 +1,30 @@
+"""Tests for UI rendering helpers."""
+
+import io
+
+import pytest
+from rich.console import Console
+
+from swe_workflow import ui
+
+
+@pytest.fixture
+def help_lines(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Render the help screen wide enough that no row wraps."""
+    buf = io.StringIO()
+    monkeypatch.setattr(ui, "console", Console(file=buf, width=200, color_system=None))
+    ui.show_help()
+    return buf.getvalue().splitlines()
+
+
+def test_help_rows_are_not_padded(help_lines: list[str]) -> None:
+    """Verify help rows end at their last character instead of the console width."""
+    rows = [line for line in help_lines if line.startswith("  ")]
+    assert rows
+    assert all(line == line.rstrip() for line in rows)
+
+
+def test_help_long_example_does_not_widen_column(help_lines: list[str]) -> None:
+    """Verify one long example command overflows rather than setting the column width."""
+    assert "  swe-workflow -r              # Resume most recent session" in help_lines
+    assert '  swe-workflow --non-interactive --task "Do something"  # Run without UI' in help_lines